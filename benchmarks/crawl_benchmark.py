@@ -0,0 +1,187 @@
+"""
+End to end crawl throughput benchmark. Starts the stand-in recipe site in a separate process, drives AsyncScraper (id
+mode) or AsyncSraperSiteMap (sitemap mode) against it, and reports pages/sec, p50/p99 fetch latency, client CPU time
+per page and peak RSS as JSON. Run from the repository root:
+
+    (my-virtual-env) user$ python -m benchmarks.crawl_benchmark --fetch 2000 --scrapers 4 --latency 0.05
+"""
+import os
+import sys
+import argparse
+import asyncio
+import json
+import resource
+import socket
+import tempfile
+from contextlib import redirect_stdout
+from multiprocessing import Process
+from time import process_time, sleep
+from timeit import default_timer
+
+from recipe_scraper import async_scraper, settings
+from recipe_scraper.async_scraper import AsyncScraper, AsyncSraperSiteMap
+from recipe_scraper.recipe_parsers import JsonLdParser
+from recipe_scraper.tools import SiteMapDownloader
+from benchmarks.stand_in_site import add_site_arguments, site_from_arguments, serve
+
+SERVER_START_TIMEOUT = 10.0  # seconds
+
+
+class CrawlReport:
+    """Collects per request timings shared by all benchmark scrapers"""
+
+    def __init__(self, target, timeout):
+        self.target = target
+        self.timeout = timeout
+        self.latencies = []
+        self.pages = 0
+        self.bytes = 0
+        self.start = None
+
+    @property
+    def done(self):
+        return self.pages >= self.target or default_timer() - self.start > self.timeout
+
+    def record(self, seconds, body):
+        self.latencies.append(seconds)
+        if body:
+            self.pages += 1
+            self.bytes += len(body)
+
+    async def wait(self):
+        while not self.done:
+            await asyncio.sleep(0.05)
+
+    def summary(self, elapsed, cpu_seconds):
+        latencies = sorted(self.latencies)
+        return {
+            'pages': self.pages,
+            'requests': len(latencies),
+            'bytes': self.bytes,
+            'seconds': round(elapsed, 3),
+            'pages_per_sec': round(self.pages / elapsed, 2) if elapsed else None,
+            'latency_p50_ms': round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+            'latency_p99_ms': round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+            'cpu_ms_per_page': round(cpu_seconds / self.pages * 1000, 3) if self.pages else None,
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+        }
+
+
+def percentile(values, pct):
+    """Nearest rank percentile of an already sorted list"""
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+
+class TimedScraperMixin:
+    """Times every request of a scraper and stops rescheduling once the report is done"""
+
+    report = None
+
+    async def __anext__(self):
+        if self.report.done:
+            return
+        await super().__anext__()
+
+    async def make_request(self):
+        start = default_timer()
+        body = None
+        try:
+            body, url = await super().make_request()
+            return body, url
+        finally:
+            self.report.record(default_timer() - start, body)
+
+
+class BenchmarkScraper(TimedScraperMixin, AsyncScraper):
+    pass
+
+
+class BenchmarkSiteMapScraper(TimedScraperMixin, AsyncSraperSiteMap):
+    pass
+
+
+class StandInSiteMapDownloader(SiteMapDownloader):
+    subdirectory_output = 'stand_in'
+    ignore_recipe_pattern = ['sitemap']
+    parser = JsonLdParser.get_parser()
+
+
+def wait_for_server(host, port):
+    deadline = default_timer() + SERVER_START_TIMEOUT
+    while default_timer() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return
+        except OSError:
+            sleep(0.05)
+    raise RuntimeError("Stand-in site did not start on {0}:{1}".format(host, port))
+
+
+def build_id_scrapers(loop, base_url, scrapers, pages):
+    stride = max(1, pages // scrapers)
+    return [BenchmarkScraper(base_path=[base_url], loop=loop, start_id=1 + i * stride,
+                             url_id_format=base_url + '/recipe/{0}')
+            for i in range(scrapers)]
+
+
+def build_sitemap_scrapers(loop, base_url, output_directory):
+    StandInSiteMapDownloader.robots_url = base_url + '/robots.txt'
+    StandInSiteMapDownloader.recipe_url_pattern = [base_url]
+    StandInSiteMapDownloader.set_output_directory(output_directory)
+    downloader = StandInSiteMapDownloader()
+    loop.run_until_complete(downloader.get_sitemaps())
+    scraper = BenchmarkSiteMapScraper(loop=loop)
+    scraper.set_sitemap_link_loader(downloader)
+    scraper.reset_url_queue()
+    return [scraper]
+
+
+def run_benchmark(args):
+    host, base_url = args.host, 'http://{0}:{1}'.format(args.host, args.port)
+    server = Process(target=serve, args=(site_from_arguments(args), host, args.port), daemon=True)
+    server.start()
+    output_directory = tempfile.mkdtemp(prefix='crawl_benchmark_output_')
+    settings.configure(data_path=output_directory)
+    try:
+        wait_for_server(host, args.port)
+        async_scraper.DOMAIN_REQUEST_DELAY = args.delay
+        loop = asyncio.get_event_loop()
+        if args.mode == 'sitemap':
+            scrapers = build_sitemap_scrapers(loop, base_url, output_directory)
+        else:
+            scrapers = build_id_scrapers(loop, base_url, args.scrapers, args.pages)
+        report = CrawlReport(target=args.fetch, timeout=args.timeout)
+        TimedScraperMixin.report = report
+        for scraper in scrapers:
+            scraper.data_file_manager.data_folder = output_directory
+        start, cpu_start = default_timer(), process_time()
+        report.start = start
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            for scraper in scrapers:
+                asyncio.ensure_future(scraper.__anext__(), loop=loop)
+            loop.run_until_complete(report.wait())
+        summary = report.summary(default_timer() - start, process_time() - cpu_start)
+        summary.update({'mode': args.mode, 'scrapers': len(scrapers), 'delay': args.delay})
+        return summary
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Crawl throughput benchmark against a stand-in site")
+    argument_parser.add_argument('--mode', choices=['id', 'sitemap'], default='id')
+    argument_parser.add_argument('--host', default='127.0.0.1')
+    argument_parser.add_argument('--port', type=int, default=8089)
+    argument_parser.add_argument('--scrapers', type=int, default=4, help="Concurrent id scrapers (id mode)")
+    argument_parser.add_argument('--fetch', type=int, default=1000, help="Stop after this many pages")
+    argument_parser.add_argument('--delay', type=float, default=0.0, help="DOMAIN_REQUEST_DELAY override")
+    argument_parser.add_argument('--timeout', type=float, default=300.0, help="Stop after this many seconds")
+    argument_parser.add_argument('--output', help="Also write the JSON report to this file")
+    add_site_arguments(argument_parser)
+    arguments = argument_parser.parse_args()
+    result = run_benchmark(arguments)
+    print(json.dumps(result, indent=4))
+    if arguments.output:
+        with open(arguments.output, 'w') as f:
+            json.dump(result, f, indent=4)
+    sys.exit(0)
@@ -0,0 +1,210 @@
+"""
+Parser micro-benchmark over real saved pages: a PageArchive directory kept by `main.py --archive-pages`, a directory of
+saved pages or a tar bundle, the same sources `main.py --reparse` reads. No pages are checked in; synthetic pages would
+only measure their own markup. Pages are assigned to sites and parsers like a re-parse does, through a parser mapping
+that defaults to the sitemap downloaders' parsers.
+
+Times soup construction and every parser phase (each `_find_*` extractor, JSON-LD decoding and the text cleaning
+helpers) through the real `parse` call path per page, and writes a machine readable JSON report per site. Phase times
+are inclusive, so the cleaning time is also contained in the extractors that call it. Compare reports made from the
+same pages on the same machine. Run from the repository root:
+
+    (my-virtual-env) user$ python -m benchmarks.parser_benchmark archive/ --repeat 20 --output parsers.json
+    (my-virtual-env) user$ python -m benchmarks.parser_benchmark archive/ --compare parsers.json
+"""
+import os
+import sys
+import argparse
+import json
+import platform
+from collections import defaultdict
+from timeit import default_timer
+
+import bs4
+from bs4 import BeautifulSoup
+from recipe_scraper import recipe_parsers
+from recipe_scraper.recipe_parsers import HRecipeParser, JsonLdParser
+from recipe_scraper.tools import get_sitemap_downloaders
+from recipe_scraper.tools.reparse import BulkReparser, PARSERS, parser_map_from_downloaders
+
+MAX_PAGES_PER_SITE = 50  # saved pages of a site that are benchmarked
+# (class or module, attribute) pairs timed as phases, attributes missing from the class are skipped
+PHASES = [
+    (HRecipeParser, '_find_title'),
+    (HRecipeParser, '_find_ingredients'),
+    (HRecipeParser, '_find_instructions'),
+    (HRecipeParser, '_find_preparation_time'),
+    (HRecipeParser, '_find_cook_time'),
+    (HRecipeParser, '_find_yield'),
+    (HRecipeParser, '_find_reviews'),
+    (HRecipeParser, '_find_foodnetwork_ratings'),
+    (recipe_parsers, 'clean_text'),
+    (recipe_parsers, 'clean_texts'),
+    (JsonLdParser, '_find_script_tags'),
+    (JsonLdParser, '_decode_input'),
+    (JsonLdParser, '_get_recipe_data'),
+]
+
+
+class PhaseTimer:
+    """
+    Context manager that wraps parser methods with timers while active, accumulating the time of every call per phase.
+    Static methods are re-wrapped as static methods so the parsers' call sites are unchanged.
+    """
+
+    def __init__(self, phases=PHASES):
+        self.phases = [(cls, name) for cls, name in phases if name in cls.__dict__]
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._originals = []
+
+    def __enter__(self):
+        for cls, name in self.phases:
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            is_static = isinstance(original, staticmethod)
+            setattr(cls, name, self._wrap(
+                '{0}.{1}'.format(cls.__name__, name), original.__func__ if is_static else original, is_static))
+        return self
+
+    def __exit__(self, *exc_info):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals = []
+
+    def reset(self):
+        self.seconds.clear()
+        self.calls.clear()
+
+    def _wrap(self, phase, func, is_static):
+        seconds, calls = self.seconds, self.calls
+
+        def timed(*args, **kwargs):
+            start = default_timer()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds[phase] += default_timer() - start
+                calls[phase] += 1
+        return staticmethod(timed) if is_static else timed
+
+
+def load_pages(source, parser_map, sites=None, max_pages=MAX_PAGES_PER_SITE):
+    """
+    :param source: PageArchive directory, directory of saved pages or tar bundle
+    :param parser_map: dict of site -> parser name, as for --reparse
+    :param sites: only load pages of these sites
+    :param max_pages: pages loaded per site
+    :return: dict of site -> (parser name, list of page bodies)
+    """
+    reparser = BulkReparser(parser_map, processes=1, verbose=False)
+    pages = {}
+    for name, body in reparser.iter_pages(source):
+        site = reparser.site_for(name)
+        if not site or (sites and site not in sites):
+            continue
+        bodies = pages.setdefault(site, (parser_map[site], []))[1]
+        if len(bodies) < max_pages:
+            bodies.append(body)
+    return pages
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        'mean_ms': round(sum(samples) / len(samples) * 1000, 4),
+        'min_ms': round(samples[0] * 1000, 4),
+        'median_ms': round(samples[len(samples) // 2] * 1000, 4),
+    }
+
+
+def benchmark_site(parser_name, bodies, repeat):
+    """Times every page of a site `repeat` times, the statistics are per page"""
+    parser = PARSERS[parser_name].get_parser()
+    soup_samples, parse_samples = [], []
+    phase_samples, phase_calls = defaultdict(list), defaultdict(int)
+    with PhaseTimer() as timer:
+        for _ in range(repeat):
+            for body in bodies:
+                start = default_timer()
+                soup = BeautifulSoup(body, 'lxml')
+                soup_samples.append(default_timer() - start)
+                timer.reset()
+                start = default_timer()
+                parser(soup)
+                parse_samples.append(default_timer() - start)
+                for phase, seconds in timer.seconds.items():
+                    phase_samples[phase].append(seconds)
+                    phase_calls[phase] += timer.calls[phase]
+    return {
+        'parser': parser_name,
+        'pages': len(bodies),
+        'mean_bytes': sum(len(body) for body in bodies) // len(bodies),
+        'soup': summarize(soup_samples),
+        'parse': summarize(parse_samples),
+        # phases only time the pages that reach them, calls are per page
+        'phases': {phase: dict(summarize(samples), calls=round(phase_calls[phase] / len(parse_samples), 2))
+                   for phase, samples in sorted(phase_samples.items())},
+    }
+
+
+def run(source, repeat, parser_map, sites=None, max_pages=MAX_PAGES_PER_SITE):
+    results = {site: benchmark_site(parser_name, bodies, repeat)
+               for site, (parser_name, bodies) in sorted(load_pages(source, parser_map, sites, max_pages).items())}
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'bs4': bs4.__version__,
+            'source': os.path.abspath(source),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current):
+    """Prints the change in mean time of every measurement relative to a baseline report"""
+    for site, result in sorted(current['results'].items()):
+        base = baseline['results'].get(site)
+        if not base:
+            continue
+        rows = [('soup', base['soup'], result['soup']), ('parse', base['parse'], result['parse'])]
+        rows.extend((phase, base['phases'][phase], stats)
+                    for phase, stats in sorted(result['phases'].items()) if phase in base['phases'])
+        print(site)
+        for name, before, after in rows:
+            change = (after['mean_ms'] - before['mean_ms']) / before['mean_ms'] * 100 if before['mean_ms'] else 0.0
+            print('\t{0:<45} {1:>10.3f}ms -> {2:>10.3f}ms  {3:+.1f}%'.format(
+                name, before['mean_ms'], after['mean_ms'], change))
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Per phase parser benchmark over saved pages")
+    argument_parser.add_argument('source', help="PageArchive directory, directory of saved pages or tar bundle")
+    argument_parser.add_argument('--repeat', type=int, default=10, help="Runs per page")
+    argument_parser.add_argument('--max-pages', type=int, default=MAX_PAGES_PER_SITE,
+                                 help="Pages benchmarked per site (default: {0})".format(MAX_PAGES_PER_SITE))
+    argument_parser.add_argument('--parser-map', metavar='JSON_FILE',
+                                 help="JSON object of site -> parser ('hrecipe' or 'jsonld'), defaults to the sitemap "
+                                      "downloader parsers")
+    argument_parser.add_argument('--site', action='append', help="Only benchmark this site (repeatable)")
+    argument_parser.add_argument('--output', help="Write the JSON report to this file instead of stdout")
+    argument_parser.add_argument('--compare', metavar='BASELINE', help="Compare against a previous JSON report")
+    arguments = argument_parser.parse_args()
+    if arguments.parser_map:
+        with open(arguments.parser_map, 'r') as f:
+            site_parsers = json.load(f)
+    else:
+        site_parsers = parser_map_from_downloaders(get_sitemap_downloaders())
+    report = run(arguments.source, arguments.repeat, site_parsers, sites=arguments.site, max_pages=arguments.max_pages)
+    if not report['results']:
+        argument_parser.error("no pages of a mapped site found in {0}".format(arguments.source))
+    if arguments.compare:
+        with open(arguments.compare, 'r') as f:
+            compare(json.load(f), report)
+    if arguments.output:
+        with open(arguments.output, 'w') as f:
+            json.dump(report, f, indent=4, sort_keys=True)
+    elif not arguments.compare:
+        print(json.dumps(report, indent=4, sort_keys=True))
+    sys.exit(0)
@@ -0,0 +1,186 @@
+"""
+Local stand-in recipe site used to benchmark the crawler without touching real sites. Serves synthetic hRecipe pages
+at /recipe/{id}, JSON-LD pages at /jsonld/{id}, a robots.txt and a sitemap index of plain urlset sitemaps. Latency,
+body size, 404 gaps in the id space and bursts of 429 responses are configurable.
+
+    (my-virtual-env) user$ python -m benchmarks.stand_in_site --port 8080 --latency 0.05 --gap-every 20
+"""
+import argparse
+import json
+import random
+from asyncio import sleep as aio_sleep
+from aiohttp import web
+
+HRECIPE_TEMPLATE = """<html><head><title>{title}</title></head><body>
+<div class="hrecipe" itemscope itemtype="http://schema.org/Recipe">
+<h1 itemprop="name">{title}</h1>
+<span itemprop="recipeYield">{servings} servings</span>
+<time itemprop="prepTime" datetime="PT{prep}M">{prep} mins</time>
+<time itemprop="cookTime" datetime="PT{cook}M">{cook} mins</time>
+<ul>{ingredients}</ul>
+<ol>{instructions}</ol>
+<div itemprop="aggregateRating">
+<span itemprop="ratingValue">{rating}</span><span itemprop="ratingCount">{count}</span>
+<meta itemprop="bestRating" content="5"><meta itemprop="worstRating" content="1">
+</div>
+{reviews}
+</div></body></html>"""
+JSONLD_TEMPLATE = """<html><head><title>{title}</title>
+<script type="application/ld+json">{data}</script></head>
+<body><h1>{title}</h1>{reviews}</body></html>"""
+INGREDIENTS = ['flour', 'sugar', 'butter', 'eggs', 'milk', 'salt', 'baking powder', 'vanilla', 'olive oil',
+               'garlic', 'onion', 'tomatoes', 'basil', 'parmesan', 'chicken breast', 'brown sugar', 'lemon juice']
+UNITS = ['cups', 'tablespoons', 'teaspoons', 'ounces', 'pounds', '']
+REVIEW_TEXT = 'Made this for dinner and     the whole family loved it, will make again with less salt. '
+
+
+class StandInSite:
+    """Holds the configuration and request counters for the synthetic site"""
+
+    def __init__(self, pages=10000, latency=0.0, jitter=0.0, body_size=0, gap_every=0, gap_length=0,
+                 burst_every=0, burst_length=0, sitemap_size=1000):
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.body_size = body_size
+        self.gap_every = gap_every
+        self.gap_length = gap_length
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.sitemap_size = sitemap_size
+        self.requests = 0
+
+    def application(self):
+        app = web.Application()
+        app.router.add_get('/robots.txt', self.robots)
+        app.router.add_get('/sitemap.xml', self.sitemap_index)
+        app.router.add_get('/sitemap_{number}.xml', self.sitemap)
+        app.router.add_get('/recipe/{id}', self.hrecipe)
+        app.router.add_get('/jsonld/{id}', self.jsonld)
+        return app
+
+    def is_gap(self, recipe_id):
+        return bool(self.gap_every) and recipe_id % self.gap_every < self.gap_length or recipe_id > self.pages
+
+    def is_burst(self):
+        return bool(self.burst_every) and self.requests % self.burst_every < self.burst_length
+
+    async def robots(self, request):
+        host = 'http://{0}'.format(request.host)
+        return web.Response(text="User-agent: *\nDisallow: /admin/\nSitemap: {0}/sitemap.xml\n".format(host),
+                            content_type='text/plain')
+
+    async def sitemap_index(self, request):
+        host = 'http://{0}'.format(request.host)
+        entries = ''.join('<sitemap><loc>{0}/sitemap_{1}.xml</loc></sitemap>'.format(host, i)
+                          for i in range(1, self.pages // self.sitemap_size + 2))
+        return web.Response(
+            text='<?xml version="1.0"?><sitemapindex>{0}</sitemapindex>'.format(entries),
+            content_type='application/xml')
+
+    async def sitemap(self, request):
+        host = 'http://{0}'.format(request.host)
+        number = int(request.match_info['number'])
+        first = (number - 1) * self.sitemap_size + 1
+        entries = ''.join('<url><loc>{0}/{1}/{2}</loc></url>'.format(host, 'recipe' if i % 2 else 'jsonld', i)
+                          for i in range(first, min(first + self.sitemap_size, self.pages + 1)))
+        return web.Response(text='<?xml version="1.0"?><urlset>{0}</urlset>'.format(entries),
+                            content_type='application/xml')
+
+    async def hrecipe(self, request):
+        return await self._respond(request, self.render_hrecipe)
+
+    async def jsonld(self, request):
+        return await self._respond(request, self.render_jsonld)
+
+    async def _respond(self, request, render):
+        self.requests += 1
+        if self.latency or self.jitter:
+            await aio_sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+        if self.is_burst():
+            return web.Response(status=429, text='Too Many Requests')
+        try:
+            recipe_id = int(request.match_info['id'])
+        except ValueError:
+            return web.Response(status=404, text='Not Found')
+        if self.is_gap(recipe_id):
+            return web.Response(status=404, text='Not Found')
+        return web.Response(text=render(recipe_id), content_type='text/html')
+
+    @staticmethod
+    def _recipe(recipe_id):
+        rand = random.Random(recipe_id)
+        return {
+            'title': 'Stand-in recipe {0}'.format(recipe_id),
+            'ingredients': ['{0} {1} {2}'.format(rand.randint(1, 4), rand.choice(UNITS), rand.choice(INGREDIENTS))
+                            for _ in range(rand.randint(4, 14))],
+            'instructions': ['Step {0}: combine and cook for {1} minutes.'.format(i, rand.randint(2, 30))
+                             for i in range(1, rand.randint(3, 9))],
+            'prep': rand.randint(5, 45),
+            'cook': rand.randint(5, 90),
+            'servings': rand.randint(1, 8),
+            'rating': round(rand.uniform(1, 5), 1),
+            'count': rand.randint(0, 5000),
+        }
+
+    def _reviews(self, page_size):
+        """Pads the page with review bodies up to the configured body size"""
+        if page_size >= self.body_size:
+            return ''
+        review = '<p itemprop="reviewBody">{0}</p>'.format(REVIEW_TEXT)
+        return review * ((self.body_size - page_size) // len(review) + 1)
+
+    def render_hrecipe(self, recipe_id):
+        recipe = self._recipe(recipe_id)
+        page = HRECIPE_TEMPLATE.format(
+            ingredients=''.join('<li itemprop="ingredients">{0}</li>'.format(i) for i in recipe['ingredients']),
+            instructions=''.join('<li itemprop="recipeInstructions">{0}</li>'.format(i)
+                                 for i in recipe['instructions']),
+            reviews='{reviews}', **{k: v for k, v in recipe.items() if k not in ('ingredients', 'instructions')})
+        return page.replace('{reviews}', self._reviews(len(page)))
+
+    def render_jsonld(self, recipe_id):
+        recipe = self._recipe(recipe_id)
+        data = json.dumps({
+            '@context': 'http://schema.org',
+            '@type': 'Recipe',
+            'name': recipe['title'],
+            'recipeIngredient': recipe['ingredients'],
+            'recipeInstructions': recipe['instructions'],
+            'prepTime': 'PT{0}M'.format(recipe['prep']),
+            'cookTime': 'PT{0}M'.format(recipe['cook']),
+            'recipeYield': '{0} servings'.format(recipe['servings']),
+            'aggregateRating': {'rating': recipe['rating'], 'reviewCount': recipe['count']},
+        })
+        page = JSONLD_TEMPLATE.format(title=recipe['title'], data=data, reviews='{reviews}')
+        return page.replace('{reviews}', self._reviews(len(page)))
+
+
+def add_site_arguments(parser):
+    parser.add_argument('--pages', type=int, default=10000, help="Number of recipe ids served")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every page response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Random +/- seconds added to the latency")
+    parser.add_argument('--body-size', type=int, default=0, help="Minimum page size in bytes, padded with reviews")
+    parser.add_argument('--gap-every', type=int, default=0, help="Introduce a 404 gap every N ids")
+    parser.add_argument('--gap-length', type=int, default=0, help="Number of 404 ids in each gap")
+    parser.add_argument('--burst-every', type=int, default=0, help="Start a burst of 429s every N requests")
+    parser.add_argument('--burst-length', type=int, default=0, help="Number of 429 responses in each burst")
+
+
+def site_from_arguments(args):
+    return StandInSite(pages=args.pages, latency=args.latency, jitter=args.jitter, body_size=args.body_size,
+                       gap_every=args.gap_every, gap_length=args.gap_length, burst_every=args.burst_every,
+                       burst_length=args.burst_length)
+
+
+def serve(site, host='127.0.0.1', port=8080):
+    web.run_app(site.application(), host=host, port=port, print=lambda *args: None)
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Local stand-in recipe site")
+    argument_parser.add_argument('--host', default='127.0.0.1')
+    argument_parser.add_argument('--port', type=int, default=8080)
+    add_site_arguments(argument_parser)
+    arguments = argument_parser.parse_args()
+    serve(site_from_arguments(arguments), host=arguments.host, port=arguments.port)
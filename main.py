@@ -1,10 +1,31 @@
 import asyncio
+import os
 import sys
 from recipe_scraper.recipe_parsers import HRecipeParser, JsonLdParser
 from recipe_scraper.async_scraper import AsyncScraper, AsyncSraperSiteMap
 from recipe_scraper.tools.log_inspector import LogInspector
 from recipe_scraper.tools.data_loader import DataLoader
-from recipe_scraper.tools import SITEMAP_DOWNLOADERS, SiteMapDownloader
+from recipe_scraper.tools import get_sitemap_downloaders, SiteMapDownloader
+from recipe_scraper.tools.columnar_export import ColumnarExporter
+from recipe_scraper.tools.near_duplicates import NearDuplicateFinder
+from recipe_scraper.tools.ingredient_index import IngredientIndex
+from recipe_scraper.tools.cooccurrence import CooccurrenceMatrix
+from recipe_scraper.recipe_store import SQLiteRecipeStore
+from recipe_scraper.page_archive import PageArchive
+from recipe_scraper.metrics import METRICS
+from recipe_scraper.loop_monitor import LoopMonitor, install_profile_signal
+from recipe_scraper.log_pipeline import QueuedLogging, FETCH_LOG
+from recipe_scraper import init, settings
+from recipe_scraper.tools.reparse import BulkReparser, parser_map_from_downloaders
+from recipe_scraper.frontier import SQLiteFrontier
+from recipe_scraper.checkpoint import CrawlCheckpoint
+from recipe_scraper.retry import RetryScheduler, RetryPolicy, MAX_ATTEMPTS
+from recipe_scraper.launcher import ShardedLauncher, assign_shards, segment_name
+from recipe_scraper.robots import ROBOTS
+from recipe_scraper.urls import RedirectMap
+from recipe_scraper.content_index import ContentHashIndex
+from recipe_scraper.ingredients import IngredientNormalizer
+import json
 import argparse
 
 # default start_ids are the minimum id that returns a valid result
@@ -45,13 +66,21 @@ SCRAPER_CONFIGS = {
     # }
 }
 
+# relative crawl effort per site, used to balance the sites over --workers processes (sites not listed weigh 1)
+SITE_WEIGHTS = {
+    'allrecipes': 3,
+    'foodnetwork': 3,
+    'food': 2,
+    'epicurious': 2,
+}
+
 
-def init_scrapers(loop):
+def init_scrapers(loop, sites=None):
     """ To start scrapers for the ID method"""
     scrapers = {}
-    del SCRAPER_CONFIGS['food']
     for site, config in SCRAPER_CONFIGS.items():
-        scrapers[site] = AsyncScraper(loop=loop, **config)
+        if sites is None or site in sites:
+            scrapers[site] = AsyncScraper(loop=loop, site=site, **config)
     return scrapers
 
 
@@ -60,8 +89,12 @@ def modify_scrapers(scrapers):
     for text in DataLoader.iter_log_text():
         max_ids = LogInspector.find_largest_ids(text)
         for site in max_ids:
-            if max_ids[site] and max_ids[site] > getattr(scrapers[site], 'current_id'):
+            if site in scrapers and max_ids[site] and max_ids[site] > getattr(scrapers[site], 'current_id'):
                 setattr(scrapers[site], 'current_id', max_ids[site])
+    max_ids = LogInspector.find_largest_ids_from_fetch_log(FETCH_LOG.iter_records())
+    for site in max_ids:
+        if site in scrapers and max_ids[site] > getattr(scrapers[site], 'current_id'):
+            setattr(scrapers[site], 'current_id', max_ids[site])
     for site in scrapers:
         scrapers[site].reset_url_queue()
 
@@ -86,16 +119,22 @@ def modify_scrapers(scrapers):
 #     return
 
 
-def generate_scrapers_from_sitemaps_loaders(loop=None, reverse=False):
+def generate_scrapers_from_sitemaps_loaders(loop=None, reverse=False, sites=None, checkpoint=None):
     scrapers = {}
-    for sitemap in SITEMAP_DOWNLOADERS:
+    for sitemap in get_sitemap_downloaders():
+        if sites is not None and sitemap.subdirectory_output not in sites:
+            continue
         sitemap.reverse = reverse
         scrapers[sitemap.subdirectory_output] = AsyncSraperSiteMap(loop=loop)
         scrapers[sitemap.subdirectory_output].set_sitemap_link_loader(sitemap)
-    asyncio.ensure_future(scrapers[sitemap.subdirectory_output].load_sites_visited_from_log_file())
+        state = checkpoint.state_for(sitemap.subdirectory_output) if checkpoint else None
+        if state:
+            scrapers[sitemap.subdirectory_output].restore_checkpoint(state)
+        else:
+            asyncio.ensure_future(scrapers[sitemap.subdirectory_output].load_sites_visited_from_log_file(), loop=loop)
     while True:
         print("Retrieving links from log file to build visited set and building link generators")
-        tasks = asyncio.Task.all_tasks(main_event_loop)
+        tasks = asyncio.Task.all_tasks(loop)
         loop.run_until_complete(asyncio.gather(*tasks))
         if sum([task.done() for task in tasks]) >= len(tasks):
             break
@@ -106,32 +145,177 @@ def generate_scrapers_from_sitemaps_loaders(loop=None, reverse=False):
     return scrapers
 
 
-def main(loop, modify_scraper_start_id_flag=False, use_sitemaps_flag=False, reverse_flag=False, verbose=True):
+def replay_dead_letters(scrapers, dead_letters):
+    """
+    Queues the dead-lettered urls of the given scrapers' sites again, keeping the entries of other sites
+    :param scrapers: dict of site -> scraper
+    :param dead_letters: DeadLetterFile
+    """
+    replay = {}
+    for entry in dead_letters.drain():
+        if entry['site'] in scrapers:
+            replay.setdefault(entry['site'], []).append(entry['url'])
+        else:
+            dead_letters.add(entry['site'], entry['url'], entry['attempts'], entry['error'])
+    for site, urls in replay.items():
+        if AsyncScraper.frontier:
+            AsyncScraper.frontier.requeue(site, urls)
+        else:
+            for url in urls:
+                scrapers[site].url_queue.put(url)
+        print("\tReplaying {0} dead-lettered urls for {1}".format(len(urls), site))
+
+
+def main(loop, modify_scraper_start_id_flag=False, use_sitemaps_flag=False, reverse_flag=False, verbose=True,
+         sites=None, checkpoint=None, replay_dead_letters_flag=False):
     """
     Wrapper method to launch co-routines that recursively call the next url to scrape.
     :param loop: the event loop
     :param modify_scraper_start_id_flag: whether to modify start_id from collected values in the log
     :param use_sitemaps_flag: boolean whether to use the sitemaps to genearte urls
     :param: verbose: outputs information to the command line
+    :param sites: only start the scrapers of these sites (all sites if None)
+    :param checkpoint: CrawlCheckpoint to resume scrapers from and save them to
+    :param replay_dead_letters_flag: queue the urls of the dead-letter file again
     :return:
     """
     if modify_scraper_start_id_flag:
-        scrapers = init_scrapers(loop)
+        scrapers = init_scrapers(loop, sites=sites)
         print("Using ID url parsing")
-        modify_scrapers(scrapers)
+        restored = {site for site in scrapers if checkpoint and checkpoint.state_for(site)}
+        for site in restored:
+            scrapers[site].restore_checkpoint(checkpoint.state_for(site))
+        if len(restored) < len(scrapers):
+            modify_scrapers({site: scraper for site, scraper in scrapers.items() if site not in restored})
         if verbose:
             print("\tMaximum IDs: ")
             for key, value in scrapers.items():
                 print("\t\t{0}: {1}".format(key, getattr(value, "current_id")))
     elif use_sitemaps_flag:
         print("Using sitemap for url generation")
-        scrapers = generate_scrapers_from_sitemaps_loaders(loop, reverse=reverse_flag)
+        scrapers = generate_scrapers_from_sitemaps_loaders(loop, reverse=reverse_flag, sites=sites,
+                                                           checkpoint=checkpoint)
+    if replay_dead_letters_flag and AsyncScraper.retry_scheduler:
+        replay_dead_letters(scrapers, AsyncScraper.retry_scheduler.dead_letters)
+    if checkpoint:
+        checkpoint.start(loop, scrapers)
     print("Beginning scraping")
     for i, key_pair in enumerate(scrapers.items()):
         asyncio.ensure_future(key_pair[1].__anext__(), loop=loop)
     return
 
 
+def crawl_sites(loop, args, sites=None, checkpoint=None):
+    """
+    Schedules the sitemap downloads or scrapers selected by the command line arguments and runs the loop until they
+    are all finished.
+    :param loop: the event loop
+    :param args: parsed command line arguments
+    :param sites: only crawl these sites (all sites if None)
+    :param checkpoint: CrawlCheckpoint to resume the scrapers from and save them to
+    """
+    if args.download_sitemaps:
+        for sitemap_downloader in get_sitemap_downloaders():
+            if sites is None or sitemap_downloader.subdirectory_output in sites:
+                asyncio.ensure_future(sitemap_downloader.get_sitemaps(), loop=loop)
+    else:
+        main(
+            loop,
+            modify_scraper_start_id_flag=args.calc_start_id,
+            use_sitemaps_flag=args.use_sitemaps,
+            reverse_flag=args.reverse,
+            verbose=True,
+            sites=sites,
+            checkpoint=checkpoint,
+            replay_dead_letters_flag=args.replay_dead_letters
+        )
+    if args.monitor_loop is not None:
+        LoopMonitor(loop, threshold=args.monitor_loop).start()
+    while True:
+        pending_tasks = asyncio.Task.all_tasks(loop)
+        if sum([task.done() for task in pending_tasks]) >= len(pending_tasks):
+            break
+        loop.run_until_complete(asyncio.gather(*pending_tasks))
+
+
+def set_retry_scheduler(args):
+    if args.max_attempts > 1:
+        AsyncScraper.set_retry_scheduler(RetryScheduler(policy=RetryPolicy(max_attempts=args.max_attempts)))
+
+
+def close_outputs(metrics_textfile=None, checkpoint=None):
+    if checkpoint:
+        checkpoint.close()
+    if AsyncScraper.frontier:
+        AsyncScraper.frontier.close()
+    if AsyncScraper.redirect_map:
+        AsyncScraper.redirect_map.close()
+    if AsyncScraper.content_index:
+        AsyncScraper.content_index.close()
+    if AsyncScraper.ingredient_normalizer:
+        AsyncScraper.ingredient_normalizer.close()
+    if AsyncScraper.recipe_store:
+        AsyncScraper.recipe_store.close()
+    if AsyncScraper.page_archive:
+        AsyncScraper.page_archive.close()
+    if metrics_textfile:
+        METRICS.write_textfile(metrics_textfile)
+    FETCH_LOG.close()
+
+
+def worker_metrics_textfile(path):
+    """file.prom -> file.w03.prom, one textfile per worker for the node exporter textfile collector"""
+    root, extension = os.path.splitext(path)
+    return '{0}.{1}{2}'.format(root, settings.data_segment, extension)
+
+
+def crawl_worker(sites, args):
+    """Entry point of a --workers process: crawls its shard of the sites on its own event loop"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    index = int(settings.data_segment[1:])
+    metrics_textfile = worker_metrics_textfile(args.metrics_textfile) if args.metrics_textfile else None
+    if args.metrics_port:
+        METRICS.start_http_server(args.metrics_port + 1 + index)
+    if metrics_textfile:
+        METRICS.start_textfile_writer(metrics_textfile)
+    if args.profile_signal:
+        install_profile_signal(settings.log_path)
+    if args.sqlite_store:
+        AsyncScraper.set_recipe_store(SQLiteRecipeStore(args.sqlite_store, bulk_load=False))
+    if args.archive_pages:
+        AsyncScraper.set_page_archive(PageArchive(os.path.join(args.archive_pages, settings.data_segment)))
+    set_retry_scheduler(args)
+    if not args.ignore_robots:
+        AsyncScraper.set_robots(ROBOTS)
+    AsyncScraper.set_redirect_map(RedirectMap().load())
+    if not args.keep_duplicates:
+        AsyncScraper.set_content_index(ContentHashIndex())
+    if args.parse_ingredients:
+        AsyncScraper.set_ingredient_normalizer(IngredientNormalizer())
+    if args.frontier:
+        owner = '{0}/{1}'.format(args.node_id, settings.data_segment) if args.node_id else None
+        AsyncScraper.set_frontier(SQLiteFrontier(args.frontier), owner=owner)
+    checkpoint = CrawlCheckpoint(os.path.join(args.checkpoint, settings.data_segment)) if args.checkpoint else None
+    queued_logging = QueuedLogging().start() if not args.sync_logging else None
+    crawl_sites(loop, args, sites=sites, checkpoint=checkpoint)
+    close_outputs(metrics_textfile, checkpoint)
+    if queued_logging:
+        queued_logging.stop()
+
+
+def launch_workers(args):
+    """Splits the sites of the selected mode over --workers processes and supervises them until they finish"""
+    if args.download_sitemaps or args.use_sitemaps:
+        site_names = [downloader.subdirectory_output for downloader in get_sitemap_downloaders()]
+    else:
+        site_names = list(SCRAPER_CONFIGS)
+    shards = assign_shards({site: SITE_WEIGHTS.get(site, 1) for site in site_names}, args.workers)
+    for index, shard in enumerate(shards):
+        print("\t{0}: {1}".format(segment_name(index), ', '.join(shard)))
+    return ShardedLauncher(crawl_worker, shards, args=(args,)).run()
+
+
 if __name__ == '__main__':
     # Parse command line args
     parser = argparse.ArgumentParser(description="Main Scraper Launcher")
@@ -142,30 +326,137 @@ if __name__ == '__main__':
                         help="Use sitemaps directory to generate ids for scraping")
     parser.add_argument('--reverse', action="store_true",
                         help="Iterate backwards over sitemaps")
+    parser.add_argument('--export-columnar', metavar='OUTPUT_FILE',
+                        help="Export the scraped corpus to a Parquet (.parquet) or Arrow (.arrow) file and exit")
+    parser.add_argument('--near-duplicates', metavar='OUTPUT_FILE',
+                        help="Write clusters of near-duplicate recipes in the scraped corpus as JSON lines and exit")
+    parser.add_argument('--cooccurrence', metavar='OUTPUT_FILE',
+                        help="Write the lift and PMI of ingredient pairs in the scraped corpus as JSON lines and exit")
+    parser.add_argument('--normalize-ingredients', metavar='OUTPUT_FILE',
+                        help="Write the ingredients of every scraped recipe split into quantity, unit, name and "
+                             "preparation as JSON lines and exit")
+    parser.add_argument('--ingredient-index', metavar='DIRECTORY',
+                        help="Add the recipes scraped since the last update to the ingredient index in DIRECTORY and "
+                             "exit, or search it with --ingredient-query")
+    parser.add_argument('--ingredient-query', metavar='QUERY',
+                        help="Comma separated ingredients to search the --ingredient-index for, 'a|b' for either and "
+                             "'-a' to exclude, e.g. 'chicken, garlic|shallot, -cream'")
+    parser.add_argument('--sqlite-store', metavar='DB_FILE',
+                        help="Also upsert scraped recipes into a SQLite database keyed on canonical url")
+    parser.add_argument('--archive-pages', metavar='DIRECTORY',
+                        help="Keep compressed, deduplicated raw responses of fetched pages in a directory")
+    parser.add_argument('--reparse', metavar='SOURCE',
+                        help="Re-parse saved pages from a directory, tar bundle or page archive and exit")
+    parser.add_argument('--parser-map', metavar='JSON_FILE',
+                        help="JSON object of site -> parser ('hrecipe' or 'jsonld') used with --reparse, "
+                             "defaults to the sitemap downloader parsers")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="Number of worker processes for --reparse (default: one per core)")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Serve per site Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument('--metrics-textfile', metavar='PROM_FILE',
+                        help="Periodically write per site Prometheus metrics to this textfile")
+    parser.add_argument('--monitor-loop', type=float, nargs='?', const=0.25, default=None, metavar='THRESHOLD',
+                        help="Measure event loop lag and log stalls longer than THRESHOLD seconds (default 0.25)")
+    parser.add_argument('--profile-signal', action="store_true",
+                        help="Write a sampling CPU profile of the event loop to the log directory on SIGUSR2")
+    parser.add_argument('--sync-logging', action="store_true",
+                        help="Write log records from the event loop instead of a background thread")
+    parser.add_argument('--frontier', metavar='DB_FILE',
+                        help="Lease urls from a SQLite work queue shared with other crawl nodes (e.g. on a shared "
+                             "path) instead of an in-process queue")
+    parser.add_argument('--node-id', default=None,
+                        help="Lease owner name of this node for --frontier (default: host:pid)")
+    parser.add_argument('--checkpoint', metavar='DIRECTORY',
+                        help="Save the scrapers' queues, ids and sitemap positions to a snapshot and journal in a "
+                             "directory, and resume from them on the next start instead of scanning the logs")
+    parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS,
+                        help="Requests of a url (retried with backoff after errors, timeouts and 5xx/429 responses) "
+                             "before it goes to the dead-letter file, 1 disables retries (default: {0})".format(
+                            MAX_ATTEMPTS))
+    parser.add_argument('--replay-dead-letters', action="store_true",
+                        help="Queue the urls of the dead-letter file (log/dead_letters.jsonl) again")
+    parser.add_argument('--ignore-robots', action="store_true",
+                        help="Do not skip urls disallowed by robots.txt and pace every site at the fixed request "
+                             "delay instead of its Crawl-delay")
+    parser.add_argument('--keep-duplicates', action="store_true",
+                        help="Write every parsed recipe, also when the same title, ingredients and instructions were "
+                             "already written (log/content_hashes.db)")
+    parser.add_argument('--parse-ingredients', action="store_true",
+                        help="Add the ingredients split into quantity, unit, name and preparation to every written "
+                             "recipe as 'parsed_ingredients'")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Crawl with this many processes, each with its own event loop, share of the sites and "
+                             "output segment. Crashed workers are restarted. With --metrics-port worker i serves "
+                             "PORT+1+i, with --archive-pages each worker archives to DIRECTORY/w<i>")
     args = parser.parse_args()
-    modify_start_id = True if args.calc_start_id else False
-    download_sitemaps = True if args.download_sitemaps else False
-    use_sitemaps = True if args.use_sitemaps else False
-    reverse = True if args.reverse else False
-    if download_sitemaps:
-        main_event_loop = asyncio.get_event_loop()
-        for sitemap_downloader in SITEMAP_DOWNLOADERS:
-            asyncio.ensure_future(sitemap_downloader.get_sitemaps(), loop=main_event_loop)
-    else:
-        # Setup wrapper for async recipe_scraper
-        main_event_loop = asyncio.get_event_loop()
-        main(
-            main_event_loop,
-            modify_scraper_start_id_flag=modify_start_id,
-            use_sitemaps_flag=use_sitemaps,
-            reverse_flag=reverse,
-            verbose=True
-        )
-    while True:
-        pending_tasks = asyncio.Task.all_tasks(main_event_loop)
-        if sum([task.done() for task in pending_tasks]) >= len(pending_tasks):
-            break
-        main_event_loop.run_until_complete(asyncio.gather(*pending_tasks))
-    if download_sitemaps:
+    if args.workers and args.reparse:
+        parser.error("--workers shards a crawl, use --processes to re-parse with several processes")
+    # the analysis tools find the corpus themselves, only crawls and re-parses set up the data and log directories
+    if args.export_columnar:
+        ColumnarExporter(args.export_columnar).export()
+        sys.exit(0)
+    if args.near_duplicates:
+        finder = NearDuplicateFinder()
+        finder.write(args.near_duplicates, finder.find())
+        sys.exit(0)
+    if args.cooccurrence:
+        CooccurrenceMatrix().build().write(args.cooccurrence)
+        sys.exit(0)
+    if args.normalize_ingredients:
+        IngredientNormalizer().write_corpus(args.normalize_ingredients)
+        sys.exit(0)
+    if args.ingredient_index:
+        ingredient_index = IngredientIndex(args.ingredient_index)
+        if args.ingredient_query:
+            for result in ingredient_index.query(args.ingredient_query):
+                print("{0}\t{1}\t{2}".format(result['rating_count'], result['title'], result['url']))
+        else:
+            ingredient_index.update()
+        ingredient_index.close()
+        sys.exit(0)
+    init()
+    if args.workers:
+        print("Launching {0} worker processes".format(args.workers))
+        sys.exit(1 if launch_workers(args) else 0)
+    if args.metrics_port:
+        METRICS.start_http_server(args.metrics_port)
+    if args.metrics_textfile:
+        METRICS.start_textfile_writer(args.metrics_textfile)
+    if args.profile_signal:
+        install_profile_signal(settings.log_path)
+    if args.sqlite_store:
+        # only a re-parse is a one-off bulk load, a crawl keeps the indexes so the store can be queried meanwhile
+        AsyncScraper.set_recipe_store(SQLiteRecipeStore(args.sqlite_store, bulk_load=bool(args.reparse)))
+    if args.archive_pages:
+        AsyncScraper.set_page_archive(PageArchive(args.archive_pages))
+    if args.frontier:
+        AsyncScraper.set_frontier(SQLiteFrontier(args.frontier), owner=args.node_id)
+    set_retry_scheduler(args)
+    if not args.ignore_robots:
+        AsyncScraper.set_robots(ROBOTS)
+    AsyncScraper.set_redirect_map(RedirectMap().load())
+    if not args.keep_duplicates:
+        AsyncScraper.set_content_index(ContentHashIndex())
+    if args.parse_ingredients:
+        AsyncScraper.set_ingredient_normalizer(IngredientNormalizer())
+    if args.reparse:
+        if args.parser_map:
+            with open(args.parser_map, 'r') as f:
+                parser_map = json.load(f)
+        else:
+            parser_map = parser_map_from_downloaders(get_sitemap_downloaders())
+        BulkReparser(parser_map, processes=args.processes, recipe_store=AsyncScraper.recipe_store).run(args.reparse)
+        if AsyncScraper.recipe_store:
+            AsyncScraper.recipe_store.close()
+        sys.exit(0)
+    queued_logging = QueuedLogging().start() if not args.sync_logging else None
+    checkpoint = CrawlCheckpoint(args.checkpoint) if args.checkpoint else None
+    main_event_loop = asyncio.get_event_loop()
+    crawl_sites(main_event_loop, args, checkpoint=checkpoint)
+    if args.download_sitemaps:
         print("collected site maps in directory: {0}".format(SiteMapDownloader.output_directory))
+    close_outputs(args.metrics_textfile, checkpoint)
+    if queued_logging:
+        queued_logging.stop()
     sys.exit(0)
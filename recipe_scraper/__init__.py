@@ -1,34 +1,34 @@
 import os
 import logging
-import sys
+from .settings import settings, Settings, EATERATOR_ENV_VARIABLE, LOG_FORMAT
 
 __version__ = '0.0.1'
 __python_version__ = '3.5.2'
 
-###############################################
-#             Data Storage Settings           #
-EATERATOR_ENV_VARIABLE = 'EATERATOR_DATA_SCRAPING_PATH'
-try:
-    DATA_PATH = os.environ[EATERATOR_ENV_VARIABLE]
-    if not os.path.exists(DATA_PATH):
-        os.makedirs(DATA_PATH)
-except KeyError:
-    print("Please specify a data path ENV variable '{0}' to use recipe_scraper".format(EATERATOR_ENV_VARIABLE))
-    sys.exit(0)
-DEFAULT_MAX_FILES_PER_DAY = 100
-MAX_DAILY_FILES = os.environ['MAX_DAILY_FILES'] if 'MAX_DAILY_FILES' in os.environ else DEFAULT_MAX_FILES_PER_DAY
-DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024  # Size in megabytes ( 10 MB )
-MAX_FILE_SIZE = os.environ['MAX_FILE_SIZE'] if 'MAX_FILE_SIZE' in os.environ else DEFAULT_MAX_FILE_SIZE
-
-###############################################
-#              Logging Config                 #
-logging_path = os.path.join(os.environ[EATERATOR_ENV_VARIABLE], 'log')
-LOGGING_FILE = os.path.join(logging_path, 'log.txt')
-if not os.path.exists(logging_path):
-    os.makedirs(logging_path)
-logging.basicConfig(
-    filename=LOGGING_FILE,
-    format='%(asctime)4s| %(levelname)4s| %(name)4s| %(message)s',
-    level=logging.DEBUG
-)
 logger = logging.getLogger('recipe_scraper')
+
+_initialized = False
+
+
+def init(configure_logging=True):
+    """
+    Creates the data and log directories and configures logging to the log file. Runs once per process; it is called
+    by the scrapers and tools the first time they touch disk, or can be called explicitly (e.g. by main.py) after
+    `settings.configure(...)`.
+    :param configure_logging: whether to configure the root logger to write to the log file
+    :return: the package settings
+    """
+    global _initialized
+    if _initialized:
+        return settings
+    for path in (settings.data_path, settings.log_path):
+        if not os.path.exists(path):
+            os.makedirs(path, exist_ok=True)
+    if configure_logging:
+        logging.basicConfig(
+            filename=settings.logging_file,
+            format=LOG_FORMAT,
+            level=logging.DEBUG
+        )
+    _initialized = True
+    return settings
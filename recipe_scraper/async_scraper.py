@@ -1,16 +1,29 @@
-from . import MAX_FILE_SIZE, MAX_DAILY_FILES, DATA_PATH, logger
+from . import settings, init, logger
 import os
-import json
+from collections import OrderedDict
 from timeit import default_timer
-from asyncio import sleep as aio_sleep, ensure_future
+from asyncio import sleep as aio_sleep, ensure_future, wait_for, wrap_future, TimeoutError as AsyncTimeoutError
 from aiohttp import ClientSession, TCPConnector, ClientResponseError, ClientOSError, ClientTimeoutError
 from queue import Queue
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from time import time
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 from recipe_scraper.tools import get_agent
 from .recipe_parsers import HRecipeParser
 from .exceptions import InvalidResponse, AsyncScraperConfigError, FileNumberException
+from .metrics import REQUESTS, RESPONSES, RESPONSE_BYTES, RECIPES_WRITTEN, RECIPE_BYTES_WRITTEN, PARSE_FAILURES, \
+    FETCH_SECONDS, PARSE_SECONDS, WRITE_SECONDS, QUEUE_DEPTH, ROBOTS_DISALLOWED, DUPLICATES_SKIPPED, \
+    CONTENT_HASH_LOOKUPS
+from .loop_monitor import set_activity
+from .log_pipeline import FETCH_LOG
+from .frontier import FrontierQueue
+from .retry import RETRYABLE_STATUSES
+from .circuit_breaker import breaker_for
+from .urls import canonical_url
+from .records import recipe_json
+from .content_index import content_hash
 
 
 ###############################################
@@ -24,8 +37,27 @@ EXECUTOR = ThreadPoolExecutor(max_workers=1)
 
 ###############################################
 #             Request behaviour               #
-DOMAIN_REQUEST_DELAY = 3.0  # time in seconds
-REQUEST_TIMEOUT = 60 * 30  # 30 minute request delay in case of internet lose (holy conestoga)
+DOMAIN_REQUEST_DELAY = 3.0  # seconds between requests to a site whose robots.txt sets no Crawl-delay
+STICKY_USER_AGENTS = False  # keep one user agent per site instead of a random agent per request
+FETCHED_URLS_MEMORY_SIZE = 200000  # most recently fetched urls remembered to skip fetching them again
+
+
+class RequestTimeouts:
+    """
+    Timeouts in seconds for the phases of a request: establishing the connection, receiving the response headers
+    (first byte, includes connecting) and reading the whole body
+    """
+
+    __slots__ = ('connect', 'first_byte', 'read')
+
+    def __init__(self, connect=10.0, first_byte=30.0, read=120.0):
+        self.connect = connect
+        self.first_byte = first_byte
+        self.read = read
+
+
+REQUEST_TIMEOUTS = RequestTimeouts()
+SITE_REQUEST_TIMEOUTS = {}  # site -> RequestTimeouts overriding REQUEST_TIMEOUTS for slow sites
 
 
 # TODO refactor AsyncScraper to allow for a 'url' generator that will allow use of a SiteMapGenerator
@@ -37,11 +69,26 @@ class AsyncScraper:
     run in the main event loop.
     """
 
-    def __init__(self, parser=HRecipeParser.get_parser(), base_path=None, loop=None, start_id=None, url_id_format=None):
+    recipe_store = None  # optional secondary output sink shared by all scrapers, see set_recipe_store
+    page_archive = None  # optional raw response archive shared by all scrapers, see set_page_archive
+    frontier = None  # optional FrontierStore shared by crawl nodes replacing the local url queue, see set_frontier
+    frontier_owner = None
+    retry_scheduler = None  # optional RetryScheduler shared by all scrapers, see set_retry_scheduler
+    robots = None  # optional RobotsCache filtering urls and pacing requests, see set_robots
+    redirect_map = None  # optional RedirectMap of requested -> final urls, see set_redirect_map
+    content_index = None  # optional ContentHashIndex skipping recipes already written, see set_content_index
+    ingredient_normalizer = None  # optional IngredientNormalizer, see set_ingredient_normalizer
+    fetched_urls = OrderedDict()  # canonical requested and final urls recently fetched by any scraper of this process
+    _in_flight = None  # url taken from the queue whose request has not finished
+    _deferred = None  # url taken from the queue while its robots.txt was unavailable
+    _robots_policy = None  # RobotsPolicy of the last url checked
+
+    def __init__(self, parser=HRecipeParser.get_parser(), base_path=None, loop=None, start_id=None, url_id_format=None,
+                 site=None):
+        self.site = site
         self.consecutive_404_errors = 0
         self.current_id = start_id
         self.url_id_format = url_id_format
-        self._url_queue = Queue()
         self.data_file_manager = DataFileManager()
         self.parser = parser
         self.followed = []  # TODO input via bisect in sorted list to make faster !?
@@ -49,6 +96,7 @@ class AsyncScraper:
         self.loop = loop
         self.sitemap_loader = None
         self.sitemap_link_generator = None
+        self._url_queue = self._new_url_queue()
         if not self.base_path or not start_id or not url_id_format:
             raise AsyncScraperConfigError("No base path/seed_id/url_id_format/loop specified,\
                 please instantiate instance with base class.")
@@ -59,69 +107,160 @@ class AsyncScraper:
 
     async def __anext__(self):
         start = default_timer()
+        set_activity(self.site_name)
+        QUEUE_DEPTH.labels(self.site_name).observe(self._url_queue.qsize())
+        pause = breaker_for(self.site_name).wait_time()
+        if pause:  # the site's circuit is open, check again once a probe request is allowed
+            await aio_sleep(pause)
+            ensure_future(self.__anext__(), loop=self.loop)
+            return
+        policy = self._robots_policy
+        if policy and not policy.available and not policy.expired:  # wait for robots.txt to be fetched again
+            await aio_sleep(policy.expires_at - time())
+            ensure_future(self.__anext__(), loop=self.loop)
+            return
         try:
             resp, url = await self.make_request()
             if resp:
+                set_activity(self.site_name, url)  # a blocking parse is attributed to the page being parsed
                 data = self.parse_content(resp, url)
-                if data['url'] and data['ingredients']:
-                    print("{0}\t|\t{1}".format(data['url'], json.dumps(data)))
-                    await self._write_content(json.dumps(data))
+                if data and data['url'] and data['ingredients']:
+                    key = content_hash(data) if self.content_index else None
+                    if not await self._is_duplicate(data, key):
+                        await self._write_recipe(data, key)
+                else:
+                    PARSE_FAILURES.labels(self.site_name).inc()
             else:
                 if self.consecutive_404_errors > MAXIMUM_SEQUENTIAL_404_ERRORS:
+                    self._stop()
                     return
                 else:
                     try:
                         self._generate_new_urls_from_id()
                     except StopIteration:
                         print("Exiting, no more links: {0}".format(self.url_id_format))
+                        self._stop()
                         return
         except InvalidResponse:
             pass
-        except ClientTimeoutError:
-            print("TimeError, exiting: {0}".format(self.url_id_format))
-            return
-        await aio_sleep(DOMAIN_REQUEST_DELAY - (start - default_timer()))  # delay call for a specific time period
+        await aio_sleep(max(0.0, self.request_delay - (default_timer() - start)))  # pace requests to the site
         ensure_future(self.__anext__(), loop=self.loop)
 
     async def make_request(self):
         """
-        Makes an async aiohttp request to the next url in the queue, if it is not in the self.followed list
+        Makes an async aiohttp request to the next url: a retry that is due, else the next url in the queue. A url
+        with a known redirect is requested at its final url, and urls already fetched or disallowed by robots.txt are
+        skipped. Each phase of the request is bounded by the site's RequestTimeouts, and the outcome is reported to
+        the site's circuit breaker.
         :return:
         """
-        if not self._url_queue.empty():
-            url = None
-            try:
-                url = self._url_queue.get()
-                conn = TCPConnector(verify_ssl=False)
-                async with ClientSession(connector=conn) as client:
-                    header = {"User:Agent": get_agent()}
-                    async with client.get(url, timeout=REQUEST_TIMEOUT, headers=header) as response:
-                        if response.status == 200:
-                            logger.info('successful response: id: {0}, final: {1}'.format(url, response.url))
-                            self.consecutive_404_errors = 0
-                            return await response.read(), response.url
-                        else:
-                            logger.info('invalid response. Status: {0}, url:  {1}'.format(response.status, url))
-                            self.consecutive_404_errors += 1
-                            if self.consecutive_404_errors >= MAXIMUM_SEQUENTIAL_404_ERRORS:
-                                logger.error("Maximum sequential 404 error encountered. Last url: {0}".format(url))
-                            raise InvalidResponse()
-            except (ClientResponseError, ClientOSError):
-                logger.error("Error with aiohttp request. url id: {0}".format(url))
-                raise InvalidResponse()
-        else:
+        breaker = breaker_for(self.site_name)
+        url, target = await self._next_url(), None
+        try:
+            while url is not None:
+                target = await self._request_target(url)
+                if target:
+                    break
+                url = await self._next_url()
+        except InvalidResponse:  # robots.txt unavailable, the url is deferred
+            breaker.cancel_probe()
+            raise
+        if url is None:
+            breaker.cancel_probe()  # nothing was requested, another scraper of the site may probe
             return None, None
+        timeouts = self.timeouts
+        fetch_start = default_timer()
+        phase = 'first_byte'
+        try:
+            self._in_flight = url
+            set_activity(self.site_name, url)
+            REQUESTS.labels(self.site_name).inc()
+            conn = TCPConnector(verify_ssl=False, conn_timeout=timeouts.connect)
+            async with ClientSession(connector=conn) as client:
+                header = {"User-Agent": self._user_agent()}
+                response = await wait_for(client.get(target, headers=header), timeouts.first_byte)
+                try:
+                    RESPONSES.labels(self.site_name, response.status).inc()
+                    if response.status == 200:
+                        self.consecutive_404_errors = 0
+                        phase = 'read'
+                        body = await wait_for(response.read(), timeouts.read)
+                        self._finish_url(url)  # only once the body is read, a failed read releases the url
+                        breaker.record_success()
+                        fetch_seconds = default_timer() - fetch_start
+                        FETCH_LOG.record(self.site_name, target, response.url, response.status, len(body),
+                                         fetch_seconds)
+                        FETCH_SECONDS.labels(self.site_name).observe(fetch_seconds)
+                        RESPONSE_BYTES.labels(self.site_name).inc(len(body))
+                        self._retries_finished(url)
+                        if self.redirect_map:
+                            self.redirect_map.add(url, response.url)
+                        self._remember_fetched(url, response.url)
+                        if self.page_archive:
+                            self.page_archive.store(url, response.url, response.status, body)
+                        return body, response.url
+                    else:
+                        self._finish_url(url)
+                        fetch_seconds = default_timer() - fetch_start
+                        FETCH_LOG.record(self.site_name, target, response.url, response.status, 0, fetch_seconds)
+                        FETCH_SECONDS.labels(self.site_name).observe(fetch_seconds)
+                        if response.status in RETRYABLE_STATUSES:
+                            breaker.record_failure()
+                            if self.retry_scheduler:
+                                self.retry_scheduler.schedule(self.site_name, url, 'HTTP {0}'.format(response.status))
+                                raise InvalidResponse()
+                        else:
+                            breaker.record_success()
+                            if target != url and response.status in (404, 410):
+                                # the final url moved on, request the url itself again to follow the new redirect
+                                self.redirect_map.forget(url)
+                                self._deferred = url
+                                raise InvalidResponse()
+                            self._retries_finished(url)
+                        self.consecutive_404_errors += 1
+                        if self.consecutive_404_errors >= MAXIMUM_SEQUENTIAL_404_ERRORS:
+                            logger.error("Maximum sequential 404 error encountered. Last url: {0}".format(url))
+                        raise InvalidResponse()
+                finally:
+                    response.release()
+        except (ClientResponseError, ClientOSError) as e:
+            FETCH_LOG.record(self.site_name, target, None, None, 0, default_timer() - fetch_start, type(e).__name__)
+            RESPONSES.labels(self.site_name, 'error').inc()
+            logger.error("Error with aiohttp request. url id: {0}".format(url))
+            breaker.record_failure()
+            self._request_failed(url, type(e).__name__)
+            raise InvalidResponse()
+        except (ClientTimeoutError, AsyncTimeoutError) as e:
+            if isinstance(e, ClientTimeoutError):  # raised by the connector's conn_timeout
+                phase = 'connect'
+            error = 'timeout_{0}'.format(phase)
+            FETCH_LOG.record(self.site_name, target, None, None, 0, default_timer() - fetch_start, error)
+            RESPONSES.labels(self.site_name, 'timeout').inc()
+            logger.error("Request timed out ({0}). url id: {1}".format(phase, url))
+            breaker.record_failure()
+            self._request_failed(url, error)
+            raise InvalidResponse()
+        finally:
+            self._in_flight = None
 
     def parse_content(self, response, url):
         """
         Parses content from response into JSON format for storage, and also adds any unfollowed links to the queue
         :param response: the raw HTTP response
         :param url: final url of the request
-        :return: HTTP response parsed by the given parser (ready to be written to file in JSON format)
+        :return: HTTP response parsed by the given parser (ready to be written to file in JSON format), or None if
+            the parser failed
         """
-        soup = BeautifulSoup(response, 'lxml')
-        data = self.parser(soup)
-        data['url'] = url
+        parse_start = default_timer()
+        try:
+            soup = BeautifulSoup(response, 'lxml')
+            data = self.parser(soup)
+        except Exception as e:
+            logger.error("Error parsing response from {0}: {1}".format(url, str(e)))
+            return None
+        finally:
+            PARSE_SECONDS.labels(self.site_name).observe(default_timer() - parse_start)
+        data['url'] = str(url)
         return data
 
     def find_links(self, soup):
@@ -135,6 +274,81 @@ class AsyncScraper:
         self.followed.extend(links)
         return links
 
+    @classmethod
+    def set_recipe_store(cls, store):
+        """Sets a store (e.g. SQLiteRecipeStore) that receives every recipe written to the data files"""
+        cls.recipe_store = store
+
+    @classmethod
+    def set_page_archive(cls, archive):
+        """Sets a PageArchive that keeps the raw body of every successful response"""
+        cls.page_archive = archive
+
+    @classmethod
+    def set_retry_scheduler(cls, scheduler):
+        """Sets a RetryScheduler that retries failed requests with backoff instead of dropping them"""
+        cls.retry_scheduler = scheduler
+
+    @classmethod
+    def set_robots(cls, robots):
+        """
+        Sets a RobotsCache: urls its robots.txt disallows are skipped without a request, and a site's Crawl-delay
+        replaces DOMAIN_REQUEST_DELAY as the pause between its requests
+        """
+        cls.robots = robots
+
+    @classmethod
+    def set_content_index(cls, content_index):
+        """Sets a ContentHashIndex so a recipe whose content was already written is not written again"""
+        cls.content_index = content_index
+
+    @classmethod
+    def set_ingredient_normalizer(cls, normalizer):
+        """
+        Sets an IngredientNormalizer so written recipes carry their ingredients split into quantity, unit, name and
+        preparation as 'parsed_ingredients'
+        """
+        cls.ingredient_normalizer = normalizer
+
+    @classmethod
+    def set_redirect_map(cls, redirect_map):
+        """Sets a RedirectMap so urls that redirected before are requested at their final url"""
+        cls.redirect_map = redirect_map
+
+    @classmethod
+    def set_frontier(cls, frontier, owner=None):
+        """
+        Makes every scraper lease its urls from a FrontierStore (e.g. SQLiteFrontier) shared with other crawl nodes
+        instead of an in-process queue. Generated ids and sitemap links are added to the frontier, which drops urls
+        it already knows, so the nodes never fetch a url twice.
+        :param frontier: the FrontierStore
+        :param owner: lease owner name of this node, defaults to host:pid
+        """
+        cls.frontier = frontier
+        cls.frontier_owner = owner
+
+    @property
+    def site_name(self):
+        """Label used for this scraper's metrics, the sitemap directory or the host of the url format"""
+        if not self.site:
+            if self.sitemap_loader:
+                self.site = self.sitemap_loader.subdirectory_output
+            elif getattr(self, 'url_id_format', None):
+                self.site = urlsplit(self.url_id_format).netloc
+        return self.site or 'unknown'
+
+    @property
+    def timeouts(self):
+        """RequestTimeouts of this scraper's site"""
+        return SITE_REQUEST_TIMEOUTS.get(self.site_name, REQUEST_TIMEOUTS)
+
+    @property
+    def request_delay(self):
+        """Seconds between requests: the Crawl-delay of the site's robots.txt, else DOMAIN_REQUEST_DELAY"""
+        if self._robots_policy and self._robots_policy.crawl_delay is not None:
+            return self._robots_policy.crawl_delay
+        return DOMAIN_REQUEST_DELAY
+
     @property
     def url_queue(self):
         return self._url_queue
@@ -172,9 +386,149 @@ class AsyncScraper:
             return
 
     def reset_url_queue(self):
-        self._url_queue = Queue()
+        if isinstance(self._url_queue, FrontierQueue):
+            self._url_queue.close()
+        self._url_queue = self._new_url_queue()
         self._generate_new_urls_from_id()
 
+    def checkpoint_state(self):
+        """
+        :return: JSON serializable state needed to resume this scraper exactly where it is, see CrawlCheckpoint
+        """
+        queue = []
+        if not isinstance(self._url_queue, FrontierQueue):  # a frontier keeps its own state
+            queue = [str(url) for url in list(self._url_queue.queue)]
+            for url in (self._deferred, self._in_flight):
+                if url:
+                    queue.insert(0, str(url))
+        return {
+            'current_id': getattr(self, 'current_id', None),
+            'consecutive_404_errors': self.consecutive_404_errors,
+            'queue': queue,
+            'sitemap_position': self.sitemap_loader.position if self.sitemap_loader else None,
+            'retries': self.retry_scheduler.pending(self.site_name) if self.retry_scheduler else [],
+        }
+
+    def restore_checkpoint(self, state):
+        """Restores a state saved by `checkpoint_state`, in place of rebuilding it from the logs"""
+        if state.get('current_id') is not None:
+            self.current_id = state['current_id']
+        self.consecutive_404_errors = state.get('consecutive_404_errors', 0)
+        if self.sitemap_loader:
+            self.sitemap_loader.resume_from(state.get('sitemap_position'))
+            self.sitemap_link_generator = self.sitemap_loader.get_links
+        if self.retry_scheduler:
+            self.retry_scheduler.restore(self.site_name, state.get('retries', []))
+        if isinstance(self._url_queue, FrontierQueue):
+            self._url_queue.close()  # hands its leases back before the new queue leases again
+        self._url_queue = self._new_url_queue()
+        for url in state.get('queue', []):
+            self._url_queue.put(url)
+        if self.url_queue_is_empty:
+            self._generate_new_urls_from_id()
+
+    def _new_url_queue(self):
+        if self.frontier:
+            return FrontierQueue(self.frontier, self.site_name, owner=self.frontier_owner,
+                                 batch_size=URL_BATCH_SIZE_FROM_IDS)
+        return Queue()
+
+    async def _next_url(self):
+        if self._deferred:
+            url, self._deferred = self._deferred, None
+            return url
+        if self.retry_scheduler:
+            url = self.retry_scheduler.pop_due(self.site_name)
+            if url:
+                return url
+        if isinstance(self._url_queue, FrontierQueue):  # leases off the event loop
+            return await self._url_queue.next_url(self.loop)
+        if not self._url_queue.empty():
+            return self._url_queue.get()
+        return None
+
+    async def _is_duplicate(self, data, key):
+        """Checks a parsed recipe against the content index, which reserves its hash if it is new"""
+        if not self.content_index:
+            return False
+        original = await self.content_index.claim(key, data['url'], self.loop)
+        CONTENT_HASH_LOOKUPS.labels(self.site_name, 'hit' if original else 'miss').inc()
+        if original:
+            logger.debug("Skipping {0}, same recipe as {1}".format(data['url'], original))
+        return original is not None
+
+    async def _request_target(self, url):
+        """
+        :return: the url to request for url, its final url if it redirected before, or None if it is skipped: urls
+            already fetched under this or their final address, and urls disallowed by robots.txt are finished without
+            a request. While the site's robots.txt cannot be fetched the url is held back until the next attempt.
+        """
+        target = self.redirect_map.resolve(url) if self.redirect_map else url
+        if self._was_fetched(target) or self._was_fetched(url):
+            DUPLICATES_SKIPPED.labels(self.site_name).inc()
+            self._finish_url(url)
+            self._retries_finished(url)
+            return None
+        if self.robots:
+            self._robots_policy = await self.robots.policy_for(target, self._user_agent())
+            if not self._robots_policy.available:
+                self._deferred = url
+                raise InvalidResponse()
+            if not self._robots_policy.allowed(target):
+                ROBOTS_DISALLOWED.labels(self.site_name).inc()
+                logger.debug("Skipping {0}, disallowed by robots.txt".format(target))
+                self._finish_url(url)
+                self._retries_finished(url)
+                return None
+        return target
+
+    def _user_agent(self):
+        """:return: the User-Agent header of the site's next request, robots.txt included"""
+        return get_agent(self.site_name if STICKY_USER_AGENTS else None)
+
+    def _was_fetched(self, url):
+        """Checks the most recently fetched urls for url, a url seen again stays remembered longer"""
+        key = canonical_url(url)
+        if key not in self.fetched_urls:
+            return False
+        self.fetched_urls.move_to_end(key)
+        return True
+
+    def _remember_fetched(self, *urls):
+        """Remembers fetched urls, forgetting the least recently seen beyond FETCHED_URLS_MEMORY_SIZE"""
+        for url in urls:
+            key = canonical_url(url)
+            self.fetched_urls[key] = None
+            self.fetched_urls.move_to_end(key)
+        while len(self.fetched_urls) > FETCHED_URLS_MEMORY_SIZE:
+            self.fetched_urls.popitem(last=False)
+
+    def _retries_finished(self, url):
+        """Drops the retry scheduler's failed attempts of a url which will not be requested again"""
+        if self.retry_scheduler:
+            self.retry_scheduler.finished(url)
+
+    def _request_failed(self, url, error):
+        """Hands a failed url to the retry scheduler, or back to the frontier without one"""
+        if self.retry_scheduler:
+            self._finish_url(url)  # the retry scheduler owns the url from here on
+            self.retry_scheduler.schedule(self.site_name, url, error)
+        else:
+            self._finish_url(url, handled=False)
+
+    def _stop(self):
+        """Writes the acknowledgements still buffered by a frontier queue once the scraper has no more urls"""
+        if isinstance(self._url_queue, FrontierQueue):
+            self._url_queue.close(wait=False)
+
+    def _finish_url(self, url, handled=True):
+        """Acknowledges a url leased from the frontier once its response was read, or releases it for a retry"""
+        if isinstance(self._url_queue, FrontierQueue):
+            if handled:
+                self._url_queue.ack(url)
+            else:
+                self._url_queue.release(url)
+
     def set_sitemap_link_loader(self, loader):
         if loader:
             self.sitemap_loader = loader
@@ -192,15 +546,41 @@ class AsyncScraper:
         if self.sitemap_link_generator:
             return self.sitemap_loader.site_set_length
 
+    async def _write_recipe(self, data, key=None):
+        """
+        Writes a new recipe to the data file and the recipe store. Its content hash is only recorded in the content
+        index once the data file write succeeded.
+        :param data: the parsed recipe
+        :param key: content hash of the recipe claimed in the content index, if any
+        """
+        write_start = default_timer()
+        if self.ingredient_normalizer:
+            self.ingredient_normalizer.normalize_recipe(data)
+        serialized = recipe_json(data)  # cached on the record for the recipe store
+        print("{0}\t|\t{1}".format(data['url'], serialized))
+        try:
+            await self._write_content(serialized)
+        except Exception as e:
+            logger.error("Error writing recipe {0} to the data file: {1}".format(data['url'], str(e)))
+            if key:
+                self.content_index.release(key)
+            return
+        if key:
+            self.content_index.record(key)
+        if self.recipe_store:
+            self.recipe_store.add(data)
+        WRITE_SECONDS.labels(self.site_name).observe(default_timer() - write_start)
+        RECIPES_WRITTEN.labels(self.site_name).inc()
+        RECIPE_BYTES_WRITTEN.labels(self.site_name).inc(len(serialized))
+
     async def _write_content(self, data):
         """
         Uses helper threadpool to offload blocking file I/O operations to store data
         :param data: the json data to be written to the data file
         :return:
         """
-        EXECUTOR.submit(
-            write_data_to_file(data, self.data_file_manager.current_data_file)
-        )
+        await wrap_future(EXECUTOR.submit(write_data_to_file, data, self.data_file_manager.current_data_file),
+                          loop=self.loop)
 
 
 class DataFileManager:
@@ -217,18 +597,31 @@ class DataFileManager:
             cls.__instance = object.__new__(cls)
         return cls.__instance
 
-    def __init__(self, data_folder=DATA_PATH, max_file_size=MAX_FILE_SIZE):
-        self.data_folder = data_folder
-        self.max_file_size = max_file_size
+    def __init__(self, data_folder=None, max_file_size=None):
+        self._data_folder = data_folder
+        self.max_file_size = max_file_size or settings.max_file_size
         self._current_data_file = None
 
+    @property
+    def data_folder(self):
+        """Defaults to the data directory, resolved on the first write so creating a manager needs no settings"""
+        return self._data_folder or settings.data_path
+
+    @data_folder.setter
+    def data_folder(self, data_folder):
+        self._data_folder = data_folder
+
     def _get_current_file(self):
         """
         Function finds the current datafile to begin writing to and sets private member self._current_data_file
         :return: string for the data path
         """
-        current_date_str = datetime.now().date().strftime("%Y_%m_%d_{0}.txt")
-        for i in range(1, MAX_DAILY_FILES + 1):
+        init()
+        if settings.data_segment:
+            current_date_str = datetime.now().date().strftime("%Y_%m_%d_{0}_{{0}}.txt").format(settings.data_segment)
+        else:
+            current_date_str = datetime.now().date().strftime("%Y_%m_%d_{0}.txt")
+        for i in range(1, settings.max_daily_files + 1):
             file_name = os.path.join(self.data_folder, current_date_str.format(i))
             if not os.path.exists(file_name):
                 self._current_data_file = file_name
@@ -251,7 +644,7 @@ class DataFileManager:
         Property to return the current data file to write to.
         :return:
         """
-        if not self._current_data_file or os.stat(self._current_data_file).st_size > MAX_FILE_SIZE:
+        if not self._current_data_file or os.stat(self._current_data_file).st_size > self.max_file_size:
             self._get_current_file()
         return self._current_data_file
 
@@ -273,6 +666,7 @@ def write_data_to_file(data, file_name):
 class AsyncSraperSiteMap(AsyncScraper):
 
     def __init__(self, loop=None):
+        self.site = None
         self.consecutive_404_errors = 0
         self._url_queue = Queue()
         self.data_file_manager = DataFileManager()
@@ -0,0 +1,129 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from . import logger
+
+###############################################
+#             Checkpoint Settings             #
+JOURNAL_INTERVAL = 5.0  # seconds between journal entries
+SNAPSHOT_INTERVAL = 120.0  # seconds between snapshots, each snapshot truncates the journal
+SNAPSHOT_FILE = 'checkpoint.json'
+JOURNAL_FILE = 'checkpoint.journal'
+
+
+def _fsync_write(path, text, mode):
+    with open(path, mode) as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class CrawlCheckpoint:
+    """
+    Periodically saves the state of every scraper (see AsyncScraper.checkpoint_state: url queue including the url
+    being fetched, current id, 404 counter and sitemap position) so a restarted crawl continues where it stopped
+    instead of rebuilding its state from the logs.
+
+    State is captured on the event loop, so it is consistent, and written by a background thread. Every
+    `journal_interval` the state of the scrapers that changed is appended to the journal; every `snapshot_interval`
+    the full state is written to a new snapshot file that atomically replaces the old one. Entries carry a sequence
+    number and the snapshot records the last one it includes, so journal entries that were already folded into the
+    snapshot are skipped on load even if the crash happened before the journal was truncated.
+    """
+
+    def __init__(self, directory, journal_interval=JOURNAL_INTERVAL, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.directory = directory
+        self.journal_interval = journal_interval
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_file = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal_file = os.path.join(directory, JOURNAL_FILE)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._loop = None
+        self._scrapers = {}
+        self._handle = None
+        self._sequence = 0
+        self._last_snapshot = time()
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.state = self.load()
+        self._written = {site: json.dumps(state, sort_keys=True) for site, state in self.state.items()}
+
+    def load(self):
+        """:return: dict of site -> saved scraper state, from the snapshot and the journal entries after it"""
+        state, sequence = {}, 0
+        if os.path.isfile(self.snapshot_file):
+            with open(self.snapshot_file, 'r') as f:
+                snapshot = json.load(f)
+            state, sequence = snapshot['scrapers'], snapshot['sequence']
+        if os.path.isfile(self.journal_file):
+            with open(self.journal_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn write of the last entry
+                    if entry['sequence'] > sequence:
+                        state.update(entry['scrapers'])
+                        sequence = entry['sequence']
+        self._sequence = sequence
+        return state
+
+    def state_for(self, site):
+        return self.state.get(site)
+
+    def start(self, loop, scrapers):
+        """
+        Starts saving the given scrapers. Must be called from the thread that runs the loop.
+        :param loop: the event loop the scrapers run on
+        :param scrapers: dict of site -> AsyncScraper
+        """
+        self._loop = loop
+        self._scrapers = scrapers
+        self._handle = loop.call_later(self.journal_interval, self._tick)
+        return self
+
+    def save(self, snapshot=False):
+        """Captures the scraper state now and queues it for writing, call from the loop thread"""
+        scrapers = {}
+        for site, scraper in self._scrapers.items():
+            serialized = json.dumps(scraper.checkpoint_state(), sort_keys=True)
+            if snapshot or self._written.get(site) != serialized:
+                scrapers[site] = serialized
+                self._written[site] = serialized
+        if not scrapers and not snapshot:
+            return None
+        self._sequence += 1
+        if snapshot:
+            self._last_snapshot = time()
+            return self._executor.submit(self._write_snapshot, self._sequence, dict(self._written))
+        return self._executor.submit(self._append_journal, self._sequence, scrapers)
+
+    def close(self):
+        """Writes a final snapshot and waits for the writer thread"""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        if self._scrapers:
+            self.save(snapshot=True)
+        self._executor.shutdown(wait=True)
+
+    def _tick(self):
+        try:
+            self.save(snapshot=time() - self._last_snapshot >= self.snapshot_interval)
+        except Exception as e:
+            logger.error("Error saving crawl checkpoint: {0}".format(str(e)))
+        self._handle = self._loop.call_later(self.journal_interval, self._tick)
+
+    def _append_journal(self, sequence, scrapers):
+        line = '{{"sequence": {0}, "scrapers": {{{1}}}}}\n'.format(
+            sequence, ', '.join('{0}: {1}'.format(json.dumps(site), state) for site, state in scrapers.items()))
+        _fsync_write(self.journal_file, line, 'a')
+
+    def _write_snapshot(self, sequence, scrapers):
+        text = '{{"sequence": {0}, "time": {1}, "scrapers": {{{2}}}}}'.format(
+            sequence, time(), ', '.join('{0}: {1}'.format(json.dumps(site), state) for site, state in scrapers.items()))
+        tmp_file = '{0}.{1}.tmp'.format(self.snapshot_file, os.getpid())
+        _fsync_write(tmp_file, text, 'w')
+        os.replace(tmp_file, self.snapshot_file)
+        _fsync_write(self.journal_file, '', 'w')
@@ -0,0 +1,91 @@
+from time import time
+from . import logger
+from .metrics import CIRCUIT_OPENED
+
+###############################################
+#           Circuit Breaker Settings          #
+FAILURE_THRESHOLD = 5  # consecutive failures that open the circuit
+RESET_TIMEOUT = 30.0  # seconds a domain is paused before a probe request
+MAX_RESET_TIMEOUT = 15 * 60.0  # pause doubles for every failed probe up to this
+PROBE_WAIT = 1.0  # seconds other scrapers of the domain wait between checks while a probe is in flight
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+_breakers = {}
+
+
+def breaker_for(domain):
+    """:return: the CircuitBreaker shared by every scraper of a domain"""
+    breaker = _breakers.get(domain)
+    if breaker is None:
+        breaker = _breakers[domain] = CircuitBreaker(domain)
+    return breaker
+
+
+class CircuitBreaker:
+    """
+    Pauses requests to a domain after `failure_threshold` consecutive failures (timeouts, connection errors, 5xx).
+    After `reset_timeout` a single probe request is let through: success closes the circuit and the crawl resumes,
+    failure opens it again for twice as long, up to `max_reset_timeout`.
+    """
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT,
+                 max_reset_timeout=MAX_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._pause = reset_timeout
+        self._opened_at = None
+        self._probing = False
+
+    def wait_time(self, now=None):
+        """
+        :return: 0 if a request may be made now (taking the probe slot if the circuit is half open), else the
+            seconds to wait before asking again
+        """
+        if self.state == CLOSED:
+            return 0
+        now = now or time()
+        if self.state == OPEN:
+            remaining = self._opened_at + self._pause - now
+            if remaining > 0:
+                return remaining
+            self.state = HALF_OPEN
+            self._probing = False
+        if self._probing:
+            return PROBE_WAIT
+        self._probing = True
+        logger.info("Circuit for {0} half open, probing".format(self.name))
+        return 0
+
+    def cancel_probe(self):
+        """Gives the probe slot back when the scraper holding it made no request after all, e.g. had no url left"""
+        if self.state == HALF_OPEN:
+            self._probing = False
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.warning("Circuit for {0} closed, resuming".format(self.name))
+        self.state = CLOSED
+        self.failures = 0
+        self._pause = self.reset_timeout
+        self._probing = False
+
+    def record_failure(self, now=None):
+        self.failures += 1
+        if self.state == HALF_OPEN:
+            self._pause = min(self.max_reset_timeout, self._pause * 2)
+            self._open(now)
+        elif self.state == CLOSED and self.failures >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now):
+        self.state = OPEN
+        self._opened_at = now or time()
+        self._probing = False
+        CIRCUIT_OPENED.labels(self.name).inc()
+        logger.warning("Circuit for {0} open after {1} consecutive failures, pausing {2:.0f}s".format(
+            self.name, self.failures, self._pause))
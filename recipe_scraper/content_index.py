@@ -0,0 +1,147 @@
+import re
+import sqlite3
+from asyncio import wrap_future
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5
+from . import settings, init, logger
+
+###############################################
+#           Content Dedupe Settings           #
+CONTENT_HASH_MEMORY_SIZE = 250000  # hashes kept in memory, older ones are only looked up in the disk index
+CONTENT_INDEX_BATCH_SIZE = 500  # new hashes per disk index transaction
+CONTENT_INDEX_BUSY_TIMEOUT = 30.0  # seconds a worker waits on another worker's write lock
+
+CREATE_CONTENT_INDEX_SQL = 'CREATE TABLE IF NOT EXISTS content_hashes (hash BLOB PRIMARY KEY, url TEXT)'
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _normalize(value):
+    if isinstance(value, dict):  # JSON-LD HowToStep entries
+        value = value.get('text')
+    return WHITESPACE_PATTERN.sub(' ', str(value or '')).strip().casefold()
+
+
+def content_hash(recipe):
+    """
+    :return: 16 byte digest of a recipe's title, ingredients and instructions after case folding and whitespace
+        collapsing, so the same recipe hashes the same whichever url or crawl it came from
+    """
+    digest = md5()  # not a security boundary, only needs to be stable and fast
+    digest.update(_normalize(recipe.get('title')).encode('utf-8'))
+    for field in ('ingredients', 'instructions'):
+        values = recipe.get(field) or []
+        if isinstance(values, str):
+            values = [values]
+        digest.update(b'\x1e')
+        digest.update('\x1f'.join(_normalize(value) for value in values).encode('utf-8'))
+    return digest.digest()
+
+
+class ContentHashIndex:
+    """
+    Remembers the content hash of every recipe written, with the url it was first written under, so the same recipe
+    reached through another url or crawled again is not written twice. The most recently seen hashes are kept in a
+    bounded in-memory LRU; every hash is also written to a SQLite index in batches, which answers for hashes that
+    were evicted from memory or written by an earlier run or another worker process. The database is only touched
+    on a dedicated thread which owns the connection, so `claim` can be awaited on the event loop.
+
+    A new hash is only reserved by `claim` until the recipe was written: `record` keeps it once the write succeeded,
+    `release` forgets it if the write failed so the recipe is written when it is seen again.
+    """
+
+    def __init__(self, index_file=None, memory_size=CONTENT_HASH_MEMORY_SIZE, batch_size=CONTENT_INDEX_BATCH_SIZE):
+        if not index_file:
+            init()
+        self.index_file = index_file or settings.content_index_file
+        self.memory_size = memory_size
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self._recent = OrderedDict()  # hash -> first url
+        self._pending = {}  # recorded hashes not yet handed to the disk index
+        self._claimed = {}  # new hashes whose recipe is being written
+        self._connection = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._executor.submit(self._open).result()
+
+    async def claim(self, key, url, loop=None):
+        """
+        Looks a content hash up, and reserves it for url if it is new
+        :param key: `content_hash` of the recipe
+        :param url: url the recipe is about to be written under
+        :return: the url the same recipe was first written (or is being written) under, or None if it is new
+        """
+        original = self._recent.get(key)
+        if original is not None:
+            self._recent.move_to_end(key)
+        else:
+            original = self._pending.get(key) or self._claimed.get(key)
+            if original is None:
+                original = await wrap_future(self._executor.submit(self._lookup, key), loop=loop)
+                # another scraper may have claimed the hash while the disk index was searched
+                original = original or self._claimed.get(key)
+            if original is not None:
+                self._remember(key, original)
+        if original is not None:
+            self.hits += 1
+            return original
+        self.misses += 1
+        self._claimed[key] = str(url)
+        return None
+
+    def record(self, key):
+        """Keeps a hash reserved by `claim` once its recipe was written"""
+        url = self._claimed.pop(key, None)
+        if url is None:
+            return
+        self._remember(key, url)
+        self._pending[key] = url
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def release(self, key):
+        """Forgets a hash reserved by `claim` whose recipe could not be written"""
+        self._claimed.pop(key, None)
+
+    def flush(self):
+        """Hands the recorded hashes to the writer thread"""
+        if self._pending:
+            batch, self._pending = self._pending, {}
+            self._executor.submit(self._write_batch, batch)
+
+    def close(self):
+        self.flush()
+        self._executor.submit(self._connection.close).result()
+        self._executor.shutdown(wait=True)
+        logger.info("Content dedupe: {0} duplicates skipped, {1} new recipes".format(self.hits, self.misses))
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _remember(self, key, url):
+        self._recent[key] = url
+        if len(self._recent) > self.memory_size:
+            self._recent.popitem(last=False)
+
+    def _open(self):
+        self._connection = sqlite3.connect(self.index_file, timeout=CONTENT_INDEX_BUSY_TIMEOUT, isolation_level=None)
+        self._connection.execute(CREATE_CONTENT_INDEX_SQL)
+
+    def _write_batch(self, batch):
+        try:
+            self._connection.execute('BEGIN IMMEDIATE')
+            self._connection.executemany('INSERT OR IGNORE INTO content_hashes (hash, url) VALUES (?, ?)',
+                                         list(batch.items()))
+            self._connection.execute('COMMIT')
+        except Exception as e:
+            if self._connection.in_transaction:
+                self._connection.execute('ROLLBACK')
+            logger.error("Error writing {0} content hashes to {1}: {2}".format(len(batch), self.index_file, str(e)))
+
+    def _lookup(self, key):
+        row = self._connection.execute('SELECT url FROM content_hashes WHERE hash = ?', (key,)).fetchone()
+        return row[0] if row else None
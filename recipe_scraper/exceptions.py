@@ -8,3 +8,7 @@ class InvalidResponse(Exception):
 
 class AsyncScraperConfigError(Exception):
     pass
+
+
+class ScraperSettingsError(Exception):
+    pass
@@ -0,0 +1,298 @@
+import os
+import sqlite3
+import socket
+from asyncio import wrap_future
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from timeit import default_timer
+from time import time
+from . import logger
+
+###############################################
+#              Frontier Settings              #
+LEASE_VISIBILITY_TIMEOUT = 15 * 60.0  # seconds before an unacknowledged lease is handed to another node
+FRONTIER_BUSY_TIMEOUT = 30.0  # seconds a node waits on another node's write lock
+FRONTIER_FLUSH_INTERVAL = 2.0  # seconds a FrontierQueue may hold acknowledged urls before writing them
+PENDING, LEASED, DONE = 0, 1, 2
+
+CREATE_FRONTIER_SQL = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    site TEXT NOT NULL,
+    state INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    added_at REAL
+)
+"""
+CREATE_FRONTIER_INDEX_SQL = 'CREATE INDEX IF NOT EXISTS frontier_lease_idx ON frontier (site, state, lease_expires)'
+
+
+def default_node_id():
+    return '{0}:{1}'.format(socket.gethostname(), os.getpid())
+
+
+class FrontierStore:
+    """
+    Work queue shared by crawl nodes. Urls are added per site, leased in batches by one node at a time and then
+    acknowledged (done, never handed out again) or released (back to pending). A lease that is neither acknowledged
+    nor released within its visibility timeout, e.g. because the node died, becomes available to other nodes again.
+    Adding a url that is already known is a no-op, so nodes can feed the same sitemaps without double fetching.
+    """
+
+    def add(self, site, urls):
+        """:return: number of urls that were new"""
+        raise NotImplementedError
+
+    def requeue(self, site, urls):
+        """Makes urls pending again whatever their state, e.g. to replay dead-lettered urls"""
+        raise NotImplementedError
+
+    def lease(self, site, count, owner, visibility_timeout=LEASE_VISIBILITY_TIMEOUT):
+        """:return: list of up to count urls now leased to owner"""
+        raise NotImplementedError
+
+    def ack(self, urls, owner):
+        raise NotImplementedError
+
+    def release(self, urls, owner):
+        raise NotImplementedError
+
+    def counts(self, site=None):
+        """:return: dict of 'pending', 'leased' and 'done' url counts"""
+        raise NotImplementedError
+
+    def submit(self, method, *args):
+        """
+        Calls one of the store's blocking methods without blocking the caller, e.g. from the event loop. Calls are
+        run one at a time in the order they were submitted.
+        :return: concurrent.futures.Future of the result
+        """
+        future = Future()
+        try:
+            future.set_result(method(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def close(self):
+        pass
+
+
+class SQLiteFrontier(FrontierStore):
+    """
+    Reference FrontierStore on a SQLite database, which can live on a path shared by several machines. Every
+    operation is a single short transaction; leases take the write lock up front (BEGIN IMMEDIATE) so two nodes can
+    never select the same urls. The rollback journal is used instead of WAL, which does not work on network file
+    systems. Waiting on another node's lock can take up to the busy timeout, so `submit` runs the operations of the
+    crawl on a dedicated worker thread instead of the event loop.
+    """
+
+    def __init__(self, db_file, busy_timeout=FRONTIER_BUSY_TIMEOUT):
+        self.db_file = db_file
+        self._connection = sqlite3.connect(db_file, timeout=busy_timeout, isolation_level=None,
+                                           check_same_thread=False)
+        self._connection.execute(CREATE_FRONTIER_SQL)
+        self._connection.execute(CREATE_FRONTIER_INDEX_SQL)
+        self._lock = Lock()  # the worker thread and direct callers share the connection, one transaction at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def add(self, site, urls):
+        now = time()
+        with self._transaction() as cursor:
+            before = self._connection.total_changes
+            cursor.executemany('INSERT OR IGNORE INTO frontier (url, site, added_at) VALUES (?, ?, ?)',
+                               ((str(url), site, now) for url in urls))
+            return self._connection.total_changes - before
+
+    def requeue(self, site, urls):
+        now = time()
+        urls = [str(url) for url in urls]
+        with self._transaction() as cursor:  # no upsert, ON CONFLICT needs SQLite 3.24
+            cursor.executemany('INSERT OR IGNORE INTO frontier (url, site, added_at) VALUES (?, ?, ?)',
+                               ((url, site, now) for url in urls))
+            cursor.executemany(
+                'UPDATE frontier SET state = ?, owner = NULL, lease_expires = NULL, added_at = ? WHERE url = ?',
+                ((PENDING, now, url) for url in urls))
+
+    def lease(self, site, count, owner, visibility_timeout=LEASE_VISIBILITY_TIMEOUT):
+        now = time()
+        with self._transaction() as cursor:
+            urls = [row[0] for row in cursor.execute(
+                'SELECT url FROM frontier WHERE site = ? AND (state = ? OR (state = ? AND lease_expires < ?)) '
+                'ORDER BY added_at LIMIT ?', (site, PENDING, LEASED, now, count))]
+            cursor.executemany(
+                'UPDATE frontier SET state = ?, owner = ?, lease_expires = ?, attempts = attempts + 1 WHERE url = ?',
+                ((LEASED, owner, now + visibility_timeout, url) for url in urls))
+        return urls
+
+    def ack(self, urls, owner):
+        self._finish(urls, owner, DONE)
+
+    def release(self, urls, owner):
+        self._finish(urls, owner, PENDING)
+
+    def counts(self, site=None):
+        query = 'SELECT state, COUNT(*) FROM frontier {0} GROUP BY state'.format('WHERE site = ?' if site else '')
+        with self._lock:
+            counts = dict(self._connection.execute(query, (site,) if site else ()).fetchall())
+        return {'pending': counts.get(PENDING, 0), 'leased': counts.get(LEASED, 0), 'done': counts.get(DONE, 0)}
+
+    def submit(self, method, *args):
+        return self._executor.submit(method, *args)
+
+    def close(self):
+        """Finishes the submitted operations and closes the database"""
+        self._executor.shutdown(wait=True)
+        self._connection.close()
+
+    def _finish(self, urls, owner, state):
+        # a lease that expired and was taken over by another node is no longer ours to finish
+        with self._transaction() as cursor:
+            cursor.executemany(
+                'UPDATE frontier SET state = ?, owner = NULL, lease_expires = NULL '
+                'WHERE url = ? AND state = ? AND owner = ?',
+                ((state, str(url), LEASED, owner) for url in urls))
+
+    def _transaction(self):
+        return _Transaction(self._connection, self._lock)
+
+
+class _Transaction:
+
+    def __init__(self, connection, lock):
+        self.connection = connection
+        self.lock = lock
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+        except Exception:
+            self.lock.release()
+            raise
+        return cursor
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self.lock.release()
+        return False
+
+
+class FrontierQueue:
+    """
+    Drop-in replacement for the url Queue of an AsyncScraper backed by a FrontierStore. Urls put on the queue are
+    added to the frontier, and urls are leased from it a batch at a time when the local buffer runs dry. The scraper
+    acknowledges each url once it has been handled, or releases it if the request failed. Adds, acknowledgements and
+    releases are buffered and written in batches through the store's `submit`, so they never wait on the database;
+    the scraper awaits `next_url`, which leases off the event loop. `get` and `empty` lease synchronously and are
+    meant for code running outside the event loop, like restoring a checkpoint.
+    """
+
+    def __init__(self, frontier, site, owner=None, batch_size=50, visibility_timeout=LEASE_VISIBILITY_TIMEOUT,
+                 flush_interval=FRONTIER_FLUSH_INTERVAL):
+        self.frontier = frontier
+        self.site = site
+        self.owner = owner or default_node_id()
+        self.batch_size = batch_size
+        self.visibility_timeout = visibility_timeout
+        self.flush_interval = flush_interval
+        self._leased = deque()
+        self._to_add = []
+        self._to_ack = []
+        self._to_release = []
+        self._last_flush = default_timer()
+
+    def put(self, url):
+        self._to_add.append(url)
+        if len(self._to_add) >= self.batch_size:
+            self.flush()
+
+    def get(self):
+        if not self._leased:
+            self._lease()
+        return self._leased.popleft()
+
+    def empty(self):
+        if not self._leased:
+            self._lease()
+        return not self._leased
+
+    def qsize(self):
+        return len(self._leased)
+
+    async def next_url(self, loop=None):
+        """:return: the next leased url, leasing a new batch on the store's worker thread if needed, or None"""
+        if not self._leased:
+            self.flush()
+            urls = await wrap_future(self.frontier.submit(
+                self.frontier.lease, self.site, self.batch_size, self.owner, self.visibility_timeout), loop=loop)
+            self._leased_batch(urls)
+        return self._leased.popleft() if self._leased else None
+
+    def ack(self, url):
+        self._to_ack.append(url)
+        self._flush_if_due()
+
+    def release(self, url):
+        self._to_release.append(url)
+        self._flush_if_due()
+
+    def flush(self):
+        """
+        Hands the buffered adds, acknowledgements and releases to the store
+        :return: list of the futures of the submitted writes
+        """
+        futures = []
+        if self._to_add:
+            futures.append(self._submit(self.frontier.add, self.site, self._to_add))
+            self._to_add = []
+        if self._to_ack:
+            futures.append(self._submit(self.frontier.ack, self._to_ack, self.owner))
+            self._to_ack = []
+        if self._to_release:
+            futures.append(self._submit(self.frontier.release, self._to_release, self.owner))
+            self._to_release = []
+        self._last_flush = default_timer()
+        return futures
+
+    def close(self, wait=True):
+        """
+        Writes the buffered urls and hands unprocessed leases back to the frontier
+        :param wait: block until they are written, pass False on the event loop
+        """
+        self._to_release.extend(self._leased)
+        self._leased.clear()
+        futures = self.flush()
+        if wait:
+            for future in futures:
+                future.exception()  # failures are logged by the callback
+
+    def _flush_if_due(self):
+        if len(self._to_ack) + len(self._to_release) >= self.batch_size or \
+                default_timer() - self._last_flush > self.flush_interval:
+            self.flush()
+
+    def _submit(self, method, *args):
+        future = self.frontier.submit(method, *args)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def _log_failure(self, future):
+        if future.exception():
+            logger.error("Error writing to the frontier of {0}: {1}".format(self.site, str(future.exception())))
+
+    def _lease(self):
+        self.flush()
+        self._leased_batch(self.frontier.submit(
+            self.frontier.lease, self.site, self.batch_size, self.owner, self.visibility_timeout).result())
+
+    def _leased_batch(self, urls):
+        if urls:
+            logger.debug("Leased {0} urls for {1}".format(len(urls), self.site))
+        self._leased.extend(urls)
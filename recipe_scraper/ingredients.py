@@ -0,0 +1,174 @@
+import re
+import json
+from collections import namedtuple
+from functools import lru_cache
+from . import logger
+
+###############################################
+#        Ingredient Normalizer Settings       #
+INGREDIENT_CACHE_SIZE = 1 << 18  # distinct lines remembered, the corpus repeats the same lines very often
+
+UNICODE_FRACTIONS = {
+    '½': 0.5, '⅓': 1 / 3, '⅔': 2 / 3, '¼': 0.25, '¾': 0.75, '⅕': 0.2, '⅖': 0.4, '⅗': 0.6, '⅘': 0.8, '⅙': 1 / 6,
+    '⅚': 5 / 6, '⅛': 0.125, '⅜': 0.375, '⅝': 0.625, '⅞': 0.875,
+}
+UNITS = {
+    'cup': ('c', 'cup', 'cups'),
+    'tablespoon': ('tbsp', 'tbs', 'tbl', 'tablespoon', 'tablespoons'),
+    'teaspoon': ('tsp', 'teaspoon', 'teaspoons'),
+    'fluid ounce': ('fl oz', 'fl. oz', 'fluid ounce', 'fluid ounces'),
+    'ounce': ('oz', 'ounce', 'ounces'),
+    'pound': ('lb', 'lbs', 'pound', 'pounds'),
+    'gram': ('g', 'gr', 'gram', 'grams'),
+    'kilogram': ('kg', 'kilogram', 'kilograms'),
+    'milliliter': ('ml', 'milliliter', 'milliliters', 'millilitre', 'millilitres'),
+    'liter': ('l', 'liter', 'liters', 'litre', 'litres'),
+    'pint': ('pt', 'pint', 'pints'),
+    'quart': ('qt', 'quart', 'quarts'),
+    'gallon': ('gal', 'gallon', 'gallons'),
+    'pinch': ('pinch', 'pinches'),
+    'dash': ('dash', 'dashes'),
+    'clove': ('clove', 'cloves'),
+    'can': ('can', 'cans'),
+    'package': ('pkg', 'package', 'packages'),
+    'jar': ('jar', 'jars'),
+    'bunch': ('bunch', 'bunches'),
+    'slice': ('slice', 'slices'),
+    'stick': ('stick', 'sticks'),
+    'head': ('head', 'heads'),
+    'sprig': ('sprig', 'sprigs'),
+}
+PREPARATION_WORDS = frozenset([
+    'chopped', 'minced', 'diced', 'sliced', 'grated', 'shredded', 'crushed', 'cubed', 'halved', 'quartered',
+    'peeled', 'seeded', 'cored', 'trimmed', 'melted', 'softened', 'beaten', 'packed', 'sifted', 'toasted', 'cooked',
+    'drained', 'rinsed', 'thawed', 'finely', 'coarsely', 'roughly', 'thinly', 'freshly', 'lightly', 'firmly',
+])
+
+_UNIT_NAMES = {alias: unit for unit, aliases in UNITS.items() for alias in aliases}
+# a mixed number '1 1/2' or '1-1/2' (not the range 1 to 1/2), a fraction, '1½', a decimal, an integer or '½'
+_NUMBER = r'(?:\d+(?:\s+|\s*-\s*)\d+\s*/\s*\d+|\d+\s*/\s*\d+|\d+\s*[{0}]|\d*\.\d+|\d+|[{0}])'.format(
+    ''.join(UNICODE_FRACTIONS))
+QUANTITY_PATTERN = re.compile(
+    r'(?:(?P<whole>\d+)(?:\s+|\s*-\s*))?(?:(?P<numerator>\d+)\s*/\s*(?P<denominator>\d+)|'
+    r'(?P<number>\d*\.\d+|\d+)?\s*(?P<fraction>[{0}])?)'.format(''.join(UNICODE_FRACTIONS)))
+LINE_PATTERN = re.compile(
+    r'\s*(?:(?P<quantity>{0})(?:\s*(?:-|–|to|or)\s*(?P<quantity_max>{0}))?\s*)?(?P<rest>.*)'.format(_NUMBER),
+    re.DOTALL)
+UNIT_PATTERN = re.compile(r'(?P<unit>{0})\.?(?![a-z])\s*(?:of\s+)?'.format(
+    '|'.join(re.escape(alias).replace(r'\ ', r'\s*') for alias in sorted(_UNIT_NAMES, key=len, reverse=True))),
+    re.IGNORECASE)
+PARENTHESES_PATTERN = re.compile(r'\s*\(([^)]*)\)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+IngredientLine = namedtuple('IngredientLine', ['quantity', 'quantity_max', 'unit', 'name', 'preparation'])
+
+
+def parse_quantity(text):
+    """
+    :return: float value of a quantity like '2', '1.5', '1/2', '1 1/2', '1-1/2', '1½' or '½', None without a
+        (valid) quantity
+    """
+    match = QUANTITY_PATTERN.fullmatch(text.strip()) if text else None
+    if not match or not match.group(0):
+        return None
+    whole, numerator, denominator, number, fraction = match.group(
+        'whole', 'numerator', 'denominator', 'number', 'fraction')
+    value = float(whole or 0) + float(number or 0) + UNICODE_FRACTIONS.get(fraction, 0.0)
+    if denominator:
+        if int(denominator) == 0:
+            return None
+        value += int(numerator) / int(denominator)
+    return value
+
+
+def parse_ingredient_line(line):
+    """
+    Splits a raw ingredient line into its parts, e.g. '1 1/2 cups (packed) brown sugar' ->
+    IngredientLine(quantity=1.5, quantity_max=None, unit='cup', name='brown sugar', preparation='packed')
+    :return: IngredientLine with the quantity (and the upper end of a range like '2-3') as floats, the unit as its
+        singular full name, the lower cased name and the preparation notes (parentheses, text after the first comma
+        and leading words like 'chopped'), each None where the line has no such part
+    """
+    match = LINE_PATTERN.match(line)
+    quantity, quantity_max, rest = match.group('quantity', 'quantity_max', 'rest')
+    notes = PARENTHESES_PATTERN.findall(rest)
+    if notes:
+        rest = PARENTHESES_PATTERN.sub('', rest)
+    unit = None
+    rest = rest.lstrip()
+    match = UNIT_PATTERN.match(rest)
+    if match and (quantity or match.group(0).rstrip().endswith('of')):  # 'pinch of salt' but not 'cloves, whole'
+        unit = _UNIT_NAMES[WHITESPACE_PATTERN.sub(' ', match.group('unit').lower()).replace('fl. ', 'fl ')]
+        rest = rest[match.end():]
+    name, _, preparation = rest.partition(',')
+    words = WHITESPACE_PATTERN.sub(' ', name).strip().lower().split(' ')
+    leading = 0
+    while leading < len(words) - 1 and words[leading] in PREPARATION_WORDS:
+        leading += 1
+    if leading:
+        notes.insert(0, ' '.join(words[:leading]))
+    preparation = WHITESPACE_PATTERN.sub(' ', preparation).strip(' .')
+    if preparation:
+        notes.append(preparation)
+    notes = [WHITESPACE_PATTERN.sub(' ', note).strip().lower() for note in notes]
+    return IngredientLine(parse_quantity(quantity), parse_quantity(quantity_max), unit,
+                          ' '.join(words[leading:]) or None, ', '.join(note for note in notes if note) or None)
+
+
+class IngredientNormalizer:
+    """
+    Parses ingredient lines into quantity, unit, name and preparation, with a bounded LRU cache in front of the
+    parser: scraped recipes repeat the same lines ('1 teaspoon salt', '2 large eggs') so most lines are answered
+    from the cache. Results are immutable IngredientLine tuples, safe to share between recipes.
+    """
+
+    def __init__(self, cache_size=INGREDIENT_CACHE_SIZE):
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def normalize(self, lines):
+        """:return: list of one dict of quantity, quantity_max, unit, name and preparation per ingredient line"""
+        if isinstance(lines, str):
+            lines = [lines]
+        parse = self.parse
+        return [parse(line)._asdict() for line in lines or [] if isinstance(line, str)]
+
+    def normalize_recipe(self, recipe):
+        """Adds the normalized ingredients of a recipe dict as 'parsed_ingredients'"""
+        recipe['parsed_ingredients'] = self.normalize(recipe.get('ingredients'))
+        return recipe
+
+    def write_corpus(self, output_file, recipe_lists=None, verbose=True):
+        """
+        Normalizes every recipe of the corpus into JSON lines of {"url", "ingredients": [...]}
+        :param recipe_lists: iterable of lists of recipe dicts, defaults to the DataLoader corpus
+        :return: number of recipes written
+        """
+        if recipe_lists is None:
+            from recipe_scraper.tools.data_loader import DataLoader
+            recipe_lists = DataLoader(verbose=verbose).iter_json_data()
+        written = 0
+        with open(output_file, 'w') as f:
+            for recipes in recipe_lists:
+                for recipe in recipes or []:
+                    if isinstance(recipe, dict):
+                        f.write(json.dumps({'url': recipe.get('url'),
+                                            'ingredients': self.normalize(recipe.get('ingredients'))}) + '\n')
+                        written += 1
+        if verbose:
+            print("Normalized the ingredients of {0} recipes, cache hit rate {1:.1%}".format(written, self.hit_rate))
+        return written
+
+    @property
+    def hit_rate(self):
+        info = self.parse.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
+
+    def close(self):
+        info = self.parse.cache_info()
+        logger.info("Ingredient normalizer: {0} lines parsed, {1} answered from the cache".format(
+            info.misses, info.hits))
+
+    @staticmethod
+    def _parse(line):
+        return parse_ingredient_line(line)
@@ -0,0 +1,182 @@
+import os
+import threading
+from multiprocessing import Process, Queue as ProcessQueue
+from queue import Empty
+from time import time, sleep
+from . import settings, logger
+from .metrics import REQUESTS, RECIPES_WRITTEN, PARSE_FAILURES
+
+###############################################
+#             Launcher Settings               #
+STATUS_INTERVAL = 30.0  # seconds between worker status reports
+RESTART_DELAY = 5.0  # seconds before restarting a crashed worker, doubled for every consecutive crash
+MAX_RESTART_DELAY = 300.0
+MAX_RESTARTS = 10  # per worker, a worker crashing more often than this is left down
+SEGMENT_FORMAT = 'w{0:02d}'
+
+
+def assign_shards(weights, workers):
+    """
+    Splits sites over workers so the total weight per worker is as even as possible (heaviest site first, each to
+    the least loaded worker).
+    :param weights: dict of site -> relative crawl weight
+    :param workers: number of worker processes
+    :return: list of site lists, one per worker (never more workers than sites)
+    """
+    shards = [[] for _ in range(max(1, min(workers, len(weights))))]
+    loads = [0.0] * len(shards)
+    for site, weight in sorted(weights.items(), key=lambda item: (-item[1], item[0])):
+        i = loads.index(min(loads))
+        shards[i].append(site)
+        loads[i] += weight
+    return shards
+
+
+def segment_name(index):
+    return SEGMENT_FORMAT.format(index)
+
+
+def site_status():
+    """Per site request, recipe and parse failure counts of this process"""
+    status = {}
+    for name, metric in (('requests', REQUESTS), ('recipes', RECIPES_WRITTEN), ('failures', PARSE_FAILURES)):
+        for (site,), value in metric.totals().items():
+            status.setdefault(site, {'requests': 0, 'recipes': 0, 'failures': 0})[name] = value
+    return status
+
+
+def _report_status(index, status_queue, interval):
+    while True:
+        sleep(interval)
+        status_queue.put((index, os.getpid(), time(), site_status()))
+
+
+def _run_worker(index, sites, status_queue, interval, target, args):
+    """Process entry point: selects the worker's output segment and reports status while running the target"""
+    settings.configure(data_segment=segment_name(index))
+    thread = threading.Thread(target=_report_status, args=(index, status_queue, interval), name='worker-status',
+                              daemon=True)
+    thread.start()
+    target(sites, *args)
+    status_queue.put((index, os.getpid(), time(), site_status()))
+
+
+class ShardedLauncher:
+    """
+    Runs a crawl over several processes. Each worker gets a shard of the sites, its own event loop and its own output
+    segment (data files and fetch log), so workers never contend for a file. The parent prints the aggregated status
+    the workers report and restarts a worker that exits with an error, with an increasing delay; a worker that exits
+    cleanly has finished its shard.
+    """
+
+    def __init__(self, target, shards, args=(), status_interval=STATUS_INTERVAL, max_restarts=MAX_RESTARTS,
+                 verbose=True):
+        """
+        :param target: module level callable run in every worker as target(sites, *args)
+        :param shards: list of site lists, one per worker (see assign_shards)
+        :param args: extra arguments for target
+        :param status_interval: seconds between status reports
+        :param max_restarts: restarts per worker before giving up on it
+        :param verbose: print aggregated status to the command line
+        """
+        self.target = target
+        self.shards = shards
+        self.args = tuple(args)
+        self.status_interval = status_interval
+        self.max_restarts = max_restarts
+        self.verbose = verbose
+        self.status = {}
+        self.restarts = [0] * len(shards)
+        self._processes = [None] * len(shards)
+        self._restart_at = {}
+        self._retired = []  # last reports of crashed worker processes
+        self._status_queue = ProcessQueue()
+
+    def run(self):
+        """Blocks until every worker finished or was given up on, returns the number of workers given up on"""
+        for index in range(len(self.shards)):
+            self._start(index)
+        failed = set()
+        next_print = time() + self.status_interval
+        try:
+            while any(self._processes) or self._restart_at:
+                self._drain_status(timeout=1.0)
+                for index, process in enumerate(self._processes):
+                    if process is not None and not process.is_alive():
+                        self._processes[index] = None
+                        if process.exitcode != 0:
+                            self._on_crash(index, process.exitcode, failed)
+                for index, restart_at in list(self._restart_at.items()):
+                    if time() >= restart_at:
+                        del self._restart_at[index]
+                        self._start(index)
+                if self.verbose and time() >= next_print:
+                    self.print_status()
+                    next_print = time() + self.status_interval
+        except KeyboardInterrupt:
+            self.terminate()
+            raise
+        self._drain_status(timeout=0)
+        if self.verbose:
+            self.print_status()
+        return len(failed)
+
+    def terminate(self):
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            if process is not None:
+                process.join()
+
+    def totals(self):
+        """Status of every site summed over the latest report of each worker"""
+        totals = {}
+        for site_counts in self._retired + [site_counts for _, _, site_counts in self.status.values()]:
+            for site, counts in site_counts.items():
+                site_total = totals.setdefault(site, {'requests': 0, 'recipes': 0, 'failures': 0})
+                for key, value in counts.items():
+                    site_total[key] += value
+        return totals
+
+    def print_status(self):
+        print("Worker status:")
+        for index, sites in enumerate(self.shards):
+            process = self._processes[index]
+            state = 'running (pid {0})'.format(process.pid) if process is not None else \
+                'restarting' if index in self._restart_at else 'stopped'
+            print("\t{0}: {1}, restarts: {2}, sites: {3}".format(
+                segment_name(index), state, self.restarts[index], ', '.join(sites)))
+        for site, counts in sorted(self.totals().items()):
+            print("\t\t{0}: {1[requests]} requests, {1[recipes]} recipes, {1[failures]} parse failures".format(
+                site, counts))
+
+    def _start(self, index):
+        process = Process(target=_run_worker, name=segment_name(index),
+                          args=(index, self.shards[index], self._status_queue, self.status_interval, self.target,
+                                self.args))
+        process.start()
+        self._processes[index] = process
+
+    def _on_crash(self, index, exitcode, failed):
+        # counters restart from zero in the new process, keep the crashed process' last report in the totals
+        if index in self.status:
+            self._retired.append(self.status.pop(index)[2])
+        if self.restarts[index] >= self.max_restarts:
+            logger.error("Worker {0} exited with {1}, giving up after {2} restarts".format(
+                segment_name(index), exitcode, self.restarts[index]))
+            failed.add(index)
+            return
+        delay = min(MAX_RESTART_DELAY, RESTART_DELAY * 2 ** self.restarts[index])
+        self.restarts[index] += 1
+        logger.error("Worker {0} exited with {1}, restarting in {2:.0f}s".format(segment_name(index), exitcode, delay))
+        self._restart_at[index] = time() + delay
+
+    def _drain_status(self, timeout):
+        try:
+            while True:
+                index, pid, reported_at, site_counts = self._status_queue.get(timeout=timeout)
+                self.status[index] = (pid, reported_at, site_counts)
+                timeout = 0
+        except Empty:
+            pass
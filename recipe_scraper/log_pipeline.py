@@ -0,0 +1,150 @@
+import os
+import json
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue, Empty
+from time import time
+from . import settings, init
+
+###############################################
+#              Fetch Log Settings             #
+FETCH_LOG_BATCH_SIZE = 1000  # records written per file write
+FETCH_LOG_FIELDS = ('ts', 'site', 'url', 'final', 'status', 'bytes', 'seconds')
+
+_STOP = object()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread. The stdlib handler formats every record on the
+    calling thread so it can be pickled; records never leave this process, so the hot path is only the enqueue.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class QueuedLogging:
+    """
+    Moves the handlers of the root logger behind a queue drained by a background thread, so logging from the event
+    loop never waits on the log file.
+    """
+
+    def __init__(self):
+        self._handlers = []
+        self._listener = None
+
+    def start(self):
+        root = logging.getLogger()
+        self._handlers = root.handlers[:]
+        for handler in self._handlers:
+            root.removeHandler(handler)
+        queue = Queue()
+        root.addHandler(_DeferredQueueHandler(queue))
+        self._listener = QueueListener(queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+        return self
+
+    def stop(self):
+        """Flushes queued records and restores the original handlers"""
+        if self._listener:
+            self._listener.stop()
+            root = logging.getLogger()
+            for handler in root.handlers[:]:
+                if isinstance(handler, _DeferredQueueHandler):
+                    root.removeHandler(handler)
+            for handler in self._handlers:
+                root.addHandler(handler)
+            self._listener = None
+
+
+class FetchLog:
+    """
+    Structured log of every request made, one compact JSON object per line with the fields in FETCH_LOG_FIELDS (plus
+    'error' for failed requests). `record` only enqueues a tuple; a writer thread started on first use serializes and
+    writes records in batches. Tools read it back with `iter_records` instead of mining the text log with regexes.
+    """
+
+    def __init__(self, log_file=None, batch_size=FETCH_LOG_BATCH_SIZE):
+        self._log_file = log_file
+        self.batch_size = batch_size
+        self._queue = Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def record(self, site, url, final_url, status, size, seconds, error=None):
+        """
+        :param site: scraper site name
+        :param url: requested url
+        :param final_url: url after redirects, None if the request failed
+        :param status: HTTP status, None if the request failed
+        :param size: response body bytes read
+        :param seconds: time spent on the request
+        :param error: exception name for failed requests
+        """
+        if self._thread is None:
+            self._start()
+        self._queue.put_nowait((time(), site, url, final_url, status, size, seconds, error))
+
+    def close(self):
+        """Writes every queued record and stops the writer thread"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def log_file(self):
+        """Defaults to fetch.jsonl (fetch.<segment>.jsonl for worker processes) in the log directory"""
+        return self._log_file or settings.fetch_log_file
+
+    def iter_records(self):
+        """
+        Yields each logged request as a dict. Without an explicit log file the fetch logs of every output segment
+        are read, so tools see the requests of all worker processes.
+        """
+        for log_file in ([self._log_file] if self._log_file else settings.fetch_log_files):
+            if not os.path.isfile(log_file):
+                continue
+            with open(log_file, 'r') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        pass  # partially written last line after a crash
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                if not self._log_file:
+                    init()
+                self._thread = threading.Thread(target=self._drain, name='fetch-log', daemon=True)
+                self._thread.start()
+
+    def _drain(self):
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except Empty:
+                pass
+            if batch[-1] is _STOP:
+                batch.pop()
+                running = False
+            lines = []
+            for ts, site, url, final_url, status, size, seconds, error in batch:
+                record = {'ts': round(ts, 3), 'site': site, 'url': str(url),
+                          'final': str(final_url) if final_url else None, 'status': status, 'bytes': size,
+                          'seconds': round(seconds, 4)}
+                if error:
+                    record['error'] = error
+                lines.append(json.dumps(record, separators=(',', ':')))
+            if lines:
+                with open(self.log_file, 'a') as f:
+                    f.write('\n'.join(lines) + '\n')
+
+
+FETCH_LOG = FetchLog()
@@ -0,0 +1,147 @@
+import os
+import sys
+import signal
+import threading
+import traceback
+from collections import defaultdict
+from datetime import datetime
+from time import sleep
+from timeit import default_timer
+from . import logger
+from .metrics import LOOP_LAG_SECONDS, LOOP_STALLS
+
+###############################################
+#            Loop Monitor Settings            #
+LAG_SAMPLE_INTERVAL = 0.1  # seconds between event loop heartbeats
+LOOP_STALL_THRESHOLD = 0.25  # seconds the loop may be blocked before the stall is reported
+STALL_STACK_DEPTH = 12
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+PROFILE_DURATION = 30.0  # seconds sampled after each profile signal
+
+_activity = (None, None)
+
+
+def set_activity(site, url=None):
+    """
+    Records what the event loop is working on so stalls can be attributed to a scraper and url. Called by the
+    scrapers on every step; it is a single assignment so it is cheap enough to leave on when monitoring is off.
+    """
+    global _activity
+    _activity = (site, url)
+
+
+class LoopMonitor:
+    """
+    Measures event loop lag with a heartbeat callback, and runs a watchdog thread that notices when the heartbeat
+    stops. When the loop is blocked longer than `threshold` the watchdog captures the loop thread's stack together
+    with the scraper site and url being processed, and the report is logged once the loop recovers with the total
+    time it was blocked.
+    """
+
+    def __init__(self, loop, interval=LAG_SAMPLE_INTERVAL, threshold=LOOP_STALL_THRESHOLD):
+        self.loop = loop
+        self.interval = interval
+        self.threshold = threshold
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._thread_id = None
+        self._expected = None
+        self._last_beat = None
+        self._stall = None
+        self._running = False
+
+    def start(self):
+        """Must be called from the thread that runs the loop"""
+        self._thread_id = threading.get_ident()
+        self._running = True
+        self._last_beat = default_timer()
+        self._expected = self.loop.time() + self.interval
+        self.loop.call_later(self.interval, self._beat)
+        threading.Thread(target=self._watch, name='loop-monitor', daemon=True).start()
+        return self
+
+    def stop(self):
+        self._running = False
+
+    def _beat(self):
+        now = self.loop.time()
+        lag = max(0.0, now - self._expected)
+        self._last_beat = default_timer()
+        LOOP_LAG_SECONDS.labels().observe(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if self._stall and lag > self.threshold:
+            site, url, stack = self._stall
+            logger.warning("Event loop blocked for {0:.3f}s while processing site: {1}, url: {2}\n{3}".format(
+                lag, site, url, stack))
+        self._stall = None
+        if self._running:
+            self._expected = now + self.interval
+            self.loop.call_later(self.interval, self._beat)
+
+    def _watch(self):
+        while self._running:
+            sleep(self.interval / 2)
+            blocked = default_timer() - self._last_beat - self.interval
+            if blocked > self.threshold and not self._stall:
+                site, url = _activity
+                frame = sys._current_frames().get(self._thread_id)
+                stack = ''.join(traceback.format_stack(frame, limit=STALL_STACK_DEPTH)) if frame else ''
+                self._stall = (site, url, stack)
+                self.stalls += 1
+                LOOP_STALLS.labels(site or 'unknown').inc()
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread at a fixed interval for a fixed duration and writes the samples in the folded
+    stack format ('outer;inner count' per line) read by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, thread_id, output_file, interval=PROFILE_SAMPLE_INTERVAL, duration=PROFILE_DURATION):
+        self.thread_id = thread_id
+        self.output_file = output_file
+        self.interval = interval
+        self.duration = duration
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        thread.start()
+        return thread
+
+    def _run(self):
+        samples = defaultdict(int)
+        end = default_timer() + self.duration
+        while default_timer() < end:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                samples[self._fold(frame)] += 1
+            sleep(self.interval)
+        with open(self.output_file, 'w') as f:
+            for stack, count in sorted(samples.items(), key=lambda item: -item[1]):
+                f.write('{0} {1}\n'.format(stack, count))
+        logger.info("Wrote sampling profile ({0} samples) to {1}".format(sum(samples.values()), self.output_file))
+
+    @staticmethod
+    def _fold(frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append('{0}:{1}:{2}'.format(os.path.basename(code.co_filename), code.co_name, code.co_firstlineno))
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+
+
+def install_profile_signal(directory, signum=signal.SIGUSR2, duration=PROFILE_DURATION):
+    """
+    Profiles the calling thread (the one running the event loop) for `duration` seconds each time the process
+    receives `signum`, e.g. `kill -USR2 <pid>`.
+    """
+    thread_id = threading.get_ident()
+
+    def _start_profile(received_signum, frame):
+        output_file = os.path.join(directory, 'profile_{0}_{1}.folded'.format(
+            os.getpid(), datetime.now().strftime('%Y_%m_%d_%H%M%S')))
+        logger.info("Starting {0}s sampling profile to {1}".format(duration, output_file))
+        SamplingProfiler(thread_id, output_file, duration=duration).start()
+
+    signal.signal(signum, _start_profile)
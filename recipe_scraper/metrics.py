@@ -0,0 +1,223 @@
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from time import sleep
+from . import logger
+
+###############################################
+#               Metric Settings               #
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+QUEUE_DEPTH_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 1000)
+TEXTFILE_WRITE_INTERVAL = 15.0  # seconds
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join('{0}="{1}"'.format(name, _escape(value)) for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class _HistogramChild:
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    """Base for labelled metrics. Children are created on first use of a label combination and never removed."""
+
+    metric_type = None
+
+    def __init__(self, name, documentation, labelnames=('site',)):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+
+    def labels(self, *values):
+        values = tuple(str(value) for value in values)
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError("{0} expects labels {1}".format(self.name, self.labelnames))
+            child = self._children[values] = self._new_child()
+        return child
+
+    def render(self):
+        lines = [
+            '# HELP {0} {1}'.format(self.name, self.documentation),
+            '# TYPE {0} {1}'.format(self.name, self.metric_type),
+        ]
+        for values, child in sorted(list(self._children.items())):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _render_child(self, values, child):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+
+    metric_type = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def _render_child(self, values, child):
+        yield '{0}{1} {2}'.format(self.name, _format_labels(self.labelnames, values), _format_value(child.value))
+
+    def totals(self):
+        """Current value of every label combination, keyed on the label values tuple"""
+        return {values: child.value for values, child in list(self._children.items())}
+
+
+class Histogram(_Metric):
+
+    metric_type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=('site',), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def _render_child(self, values, child):
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), list(child.counts)):
+            cumulative += count
+            yield '{0}_bucket{1} {2}'.format(
+                self.name, _format_labels(self.labelnames, values, ('le', _format_value(bound))), cumulative)
+        labels = _format_labels(self.labelnames, values)
+        yield '{0}_sum{1} {2}'.format(self.name, labels, _format_value(child.sum))
+        yield '{0}_count{1} {2}'.format(self.name, labels, child.count)
+
+
+class MetricsRegistry:
+    """
+    Holds the scraper metrics and renders them in the Prometheus text exposition format. Updates happen on the event
+    loop thread without locking; exposition (HTTP or textfile) runs on a daemon thread and reads a snapshot of each
+    metric, so a scrape may be a few observations behind but never blocks the scrapers.
+    """
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """Atomically writes the current metrics for the node exporter textfile collector"""
+        tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def start_textfile_writer(self, path, interval=TEXTFILE_WRITE_INTERVAL):
+        def _write_periodically():
+            while True:
+                try:
+                    self.write_textfile(path)
+                except OSError as e:
+                    logger.error("Error writing metrics textfile {0}: {1}".format(path, str(e)))
+                sleep(interval)
+        thread = threading.Thread(target=_write_periodically, name='metrics-textfile', daemon=True)
+        thread.start()
+        return thread
+
+    def start_http_server(self, port, host='127.0.0.1'):
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer((host, port), MetricsHandler)
+        thread = threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True)
+        thread.start()
+        return server
+
+
+METRICS = MetricsRegistry()
+REQUESTS = METRICS.register(Counter('scraper_requests_total', 'Requests made per site.'))
+RESPONSES = METRICS.register(Counter(
+    'scraper_responses_total', 'Responses per site and HTTP status (error for failed requests).', ('site', 'status')))
+RESPONSE_BYTES = METRICS.register(Counter('scraper_response_bytes_total', 'Response body bytes read per site.'))
+RECIPES_WRITTEN = METRICS.register(Counter('scraper_recipes_written_total', 'Recipes written per site.'))
+RECIPE_BYTES_WRITTEN = METRICS.register(Counter(
+    'scraper_recipe_bytes_written_total', 'Bytes of recipe JSON written to the data files per site.'))
+PARSE_FAILURES = METRICS.register(Counter(
+    'scraper_parse_failures_total', 'Pages that raised or yielded no recipe while parsing, per site.'))
+FETCH_SECONDS = METRICS.register(Histogram('scraper_fetch_seconds', 'Request latency per site.'))
+PARSE_SECONDS = METRICS.register(Histogram('scraper_parse_seconds', 'Soup construction and parsing time per site.'))
+WRITE_SECONDS = METRICS.register(Histogram('scraper_write_seconds', 'Time to hand a recipe to the writers per site.'))
+QUEUE_DEPTH = METRICS.register(Histogram(
+    'scraper_queue_depth', 'Urls waiting in the scraper queue, sampled every step.', buckets=QUEUE_DEPTH_BUCKETS))
+LOOP_LAG_SECONDS = METRICS.register(Histogram(
+    'scraper_loop_lag_seconds', 'Event loop heartbeat lag (only with the loop monitor enabled).', labelnames=()))
+LOOP_STALLS = METRICS.register(Counter(
+    'scraper_loop_stalls_total', 'Event loop stalls over the monitor threshold, by the site being processed.'))
+CIRCUIT_OPENED = METRICS.register(Counter(
+    'scraper_circuit_opened_total', 'Times the circuit breaker paused a site after repeated failures.'))
+ROBOTS_DISALLOWED = METRICS.register(Counter(
+    'scraper_robots_disallowed_total', 'Urls skipped without a request because robots.txt disallows them.'))
+DUPLICATES_SKIPPED = METRICS.register(Counter(
+    'scraper_duplicate_urls_skipped_total', 'Urls skipped without a request because their page was already fetched.'))
+CONTENT_HASH_LOOKUPS = METRICS.register(Counter(
+    'scraper_content_hash_lookups_total', 'Recipes checked against the content hash index before writing, by result '
+    '(hit: a duplicate that was not written).', ('site', 'result')))
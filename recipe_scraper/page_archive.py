@@ -0,0 +1,143 @@
+import os
+import gzip
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import time
+from . import logger
+
+###############################################
+#             Page Archive Settings           #
+ARCHIVE_SEGMENT_SIZE = 512 * 1024 * 1024  # compressed bytes per segment before rotating ( 512 MB )
+ARCHIVE_INDEX_FILE = 'index.tsv'
+ARCHIVE_SEGMENT_FORMAT = 'segment_{0:05d}.warc.gz'
+ARCHIVE_COMPRESS_LEVEL = 6
+
+
+class ArchivedPage:
+    """Location of a stored response body in the archive, one per line of the index file"""
+
+    __slots__ = ('url', 'fetched_at', 'digest', 'segment', 'offset', 'length', 'final_url', 'status')
+
+    def __init__(self, url, fetched_at, digest, segment, offset, length, final_url, status):
+        self.url = url
+        self.fetched_at = float(fetched_at)
+        self.digest = digest
+        self.segment = segment
+        self.offset = int(offset)
+        self.length = int(length)
+        self.final_url = final_url
+        self.status = int(status)
+
+    def to_line(self):
+        return '\t'.join(str(getattr(self, field)) for field in self.__slots__) + '\n'
+
+    @classmethod
+    def from_line(cls, line):
+        return cls(*line.rstrip('\n').split('\t'))
+
+
+class PageArchive:
+    """
+    Content addressed archive of raw responses so pages can be re-parsed from disk after a parser fix instead of
+    being re-crawled. Each body is stored once per sha1 digest as a gzip member holding a WARC-like record, appended
+    to rotating segment files. The index file maps every (url, fetch time) to the (segment, offset, length) of its
+    body, so repeated fetches of identical pages only cost an index line. All disk work happens on a dedicated writer
+    thread; `store` only hands the body over.
+    """
+
+    def __init__(self, directory, segment_size=ARCHIVE_SEGMENT_SIZE):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.index_file = os.path.join(directory, ARCHIVE_INDEX_FILE)
+        self.stored = 0
+        self.duplicates = 0
+        self._digests = {}
+        self._segment_number = 1
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        for page in self.iter_index():
+            self._digests[page.digest] = page
+            self._segment_number = max(self._segment_number, int(page.segment.split('_')[1].split('.')[0]))
+
+    def store(self, url, final_url, status, body, fetched_at=None):
+        """
+        Queues a raw response for archiving, safe to call from the event loop.
+        :param url: requested url
+        :param final_url: url after redirects
+        :param status: HTTP status code
+        :param body: raw response bytes
+        :param fetched_at: unix timestamp of the fetch, defaults to now
+        """
+        self._executor.submit(self._store, str(url), str(final_url), status, body, fetched_at or time())
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def iter_index(self):
+        """Yields an ArchivedPage for every archived fetch in the order they were made"""
+        if os.path.isfile(self.index_file):
+            with open(self.index_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        yield ArchivedPage.from_line(line)
+
+    def iter_pages(self):
+        """Yields (ArchivedPage, body) for the latest fetch of every archived url"""
+        latest = {}
+        for page in self.iter_index():
+            latest[page.url] = page
+        for page in latest.values():
+            yield page, self.read(page)
+
+    def read(self, page):
+        """
+        Reads the raw body of an archived page
+        :param page: ArchivedPage from the index
+        :return: response body bytes
+        """
+        with open(os.path.join(self.directory, page.segment), 'rb') as f:
+            f.seek(page.offset)
+            record = gzip.decompress(f.read(page.length))
+        return record.split(b'\r\n\r\n', 1)[1]
+
+    def _store(self, url, final_url, status, body, fetched_at):
+        try:
+            digest = hashlib.sha1(body).hexdigest()
+            original = self._digests.get(digest)
+            if original:
+                self.duplicates += 1
+                segment, offset, length = original.segment, original.offset, original.length
+            else:
+                segment, offset, length = self._append_record(url, final_url, status, body, fetched_at, digest)
+                self.stored += 1
+            page = ArchivedPage(url, fetched_at, digest, segment, offset, length, final_url, status)
+            self._digests.setdefault(digest, page)
+            with open(self.index_file, 'a') as f:
+                f.write(page.to_line())
+        except OSError as e:
+            logger.error("Error archiving page {0}: {1}".format(url, str(e)))
+
+    def _append_record(self, url, final_url, status, body, fetched_at, digest):
+        segment = ARCHIVE_SEGMENT_FORMAT.format(self._segment_number)
+        segment_file = os.path.join(self.directory, segment)
+        if os.path.isfile(segment_file) and os.stat(segment_file).st_size > self.segment_size:
+            self._segment_number += 1
+            segment = ARCHIVE_SEGMENT_FORMAT.format(self._segment_number)
+            segment_file = os.path.join(self.directory, segment)
+        header = '\r\n'.join([
+            'WARC/1.0',
+            'WARC-Type: response',
+            'WARC-Target-URI: {0}'.format(url),
+            'WARC-Date: {0}'.format(datetime.utcfromtimestamp(fetched_at).strftime('%Y-%m-%dT%H:%M:%SZ')),
+            'WARC-Payload-Digest: sha1:{0}'.format(digest),
+            'X-Final-URI: {0}'.format(final_url),
+            'X-Status: {0}'.format(status),
+            'Content-Length: {0}'.format(len(body)),
+        ]).encode('utf-8')
+        record = gzip.compress(header + b'\r\n\r\n' + body, compresslevel=ARCHIVE_COMPRESS_LEVEL)
+        with open(segment_file, 'ab') as f:
+            offset = f.tell()
+            f.write(record)
+        return segment, offset, len(record)
@@ -1,10 +1,8 @@
-import re
 import json
 from abc import ABCMeta, abstractmethod
 from itertools import chain
-
-HTML_TAG_PATTERN = r'<.*?>'
-WHITESPACE_PATTERN = r'([\s\t\n\r]){2,}'
+from .text_cleaning import clean_text, clean_texts
+from .records import RecipeRecord
 
 
 class Parser:
@@ -36,20 +34,19 @@ class HRecipeParser(Parser):
         """
         Parses HTML that conforms to the HRecipe format
         :param soup: the raw html data
-        :return: structures json of the parsed data in the data collection format
+        :return: RecipeRecord of the parsed data in the data collection format
         """
-        data = {
-            'title': self._find_title(soup),
-            'ingredients': self._find_ingredients(soup),
-            'instructions': self._find_instructions(soup),
-            'time': {
+        return RecipeRecord(
+            title=clean_text(self._find_title(soup)),
+            ingredients=self._find_ingredients(soup),
+            instructions=self._find_instructions(soup),
+            time={
                 'prepTime': self._find_preparation_time(soup),
                 'cookTime': self._find_cook_time(soup),
             },
-            'yield': self._find_yield(soup),
-            'reviews': self._find_reviews(soup),
-        }
-        return data
+            recipe_yield=clean_text(self._find_yield(soup)),
+            reviews=self._find_reviews(soup),
+        )
 
     def _find_title(self, soup):
         # TODO make more general for meta only tags if necessary
@@ -67,7 +64,7 @@ class HRecipeParser(Parser):
             soup.select('[itemprop="ingredients"]'),  # allrecipes
             soup.select('[itemprop="ingredient"]')  # epicurious, foodnetwork
         ))
-        return [self._clean_text_and_html_tags(tag.text) for tag in ingredient_tags]
+        return clean_texts([tag.text for tag in ingredient_tags])
 
     def _find_instructions(self, soup):
         instruction_tags = []
@@ -75,7 +72,7 @@ class HRecipeParser(Parser):
             soup.select('[itemprop="recipeDirections"]'),  # epicurious, foodnetwork
             soup.select('[itemprop="recipeInstructions"]'),  # allrecipes
         ))
-        return [self._clean_text_and_html_tags(tag.text) if tag.text else tag for tag in instruction_tags]
+        return clean_texts([tag.text for tag in instruction_tags])
 
     def _find_preparation_time(self, soup):
         preparation_tags = []
@@ -143,7 +140,7 @@ class HRecipeParser(Parser):
         if not ratings:
             ratings = self._find_foodnetwork_ratings(soup)
         return {
-            'text': [self._clean_text_and_html_tags(tag.text) for tag in texts_tags],
+            'text': clean_texts([tag.text for tag in texts_tags]),
             'ratings': ratings,
         }
 
@@ -172,12 +169,6 @@ class HRecipeParser(Parser):
                     return value
         return
 
-    @staticmethod
-    def _clean_text_and_html_tags(text):
-        return re.sub(HTML_TAG_PATTERN, '',
-                      re.sub(WHITESPACE_PATTERN, '\n', text)
-                      )
-
 
 class JsonLdParser(Parser):
 
@@ -210,20 +201,21 @@ class JsonLdParser(Parser):
             return
 
     def _get_recipe_data(self, recipe_data):
-        return {
-            'title': recipe_data.get('name'),
-            'ingredients': self._get_data_from_list_or_string(recipe_data.get('recipeIngredient'), ','),
-            'instructions': self._get_data_from_list_or_string(recipe_data.get('recipeInstructions'), '.'),
-            'time': {
+        return RecipeRecord(
+            title=clean_text(recipe_data.get('name')),
+            ingredients=clean_texts(self._get_data_from_list_or_string(recipe_data.get('recipeIngredient'), ',')),
+            instructions=clean_texts(
+                self._get_data_from_list_or_string(recipe_data.get('recipeInstructions'), '.')),
+            time={
                 'prepTime': recipe_data.get('prepTime'),
                 'cookTime': recipe_data.get('cookTime'),
             },
-            'yield': recipe_data.get('recipeYield'),
-            'reviews': {
+            recipe_yield=clean_text(recipe_data.get('recipeYield')),
+            reviews={
                 'text': [],
                 'ratings': self._get_ratings_data(recipe_data.get('aggregateRating'))
             },
-        }
+        )
 
     @staticmethod
     def _get_ratings_data(data):
@@ -0,0 +1,127 @@
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer
+from time import time
+from . import logger
+from .urls import canonical_url, site_from_url
+from .records import recipe_json
+
+###############################################
+#             SQLite Store Settings           #
+STORE_BATCH_SIZE = 500  # recipes per transaction
+STORE_FLUSH_INTERVAL = 5.0  # seconds a partial batch may wait before being written
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS recipes (
+    url TEXT PRIMARY KEY,
+    site TEXT,
+    title TEXT,
+    fetched_at REAL,
+    data TEXT
+)
+"""
+# every column is written, so replacing the row is an upsert that also works before SQLite 3.24 (no ON CONFLICT)
+UPSERT_SQL = """
+INSERT OR REPLACE INTO recipes (url, site, title, fetched_at, data) VALUES (?, ?, ?, ?, ?)
+"""
+INDEXES = {
+    'recipes_site_idx': 'CREATE INDEX IF NOT EXISTS recipes_site_idx ON recipes (site)',
+    'recipes_fetched_at_idx': 'CREATE INDEX IF NOT EXISTS recipes_fetched_at_idx ON recipes (fetched_at)',
+}
+
+
+class SQLiteRecipeStore:
+    """
+    Optional output sink that keeps the latest version of each recipe in a SQLite database keyed on canonical url.
+    Recipes are buffered by `add` (cheap enough to call from the event loop) and written in batches, one transaction
+    per batch, on a dedicated writer thread which owns the connection. When `bulk_load` is set the secondary indexes
+    are dropped on open and rebuilt once on `close`, which is much faster than maintaining them row by row; this is
+    meant for one-off loads like a re-parse, not a crawl whose store is queried while it runs. Otherwise the indexes
+    are created on open, also restoring them after a bulk load that never reached `close`.
+    """
+
+    def __init__(self, db_file, batch_size=STORE_BATCH_SIZE, flush_interval=STORE_FLUSH_INTERVAL, bulk_load=False):
+        self.db_file = db_file
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.bulk_load = bulk_load
+        self.written = 0
+        self._buffer = []
+        self._last_flush = default_timer()
+        self._connection = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._executor.submit(self._open).result()
+
+    def add(self, data, fetched_at=None):
+        """
+        Queues a parsed recipe for writing. Never blocks on disk I/O.
+        :param data: parsed RecipeRecord or recipe dict with at least a 'url' key
+        :param fetched_at: unix timestamp of the fetch, defaults to now
+        """
+        url = canonical_url(data['url'])
+        self._buffer.append((url, site_from_url(url), data.get('title'), fetched_at or time(), data))
+        if len(self._buffer) >= self.batch_size or default_timer() - self._last_flush > self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Hands the current buffer to the writer thread"""
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._executor.submit(self._write_batch, batch).add_done_callback(self._log_failure)
+        self._last_flush = default_timer()
+
+    def close(self):
+        """Writes any buffered recipes, builds the indexes and closes the database"""
+        self.flush()
+        self._executor.submit(self._close).result()
+        self._executor.shutdown(wait=True)
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+    def get(self, url):
+        """Returns the latest stored version of a recipe, including recipes still buffered for writing, or None"""
+        url = canonical_url(url)
+        for buffered_url, _, _, _, data in reversed(self._buffer):
+            if buffered_url == url:
+                return json.loads(recipe_json(data))
+        return self._executor.submit(self._get, url).result()
+
+    def _open(self):
+        self._connection = sqlite3.connect(self.db_file, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(CREATE_TABLE_SQL)
+        if self.bulk_load:
+            for index in INDEXES:
+                self._connection.execute('DROP INDEX IF EXISTS {0}'.format(index))
+        else:
+            for statement in INDEXES.values():
+                self._connection.execute(statement)
+
+    def _write_batch(self, batch):
+        try:
+            rows = [(url, site, title, fetched_at, recipe_json(data)) for url, site, title, fetched_at, data in batch]
+            self._connection.execute('BEGIN')
+            self._connection.executemany(UPSERT_SQL, rows)
+            self._connection.execute('COMMIT')
+            self.written += len(rows)
+        except Exception as e:
+            if self._connection.in_transaction:
+                self._connection.execute('ROLLBACK')
+            logger.error("Error writing {0} recipes to store {1}: {2}".format(len(batch), self.db_file, str(e)))
+
+    def _log_failure(self, future):
+        # _write_batch logs its own errors, this catches anything raised around it, e.g. while rolling back
+        if future.exception():
+            logger.error("Error in the writer thread of store {0}: {1}".format(self.db_file, str(future.exception())))
+
+    def _get(self, url):
+        row = self._connection.execute('SELECT data FROM recipes WHERE url = ?', (url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _close(self):
+        for statement in INDEXES.values():
+            self._connection.execute(statement)
+        self._connection.close()
@@ -0,0 +1,114 @@
+import json
+
+###############################################
+#             Recipe Record Fields            #
+# data file key -> attribute, in the key order of the written JSON
+RECORD_FIELDS = (
+    ('title', 'title'),
+    ('ingredients', 'ingredients'),
+    ('instructions', 'instructions'),
+    ('time', 'time'),
+    ('yield', 'recipe_yield'),
+    ('reviews', 'reviews'),
+    ('url', 'url'),
+    ('parsed_ingredients', 'parsed_ingredients'),
+)
+OPTIONAL_KEYS = frozenset(['parsed_ingredients'])  # left out of the record's keys and JSON while None
+
+_ATTRIBUTES = dict(RECORD_FIELDS)
+_encode = json.JSONEncoder().encode  # the encoder json.dumps uses with default arguments
+
+
+class RecipeRecord:
+    """
+    A parsed recipe. Parsers fill one record per page instead of a dict; it reads like the recipe dict of the data
+    files (`record['title']`, `record.get('url')`, `record['parsed_ingredients'] = ...`) for the code written against
+    dicts, but keeps its fields in slots. `to_json` serializes it once, in the data file format, and the result is
+    kept on the record and reused for the data file, the console echo, the recipe store and the metrics. Setting any
+    field drops the cached JSON.
+    """
+
+    __slots__ = tuple(attribute for _, attribute in RECORD_FIELDS) + ('_json',)
+
+    def __init__(self, title=None, ingredients=None, instructions=None, time=None, recipe_yield=None, reviews=None,
+                 url=None, parsed_ingredients=None):
+        self.title = title
+        self.ingredients = ingredients
+        self.instructions = instructions
+        self.time = time
+        self.recipe_yield = recipe_yield
+        self.reviews = reviews
+        self.url = url
+        self.parsed_ingredients = parsed_ingredients
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != '_json':
+            object.__setattr__(self, '_json', None)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, _ATTRIBUTES[key])
+        except KeyError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, _ATTRIBUTES[key], value)
+        except KeyError:
+            raise KeyError("RecipeRecord has no field {0}".format(key))
+
+    def __contains__(self, key):
+        return key in _ATTRIBUTES and (key not in OPTIONAL_KEYS or self[key] is not None)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, (RecipeRecord, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'RecipeRecord(url={0!r}, title={1!r})'.format(self.url, self.title)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def keys(self):
+        return [key for key, _ in RECORD_FIELDS if key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        data = {
+            'title': self.title,
+            'ingredients': self.ingredients,
+            'instructions': self.instructions,
+            'time': self.time,
+            'yield': self.recipe_yield,
+            'reviews': self.reviews,
+            'url': self.url,
+        }
+        if self.parsed_ingredients is not None:
+            data['parsed_ingredients'] = self.parsed_ingredients
+        return data
+
+    def to_json(self):
+        """:return: the record as a JSON object string, the same as json.dumps of its dict, serialized only once"""
+        if self._json is None:
+            # one encode call of a throwaway dict is faster than encoding the fields separately and joining them
+            object.__setattr__(self, '_json', _encode(self.to_dict()))
+        return self._json
+
+
+def recipe_json(data):
+    """:return: JSON of a parsed recipe, the cached serialization of a RecipeRecord or json.dumps of a dict"""
+    if isinstance(data, RecipeRecord):
+        return data.to_json()
+    return json.dumps(data)
@@ -0,0 +1,143 @@
+import os
+import json
+import random
+from heapq import heappush, heappop
+from time import time
+from . import settings, init, logger
+
+###############################################
+#               Retry Settings                #
+MAX_ATTEMPTS = 5  # requests of a url before it is dead-lettered
+RETRY_BASE_DELAY = 5.0  # seconds before the first retry, doubled for every further attempt
+RETRY_MAX_DELAY = 30 * 60.0
+RETRYABLE_STATUSES = frozenset([408, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524])
+
+
+class RetryPolicy:
+
+    __slots__ = ('max_attempts', 'base_delay', 'max_delay')
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempts):
+        """Exponential backoff with equal jitter: half the backoff plus a random share of the other half"""
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class DeadLetterFile:
+    """
+    Urls that failed every attempt, one JSON object per line with the site, url, attempts and last error. `drain`
+    hands the entries back for a bulk replay through the scrapers and starts a new file.
+    """
+
+    def __init__(self, file_name=None):
+        self._file_name = file_name
+
+    @property
+    def file_name(self):
+        """Defaults to dead_letters.jsonl (dead_letters.<segment>.jsonl for worker processes) in the log directory"""
+        return self._file_name or settings.dead_letter_file
+
+    def add(self, site, url, attempts, error):
+        if not self._file_name:
+            init()
+        record = {'ts': round(time(), 3), 'site': site, 'url': str(url), 'attempts': attempts, 'error': error}
+        with open(self.file_name, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def iter_entries(self):
+        if not os.path.isfile(self.file_name):
+            return
+        with open(self.file_name, 'r') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    pass
+
+    def drain(self):
+        """
+        Moves the file aside (to <file>.replayed) and returns its entries, so urls that fail again are written to a
+        fresh file
+        """
+        if not os.path.isfile(self.file_name):
+            return []
+        entries = list(self.iter_entries())
+        os.replace(self.file_name, self.file_name + '.replayed')
+        return entries
+
+
+class RetryScheduler:
+    """
+    Delayed retries of failed requests. Failed urls wait in a per site heap ordered on their due time rather than in
+    sleeping coroutines, so a waiting retry never holds up a scraper; scrapers take due urls with `pop_due` before
+    taking new ones from their queue. Backoff grows exponentially with jitter per attempt, using the site's
+    RetryPolicy, and a url that failed `max_attempts` times goes to the dead-letter file.
+    """
+
+    def __init__(self, dead_letters=None, policy=None, site_policies=None):
+        """
+        :param dead_letters: DeadLetterFile for urls out of attempts, defaults to the one in the log directory
+        :param policy: default RetryPolicy
+        :param site_policies: dict of site -> RetryPolicy overriding the default
+        """
+        self.dead_letters = dead_letters or DeadLetterFile()
+        self.policy = policy or RetryPolicy()
+        self.site_policies = site_policies or {}
+        self._heaps = {}
+        self._attempts = {}  # url -> failed attempts, only for urls currently failing
+        self._sequence = 0
+
+    def schedule(self, site, url, error):
+        """
+        Records a failed request of url
+        :return: True if it was scheduled for a retry, False if it was dead-lettered
+        """
+        url = str(url)
+        policy = self.site_policies.get(site, self.policy)
+        attempts = self._attempts.get(url, 0) + 1
+        if attempts >= policy.max_attempts:
+            self._attempts.pop(url, None)
+            logger.error("Giving up on {0} after {1} attempts: {2}".format(url, attempts, error))
+            self.dead_letters.add(site, url, attempts, error)
+            return False
+        self._attempts[url] = attempts
+        self._push(site, url, time() + policy.delay(attempts))
+        return True
+
+    def pop_due(self, site, now=None):
+        """:return: a url of the site whose retry is due, or None"""
+        heap = self._heaps.get(site)
+        if heap and heap[0][0] <= (now or time()):
+            return heappop(heap)[2]
+        return None
+
+    def finished(self, url):
+        """Forgets the failed attempts of url once it had a final outcome: fetched, or a response not worth retrying"""
+        self._attempts.pop(str(url), None)
+
+    def pending(self, site):
+        """:return: list of [url, attempts, seconds until due] of the site's waiting retries, for checkpoints"""
+        now = time()
+        return [[url, self._attempts.get(url, 0), max(0.0, round(due - now, 3))]
+                for due, _, url in sorted(self._heaps.get(site, []))]
+
+    def restore(self, site, pending):
+        """Reschedules retries saved by `pending`"""
+        now = time()
+        for url, attempts, due_in in pending:
+            self._attempts[url] = attempts
+            self._push(site, url, now + due_in)
+
+    @property
+    def waiting(self):
+        """Number of retries waiting over all sites"""
+        return sum(len(heap) for heap in self._heaps.values())
+
+    def _push(self, site, url, due):
+        self._sequence += 1
+        heappush(self._heaps.setdefault(site, []), (due, self._sequence, url))
@@ -0,0 +1,175 @@
+import re
+from asyncio import ensure_future, wait_for
+from time import time
+from urllib.parse import urlsplit
+from aiohttp import ClientSession, TCPConnector
+from . import logger
+
+###############################################
+#              Robots.txt Settings            #
+ROBOTS_USER_AGENT = '*'  # product token matched against robots.txt user-agent groups
+ROBOTS_TTL = 24 * 60 * 60.0  # seconds a fetched robots.txt is trusted
+ROBOTS_ERROR_TTL = 10 * 60.0  # seconds before retrying a robots.txt that could not be fetched
+ROBOTS_FETCH_TIMEOUT = 30.0
+
+
+def _rule_pattern(path):
+    """Compiles a robots.txt path pattern, supporting the '*' wildcard and the '$' end anchor"""
+    anchored = path.endswith('$')
+    pattern = re.escape(path[:-1] if anchored else path).replace(r'\*', '.*')
+    return re.compile(pattern + ('$' if anchored else ''))
+
+
+class RobotsPolicy:
+    """
+    The rules of one robots.txt for our user agent: allow/deny checks (longest matching rule wins, allow wins ties),
+    the crawl delay in seconds (Crawl-delay, or Request-rate converted to a delay) and the sitemaps it lists. Parsing
+    keeps the case of paths and sitemap urls. A policy standing in for a robots.txt that could not be fetched is
+    not `available` and disallows everything until it expires.
+    """
+
+    __slots__ = ('rules', 'crawl_delay', 'sitemaps', 'expires_at', 'available')
+
+    def __init__(self, rules=(), crawl_delay=None, sitemaps=(), ttl=ROBOTS_TTL, available=True):
+        self.rules = list(rules)  # (pattern length, allow, compiled pattern)
+        self.crawl_delay = crawl_delay
+        self.sitemaps = list(sitemaps)
+        self.expires_at = time() + ttl
+        self.available = available
+
+    @classmethod
+    def parse(cls, text, user_agent=ROBOTS_USER_AGENT, ttl=ROBOTS_TTL):
+        groups, sitemaps = [], []  # groups: (user agents, [(field, value)])
+        for line in text.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            field, value = line.split(':', 1)
+            field, value = field.strip().lower(), value.strip()
+            if field == 'sitemap':
+                if value:
+                    sitemaps.append(value)
+            elif field == 'user-agent':
+                if not groups or groups[-1][1]:  # a user-agent line after rules starts a new group
+                    groups.append(([], []))
+                groups[-1][0].append(value.lower())
+            elif field in ('allow', 'disallow', 'crawl-delay', 'request-rate') and groups:
+                groups[-1][1].append((field, value))
+        lines = cls._group_for(groups, user_agent.lower())
+        rules, crawl_delay = [], None
+        for field, value in lines:
+            if field in ('allow', 'disallow'):
+                if value:  # an empty Disallow allows everything
+                    rules.append((len(value), field == 'allow', _rule_pattern(value)))
+            else:
+                try:
+                    if field == 'crawl-delay':
+                        delay = float(value)
+                    else:
+                        requests, seconds = value.split('/')
+                        delay = float(seconds.rstrip('smh')) / int(requests)
+                    crawl_delay = max(crawl_delay or 0.0, delay)
+                except (ValueError, ZeroDivisionError):
+                    pass
+        return cls(rules, crawl_delay, sitemaps, ttl)
+
+    @staticmethod
+    def _group_for(groups, user_agent):
+        # every group naming the same agents is merged; a group naming our token beats the '*' group
+        named, wildcard = [], []
+        for agents, lines in groups:
+            if user_agent != '*' and any(agent != '*' and agent in user_agent for agent in agents):
+                named.extend(lines)
+            elif '*' in agents:
+                wildcard.extend(lines)
+        return named or wildcard
+
+    @classmethod
+    def allow_all(cls, ttl=ROBOTS_TTL):
+        return cls(ttl=ttl)
+
+    @classmethod
+    def unavailable(cls, ttl=ROBOTS_ERROR_TTL):
+        return cls([(1, False, _rule_pattern('/'))], ttl=ttl, available=False)
+
+    @property
+    def expired(self):
+        return time() >= self.expires_at
+
+    def allowed(self, url):
+        parts = urlsplit(str(url))
+        path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+        if path == '/robots.txt':
+            return True
+        best_length, best_allow = -1, True
+        for length, allow, pattern in self.rules:
+            if (length > best_length or (length == best_length and allow)) and pattern.match(path):
+                best_length, best_allow = length, allow
+        return best_allow
+
+
+class RobotsCache:
+    """
+    Robots policy per host, fetched on first use and refreshed after its TTL. Concurrent lookups of a host share
+    one fetch. Following RFC 9309 a missing robots.txt (4xx) allows everything, while a server error or network
+    failure disallows the host until the fetch is retried after ROBOTS_ERROR_TTL.
+    """
+
+    def __init__(self, user_agent=ROBOTS_USER_AGENT, ttl=ROBOTS_TTL):
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self._policies = {}
+        self._fetches = {}
+
+    async def policy_for(self, url, user_agent=None):
+        """
+        :param url: url whose host's policy is returned
+        :param user_agent: User-Agent header of the robots.txt request, the scraper's own so the host sees one client;
+            defaults to a random agent
+        :return: the RobotsPolicy of the url's host
+        """
+        parts = urlsplit(str(url))
+        host = '{0}://{1}'.format(parts.scheme or 'http', parts.netloc.lower())
+        policy = self._policies.get(host)
+        if policy is not None and not policy.expired:
+            return policy
+        fetch = self._fetches.get(host)
+        if fetch is None:
+            if user_agent is None:
+                from .tools import get_agent  # the sitemap downloaders in tools use this module
+                user_agent = get_agent()
+            fetch = self._fetches[host] = ensure_future(self._fetch(host + '/robots.txt', user_agent))
+        try:
+            policy = await fetch
+        finally:
+            self._fetches.pop(host, None)
+        self._policies[host] = policy
+        return policy
+
+    def cached(self, url):
+        """:return: the cached RobotsPolicy of the url's host, or None"""
+        parts = urlsplit(str(url))
+        return self._policies.get('{0}://{1}'.format(parts.scheme or 'http', parts.netloc.lower()))
+
+    async def _fetch(self, robots_url, user_agent):
+        try:
+            conn = TCPConnector(verify_ssl=False)
+            async with ClientSession(connector=conn) as client:
+                response = await wait_for(client.get(robots_url, headers={"User-Agent": user_agent}),
+                                          ROBOTS_FETCH_TIMEOUT)
+                try:
+                    if response.status == 200:
+                        text = (await wait_for(response.read(), ROBOTS_FETCH_TIMEOUT)).decode('utf-8', 'replace')
+                        return RobotsPolicy.parse(text, self.user_agent, self.ttl)
+                    if 400 <= response.status < 500:
+                        return RobotsPolicy.allow_all(self.ttl)
+                    logger.error("robots.txt {0} returned {1}, disallowing the host for now".format(
+                        robots_url, response.status))
+                finally:
+                    response.release()
+        except Exception as e:
+            logger.error("Error fetching robots.txt {0}, disallowing the host for now: {1}".format(robots_url, str(e)))
+        return RobotsPolicy.unavailable()
+
+
+ROBOTS = RobotsCache()
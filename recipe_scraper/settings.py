@@ -0,0 +1,138 @@
+import os
+from .exceptions import ScraperSettingsError
+
+###############################################
+#             Data Storage Settings           #
+EATERATOR_ENV_VARIABLE = 'EATERATOR_DATA_SCRAPING_PATH'
+DEFAULT_MAX_FILES_PER_DAY = 100
+DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024  # Size in megabytes ( 10 MB )
+DATA_SEGMENT_ENV_VARIABLE = 'EATERATOR_DATA_SEGMENT'
+
+###############################################
+#              Logging Config                 #
+LOG_DIRECTORY = 'log'
+LOG_FILE_NAME = 'log.txt'
+FETCH_LOG_FILE_NAME = 'fetch.jsonl'
+FETCH_LOG_SEGMENT_FORMAT = 'fetch.{0}.jsonl'
+DEAD_LETTER_FILE_NAME = 'dead_letters.jsonl'
+DEAD_LETTER_SEGMENT_FORMAT = 'dead_letters.{0}.jsonl'
+REDIRECT_MAP_FILE_NAME = 'redirects.jsonl'
+REDIRECT_MAP_SEGMENT_FORMAT = 'redirects.{0}.jsonl'
+CONTENT_INDEX_FILE_NAME = 'content_hashes.db'
+LOG_FORMAT = '%(asctime)4s| %(levelname)4s| %(name)4s| %(message)s'
+SITEMAP_DIRECTORY = 'sitemaps'
+
+
+class Settings:
+    """
+    Package configuration. Values are read from the environment the first time they are used rather than at import,
+    and can be set explicitly with `configure`, so importing the package has no side effects. Nothing on disk is
+    touched here; `recipe_scraper.init` creates the directories and configures logging.
+    """
+
+    def __init__(self):
+        self._data_path = None
+        self._max_daily_files = None
+        self._max_file_size = None
+        self._data_segment = None
+
+    def configure(self, data_path=None, max_daily_files=None, max_file_size=None, data_segment=None):
+        """Overrides the environment for any of the given values"""
+        if data_path is not None:
+            self._data_path = data_path
+        if max_daily_files is not None:
+            self._max_daily_files = int(max_daily_files)
+        if max_file_size is not None:
+            self._max_file_size = int(max_file_size)
+        if data_segment is not None:
+            self._data_segment = data_segment
+        return self
+
+    @property
+    def data_path(self):
+        """root directory in which scraped data is stored"""
+        if self._data_path is None:
+            try:
+                self._data_path = os.environ[EATERATOR_ENV_VARIABLE]
+            except KeyError:
+                raise ScraperSettingsError(
+                    "Please specify a data path ENV variable '{0}' to use recipe_scraper".format(EATERATOR_ENV_VARIABLE))
+        return self._data_path
+
+    @property
+    def max_daily_files(self):
+        if self._max_daily_files is None:
+            self._max_daily_files = int(os.environ.get('MAX_DAILY_FILES', DEFAULT_MAX_FILES_PER_DAY))
+        return self._max_daily_files
+
+    @property
+    def max_file_size(self):
+        if self._max_file_size is None:
+            self._max_file_size = int(os.environ.get('MAX_FILE_SIZE', DEFAULT_MAX_FILE_SIZE))
+        return self._max_file_size
+
+    @property
+    def data_segment(self):
+        """
+        Name of this process' output segment, '' for a single process crawl. Worker processes of the sharded launcher
+        each get their own segment so they never append to the same data or fetch log file.
+        """
+        if self._data_segment is None:
+            self._data_segment = os.environ.get(DATA_SEGMENT_ENV_VARIABLE, '')
+        return self._data_segment
+
+    @property
+    def log_path(self):
+        return os.path.join(self.data_path, LOG_DIRECTORY)
+
+    @property
+    def logging_file(self):
+        return os.path.join(self.log_path, LOG_FILE_NAME)
+
+    @property
+    def fetch_log_file(self):
+        if self.data_segment:
+            return os.path.join(self.log_path, FETCH_LOG_SEGMENT_FORMAT.format(self.data_segment))
+        return os.path.join(self.log_path, FETCH_LOG_FILE_NAME)
+
+    @property
+    def fetch_log_files(self):
+        """Fetch logs of every segment, for tools reading the whole crawl history"""
+        if not os.path.isdir(self.log_path):
+            return []
+        names = [name for name in os.listdir(self.log_path)
+                 if name == FETCH_LOG_FILE_NAME or (name.startswith('fetch.') and name.endswith('.jsonl'))]
+        return [os.path.join(self.log_path, name) for name in sorted(names)]
+
+    @property
+    def dead_letter_file(self):
+        if self.data_segment:
+            return os.path.join(self.log_path, DEAD_LETTER_SEGMENT_FORMAT.format(self.data_segment))
+        return os.path.join(self.log_path, DEAD_LETTER_FILE_NAME)
+
+    @property
+    def redirect_map_file(self):
+        if self.data_segment:
+            return os.path.join(self.log_path, REDIRECT_MAP_SEGMENT_FORMAT.format(self.data_segment))
+        return os.path.join(self.log_path, REDIRECT_MAP_FILE_NAME)
+
+    @property
+    def redirect_map_files(self):
+        """Redirect maps of every segment"""
+        if not os.path.isdir(self.log_path):
+            return []
+        names = [name for name in os.listdir(self.log_path)
+                 if name == REDIRECT_MAP_FILE_NAME or (name.startswith('redirects.') and name.endswith('.jsonl'))]
+        return [os.path.join(self.log_path, name) for name in sorted(names)]
+
+    @property
+    def content_index_file(self):
+        """Content hash index of written recipes, shared by every segment"""
+        return os.path.join(self.log_path, CONTENT_INDEX_FILE_NAME)
+
+    @property
+    def sitemap_path(self):
+        return os.path.join(self.data_path, SITEMAP_DIRECTORY)
+
+
+settings = Settings()
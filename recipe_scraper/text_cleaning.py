@@ -0,0 +1,52 @@
+import re
+from html import unescape
+from unicodedata import normalize
+
+###############################################
+#            Text Cleaning Settings           #
+UNICODE_FORM = 'NFC'  # composes accents without the compatibility folding of NFKC, which turns '1½' into '11⁄2'
+
+# markup left in a string after entity decoding, e.g. the escaped '&lt;p&gt;' in JSON-LD instructions
+TAG_PATTERN = re.compile(r'<[^<>]*>')
+# zero width and control characters are dropped; tabs and line breaks are whitespace and collapse with it
+INVISIBLE_CHARACTERS = dict.fromkeys(
+    [code for code in range(32) if chr(code) not in '\t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'] +
+    [0x7f, 0xad, 0x200b, 0x200c, 0x200d, 0x2060, 0xfeff])
+
+
+def clean_text(text):
+    """
+    Cleans one scraped string: decodes HTML entities, drops markup and invisible characters, collapses whitespace
+    runs to single spaces, strips the ends and applies NFC unicode normalization
+    :return: the cleaned string, values that are not strings are returned unchanged
+    """
+    if not isinstance(text, str):
+        return text
+    if '&' in text:
+        text = unescape(text)
+    if '<' in text:
+        text = TAG_PATTERN.sub(' ', text)
+    # str.split without a separator splits on every unicode whitespace run and drops the ends in C, several times
+    # faster than an equivalent regex substitution
+    return normalize(UNICODE_FORM, ' '.join(text.translate(INVISIBLE_CHARACTERS).split()))
+
+
+def clean_texts(values):
+    """
+    Cleans a whole field list (ingredients, instructions, review texts) with `clean_text`
+    :param values: list of strings, a single string, or JSON-LD entries like HowToStep dicts whose 'text' is cleaned
+    :return: new list of the cleaned values, leaving out those that are empty once cleaned
+    """
+    if values is None:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    cleaned = []
+    for value in values:
+        if isinstance(value, dict) and 'text' in value:
+            value = dict(value, text=clean_text(value['text']))
+        else:
+            value = clean_text(value)
+        if value:
+            cleaned.append(value)
+    return cleaned
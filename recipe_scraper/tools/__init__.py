@@ -1,19 +1,23 @@
 import os
-from random import choice
+from recipe_scraper import settings, init
 from .sitemap_downloader import SiteMapDownloader
-from .user_agent import headers
+from .user_agent import get_agent, reset_agent
 
-sitemap_dir = os.path.join(
-    os.environ["EATERATOR_DATA_SCRAPING_PATH"],
-    'sitemaps'
-)
-try:
-    os.mkdir(sitemap_dir)
-except OSError:
-    pass
-SiteMapDownloader.set_output_directory(sitemap_dir)
-SITEMAP_DOWNLOADERS = [i() for i in SiteMapDownloader.__subclasses__()]
+_sitemap_downloaders = None
 
 
-def get_agent():
-    return choice(headers)
\ No newline at end of file
+def get_sitemap_downloaders():
+    """
+    Instantiates one of every SiteMapDownloader subclass on first use, creating the sitemaps directory
+    :return: list of SiteMapDownloader instances
+    """
+    global _sitemap_downloaders
+    if _sitemap_downloaders is None:
+        init()
+        try:
+            os.mkdir(settings.sitemap_path)
+        except OSError:
+            pass
+        SiteMapDownloader.set_output_directory(settings.sitemap_path)
+        _sitemap_downloaders = [i() for i in SiteMapDownloader.__subclasses__()]
+    return _sitemap_downloaders
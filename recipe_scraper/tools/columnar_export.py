@@ -0,0 +1,203 @@
+import re
+from recipe_scraper.tools.data_loader import DataLoader
+from recipe_scraper.urls import site_from_url
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+###############################################
+#               Export Settings               #
+DEFAULT_CHUNK_SIZE = 10000  # recipes held in memory before a record batch is flushed
+PARQUET_COMPRESSION = 'snappy'
+SUPPORTED_FORMATS = ('parquet', 'arrow')
+
+ISO_8601_DURATION_PATTERN = re.compile(
+    r'^P(?:(?P<days>\d+(?:\.\d+)?)D)?'
+    r'(?:T(?:(?P<hours>\d+(?:\.\d+)?)H)?(?:(?P<minutes>\d+(?:\.\d+)?)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$',
+    re.IGNORECASE
+)
+NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+DURATION_MULTIPLIERS = {
+    'days': 86400,
+    'hours': 3600,
+    'minutes': 60,
+    'seconds': 1,
+}
+
+
+def parse_iso8601_duration(value):
+    """
+    Converts an ISO-8601 duration (e.g. 'PT1H20M') into a number of seconds. The HRecipeParser stores times as a
+    list of candidate values, so the first parsable entry of a list is used.
+    :param value: string or list of strings
+    :return: integer number of seconds, or None if no value can be parsed
+    """
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            seconds = parse_iso8601_duration(item)
+            if seconds is not None:
+                return seconds
+        return None
+    if not isinstance(value, str):
+        return None
+    match = ISO_8601_DURATION_PATTERN.match(value.strip())
+    if not match or not any(match.groupdict().values()):
+        return None
+    return int(sum(float(amount) * DURATION_MULTIPLIERS[unit]
+                   for unit, amount in match.groupdict().items() if amount))
+
+
+def _to_number(value, cast=float):
+    """Pulls the first number out of rating strings like '4.5 stars' or '1,024'"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return cast(value)
+    match = NUMBER_PATTERN.search(str(value).replace(',', ''))
+    return cast(float(match.group())) if match else None
+
+
+def _to_text(value):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return _to_text(value[0]) if value else None
+    return str(value)
+
+
+def _to_text_list(values):
+    if not values:
+        return []
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+    texts = []
+    for value in values:
+        if isinstance(value, dict):  # JSON-LD HowToStep entries
+            value = value.get('text')
+        if value:
+            texts.append(str(value))
+    return texts
+
+
+class ColumnarExporter:
+    """
+    Streams the scraped JSON corpus into a columnar Parquet or Arrow IPC file. Recipes are buffered column by column
+    and flushed as a record batch every `chunk_size` recipes, so memory is bounded by the chunk size and the largest
+    data file rather than the size of the corpus.
+    """
+
+    columns = (
+        'url', 'site', 'title', 'yield', 'ingredients', 'instructions', 'rating_average', 'rating_count',
+        'rating_best', 'rating_worst', 'prep_time_seconds', 'cook_time_seconds',
+    )
+
+    def __init__(self, output_file, output_format=None, chunk_size=DEFAULT_CHUNK_SIZE, verbose=True):
+        if pyarrow is None:
+            raise ImportError("pyarrow is required for columnar export: pip install pyarrow")
+        self.output_file = output_file
+        self.output_format = output_format or ('arrow' if output_file.endswith(('.arrow', '.feather')) else 'parquet')
+        if self.output_format not in SUPPORTED_FORMATS:
+            raise ValueError("Unsupported columnar format: {0}".format(self.output_format))
+        self.chunk_size = chunk_size
+        self.verbose = verbose
+        self.schema = pyarrow.schema([
+            ('url', pyarrow.string()),
+            ('site', pyarrow.string()),
+            ('title', pyarrow.string()),
+            ('yield', pyarrow.string()),
+            ('ingredients', pyarrow.list_(pyarrow.string())),
+            ('instructions', pyarrow.list_(pyarrow.string())),
+            ('rating_average', pyarrow.float64()),
+            ('rating_count', pyarrow.int64()),
+            ('rating_best', pyarrow.float64()),
+            ('rating_worst', pyarrow.float64()),
+            ('prep_time_seconds', pyarrow.int64()),
+            ('cook_time_seconds', pyarrow.int64()),
+        ])
+        self.recipe_count = 0
+        self._writer = None
+        self._buffer = self._empty_buffer()
+
+    def export(self, recipe_lists=None):
+        """
+        Writes every recipe to the output file.
+        :param recipe_lists: iterable of lists of recipe dicts, defaults to the DataLoader corpus
+        :return: number of recipes written
+        """
+        if recipe_lists is None:
+            recipe_lists = DataLoader(verbose=self.verbose).iter_json_data()
+        try:
+            for recipes in recipe_lists:
+                for recipe in recipes or []:
+                    self.add(recipe)
+        finally:
+            self.close()
+        if self.verbose:
+            print("Exported {0} recipes to {1}".format(self.recipe_count, self.output_file))
+        return self.recipe_count
+
+    def add(self, recipe):
+        if not isinstance(recipe, dict):
+            return
+        row = self.flatten(recipe)
+        for column in self.columns:
+            self._buffer[column].append(row[column])
+        self.recipe_count += 1
+        if len(self._buffer['url']) >= self.chunk_size:
+            self._flush()
+
+    @staticmethod
+    def flatten(recipe):
+        """Maps the nested scraper output format onto the flat typed columns"""
+        time = recipe.get('time') or {}
+        ratings = (recipe.get('reviews') or {}).get('ratings') or {}
+        if not isinstance(ratings, dict):
+            ratings = {}
+        return {
+            'url': _to_text(recipe.get('url')),
+            'site': site_from_url(_to_text(recipe.get('url'))),
+            'title': _to_text(recipe.get('title')),
+            'yield': _to_text(recipe.get('yield')),
+            'ingredients': _to_text_list(recipe.get('ingredients')),
+            'instructions': _to_text_list(recipe.get('instructions')),
+            'rating_average': _to_number(ratings.get('average')),
+            'rating_count': _to_number(ratings.get('count'), int),
+            'rating_best': _to_number(ratings.get('best')),
+            'rating_worst': _to_number(ratings.get('worst')),
+            'prep_time_seconds': parse_iso8601_duration(time.get('prepTime')),
+            'cook_time_seconds': parse_iso8601_duration(time.get('cookTime')),
+        }
+
+    def close(self):
+        self._flush()
+        if self._writer is None:
+            # Always leave a valid (possibly empty) file behind
+            self._open_writer()
+        self._writer.close()
+
+    def _empty_buffer(self):
+        return {column: [] for column in self.columns}
+
+    def _open_writer(self):
+        if self.output_format == 'parquet':
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self.output_file, self.schema, compression=PARQUET_COMPRESSION)
+        else:
+            self._writer = pyarrow.ipc.new_file(self.output_file, self.schema)
+
+    def _flush(self):
+        if not self._buffer['url']:
+            return
+        if self._writer is None:
+            self._open_writer()
+        batch = pyarrow.record_batch(
+            [pyarrow.array(self._buffer[field.name], type=field.type) for field in self.schema],
+            schema=self.schema
+        )
+        if self.output_format == 'parquet':
+            self._writer.write_table(pyarrow.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self._buffer = self._empty_buffer()
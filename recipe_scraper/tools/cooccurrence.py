@@ -0,0 +1,154 @@
+import json
+from functools import lru_cache
+from recipe_scraper.ingredients import INGREDIENT_CACHE_SIZE, parse_ingredient_line
+from recipe_scraper.tools.data_loader import DataLoader
+from recipe_scraper.tools.columnar_export import _to_text_list
+from recipe_scraper.tools.ingredient_index import ingredient_terms
+try:
+    import numpy
+    from scipy import sparse
+except ImportError:
+    numpy = None
+    sparse = None
+
+###############################################
+#         Co-occurrence Matrix Settings       #
+COOCCURRENCE_CHUNK_RECIPES = 50000  # recipes per incidence matrix product, bounds the per chunk memory
+MIN_PAIR_COUNT = 5  # recipes a pair must share to be scored, rarer pairs have unreliable PMI
+
+
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
+def ingredient_name(line):
+    """
+    :return: the one ingredient an ingredient line is about, its parsed name with simple plurals folded, e.g.
+        '2 tbsp extra-virgin olive oil' -> 'extra virgin olive oil', or None for a line without a name
+    """
+    name = parse_ingredient_line(line).name
+    if not name:
+        return None
+    return ' '.join(ingredient_terms(name)) or None
+
+
+class CooccurrenceMatrix:
+    """
+    Counts how many recipes use each pair of ingredients, for pairing analytics. Each ingredient line stands for one
+    ingredient, its `ingredient_name`, so 'olive oil' is one ingredient and never paired with itself as 'olive' and
+    'oil'. Ingredients get integer ids as they are first seen; each chunk of recipes becomes a sparse recipe x
+    ingredient incidence matrix X, and X.T * X, whose diagonal holds the ingredient counts, is added to the running
+    counts. Only the running matrix outlives a chunk, so memory is bounded by the vocabulary and the pairs it actually
+    uses, not by the corpus size.
+    """
+
+    def __init__(self, chunk_recipes=COOCCURRENCE_CHUNK_RECIPES, verbose=True):
+        if sparse is None:
+            raise ImportError("numpy and scipy are required for co-occurrence counts: pip install numpy scipy")
+        self.chunk_recipes = chunk_recipes
+        self.verbose = verbose
+        self.vocabulary = {}  # ingredient name -> id
+        self.terms = []  # id -> ingredient name
+        self.recipe_count = 0
+        self._counts = sparse.csr_matrix((0, 0), dtype=numpy.int32)
+        self._term_ids = []
+        self._lengths = []
+
+    def add(self, recipe):
+        """Queues the distinct ingredients of a recipe, recipes without ingredients are ignored"""
+        if not isinstance(recipe, dict):
+            return
+        terms = set(ingredient_name(line) for line in _to_text_list(recipe.get('ingredients')))
+        terms.discard(None)
+        if not terms:
+            return
+        vocabulary = self.vocabulary
+        for term in terms:
+            term_id = vocabulary.get(term)
+            if term_id is None:
+                term_id = vocabulary[term] = len(self.terms)
+                self.terms.append(term)
+            self._term_ids.append(term_id)
+        self._lengths.append(len(terms))
+        if len(self._lengths) >= self.chunk_recipes:
+            self._count_pending()
+
+    def build(self, recipe_lists=None):
+        """
+        :param recipe_lists: iterable of lists of recipe dicts, defaults to the DataLoader corpus
+        :return: self, with every recipe counted
+        """
+        if recipe_lists is None:
+            recipe_lists = DataLoader(verbose=self.verbose).iter_json_data()
+        for recipes in recipe_lists:
+            for recipe in recipes or []:
+                self.add(recipe)
+        self._count_pending()
+        if self.verbose:
+            print("Counted {0} ingredients in {1} recipes".format(len(self.terms), self.recipe_count))
+        return self
+
+    @property
+    def counts(self):
+        """Symmetric csr matrix of the number of recipes using both ingredients, ingredient counts on the diagonal"""
+        self._count_pending()
+        return self._counts
+
+    def scores(self, min_count=MIN_PAIR_COUNT):
+        """
+        Lift is how much more often two ingredients share a recipe than if they were independent, P(a, b) / P(a)P(b),
+        and PMI its logarithm; normalized PMI divides by -log P(a, b) to range from -1 to 1.
+        :param min_count: recipes a pair must share to be scored
+        :return: dict of numpy arrays a, b (ingredient ids, a < b), count, lift, pmi and npmi, one entry per pair
+        """
+        pairs = sparse.triu(self.counts, k=1).tocoo()
+        keep = pairs.data >= min_count
+        a, b, count = pairs.row[keep], pairs.col[keep], pairs.data[keep].astype(numpy.float64)
+        term_counts = self.counts.diagonal().astype(numpy.float64)
+        lift = count * self.recipe_count / (term_counts[a] * term_counts[b])
+        pmi = numpy.log(lift)
+        joint = count / self.recipe_count
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            npmi = numpy.where(joint < 1.0, pmi / -numpy.log(joint), 1.0)
+        return {'a': a, 'b': b, 'count': count.astype(numpy.int64), 'lift': lift, 'pmi': pmi, 'npmi': npmi}
+
+    def pairings(self, term, min_count=MIN_PAIR_COUNT, limit=20):
+        """
+        :param term: ingredient name as returned by `ingredient_name`, e.g. 'olive oil'
+        :return: list of (ingredient, shared recipes, lift) of the ingredients paired with term most above chance
+        """
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            return []
+        row = self.counts.getrow(term_id).tocoo()
+        keep = (row.data >= min_count) & (row.col != term_id)
+        others, count = row.col[keep], row.data[keep].astype(numpy.float64)
+        term_counts = self.counts.diagonal().astype(numpy.float64)
+        lift = count * self.recipe_count / (term_counts[term_id] * term_counts[others])
+        order = numpy.argsort(-lift, kind='stable')[:limit]
+        return [(self.terms[other], int(shared), round(float(value), 3))
+                for other, shared, value in zip(others[order], count[order], lift[order])]
+
+    def write(self, output_file, min_count=MIN_PAIR_COUNT):
+        """Writes the scored pairs as JSON lines of {"a", "b", "count", "lift", "pmi", "npmi"}, highest PMI first"""
+        scores = self.scores(min_count)
+        order = numpy.argsort(-scores['pmi'], kind='stable')
+        with open(output_file, 'w') as f:
+            for a, b, count, lift, pmi, npmi in zip(*(scores[key][order].tolist()
+                                                      for key in ('a', 'b', 'count', 'lift', 'pmi', 'npmi'))):
+                f.write(json.dumps({'a': self.terms[a], 'b': self.terms[b], 'count': count, 'lift': round(lift, 4),
+                                    'pmi': round(pmi, 4), 'npmi': round(npmi, 4)}) + '\n')
+        if self.verbose:
+            print("Wrote {0} ingredient pairs to {1}".format(len(order), output_file))
+
+    def _count_pending(self):
+        size = len(self.terms)
+        if self._counts.shape != (size, size):
+            self._counts.resize((size, size))
+        if not self._lengths:
+            return
+        term_ids = numpy.array(self._term_ids, dtype=numpy.int32)
+        rows = numpy.repeat(numpy.arange(len(self._lengths), dtype=numpy.int32), self._lengths)
+        incidence = sparse.csr_matrix((numpy.ones(len(term_ids), dtype=numpy.int32), (rows, term_ids)),
+                                      shape=(len(self._lengths), size))
+        self._counts = self._counts + incidence.T.dot(incidence).tocsr()
+        self.recipe_count += len(self._lengths)
+        self._term_ids = []
+        self._lengths = []
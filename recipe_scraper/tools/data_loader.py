@@ -1,35 +1,21 @@
 import os
 import json
-from recipe_scraper import EATERATOR_ENV_VARIABLE, LOGGING_FILE
+from recipe_scraper import settings
 
 
 class DataLoader:
 
     def __init__(self, verbose=True):
-        self.files = [os.path.join(os.environ[EATERATOR_ENV_VARIABLE], f)
-                      for f in os.listdir(os.environ[EATERATOR_ENV_VARIABLE])
-                      if os.path.isfile(os.path.join(os.environ[EATERATOR_ENV_VARIABLE], f)) and
+        self.files = [os.path.join(settings.data_path, f)
+                      for f in os.listdir(settings.data_path)
+                      if os.path.isfile(os.path.join(settings.data_path, f)) and
                       (os.path.splitext(f)[1] == '.txt' or os.path.splitext(f)[0] == '.txt')]
         self.verbose = verbose
 
     def iter_json_data(self):
         recipe_count = 0
         for _file in self.files:
-            if self.verbose:
-                print("Loading File: {0}".format(_file))
-            try:
-                with open(_file, 'r', errors="ignore") as f:
-                    data = json.loads('[' + f.read()[1:] + ']')
-            except UnicodeDecodeError:
-                if self.verbose:
-                    print("\tWarning unicode error with file")
-                with open(_file, 'r', errors="ignore") as f:
-                    text = f.read()[1:]
-                    try:
-                        data = json.loads('[' + text + ']')
-                    except UnicodeDecodeError:
-                        bytes(text, 'utf-8').decode('utf-8', 'ignore')
-                        data = json.loads('[' + text + ']')
+            data = self.load_file(_file)
             if self.verbose:
                 recipe_count += len(data) if data else 0
                 message = len(data) if data else "** FAILED LOADING **"
@@ -39,9 +25,28 @@ class DataLoader:
             print("\n------Total recipes: {0}".format(recipe_count))
             print("\n\n--------------Complete --------------------\n")
 
+    def load_file(self, _file):
+        """:return: list of the recipes in one data file"""
+        if self.verbose:
+            print("Loading File: {0}".format(_file))
+        try:
+            with open(_file, 'r', errors="ignore") as f:
+                data = json.loads('[' + f.read()[1:] + ']')
+        except UnicodeDecodeError:
+            if self.verbose:
+                print("\tWarning unicode error with file")
+            with open(_file, 'r', errors="ignore") as f:
+                text = f.read()[1:]
+                try:
+                    data = json.loads('[' + text + ']')
+                except UnicodeDecodeError:
+                    bytes(text, 'utf-8').decode('utf-8', 'ignore')
+                    data = json.loads('[' + text + ']')
+        return data
+
     @staticmethod
     def iter_log_text(line_size=5000):
-        with open(LOGGING_FILE, 'r') as f:
+        with open(settings.logging_file, 'r') as f:
             current_text = []
             line_count = 0
             for line in f:
@@ -0,0 +1,359 @@
+import os
+import re
+import json
+import mmap
+from array import array
+from heapq import merge, nlargest
+from itertools import groupby
+from recipe_scraper.tools.data_loader import DataLoader
+from recipe_scraper.tools.columnar_export import ColumnarExporter
+
+###############################################
+#           Ingredient Index Settings         #
+SEGMENT_RECIPES = 200000  # recipes indexed in memory before a segment is written
+MAX_SEGMENTS = 8  # segments are merged into one when an update leaves more than this
+DEFAULT_SEARCH_LIMIT = 20
+
+MANIFEST_FILE = 'manifest.json'
+DOCUMENTS_FILE = 'documents.jsonl'
+DOCUMENT_OFFSETS_FILE = 'documents.offsets'
+RATINGS_FILE = 'ratings.u32'
+SEGMENT_FORMAT = 'segment_{0:05d}'
+
+TERM_PATTERN = re.compile(r'[a-z]+')
+STOP_WORDS = frozenset([
+    'a', 'an', 'and', 'or', 'of', 'to', 'for', 'with', 'in', 'into', 'on', 'at', 'the', 'as', 'about', 'plus', 'more',
+    'if', 'needed', 'optional', 'taste', 'divided', 'such', 'each', 'other', 'your', 'any', 'very', 'well', 'few',
+    'cup', 'cups', 'c', 'tablespoon', 'tablespoons', 'tbsp', 'tbs', 'teaspoon', 'teaspoons', 'tsp', 'ounce', 'ounces',
+    'oz', 'pound', 'pounds', 'lb', 'lbs', 'gram', 'grams', 'g', 'kg', 'ml', 'l', 'liter', 'litre', 'quart', 'quarts',
+    'pint', 'pints', 'gallon', 'pinch', 'dash', 'can', 'cans', 'package', 'packages', 'pkg', 'jar', 'bottle', 'box',
+    'bunch', 'clove', 'cloves', 'slice', 'slices', 'piece', 'pieces', 'stick', 'sticks', 'large', 'medium', 'small',
+    'whole', 'fresh', 'freshly', 'chopped', 'minced', 'diced', 'sliced', 'grated', 'ground', 'crushed', 'finely',
+    'coarsely', 'thinly', 'roughly', 'cut', 'peeled', 'softened', 'melted', 'beaten', 'room', 'temperature', 'inch',
+    'inches', 'x',
+])
+
+
+def ingredient_terms(text):
+    """
+    :return: the index terms of an ingredient line or query: lower cased words without quantities, units and
+        preparation words, with simple plurals folded (tomatoes -> tomato, berries -> berry)
+    """
+    terms = []
+    for word in TERM_PATTERN.findall(text.lower()):
+        if word in STOP_WORDS:
+            continue
+        if len(word) > 4 and word.endswith('ies'):
+            word = word[:-3] + 'y'
+        elif len(word) > 3 and word.endswith('oes'):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def encode_postings(ids):
+    """Variable byte encodes the gaps of a sorted list of recipe ids, 7 bits per byte with a continuation bit"""
+    out, previous = bytearray(), 0
+    for recipe_id in ids:
+        gap, previous = recipe_id - previous, recipe_id
+        while gap >= 0x80:
+            out.append((gap & 0x7f) | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return bytes(out)
+
+
+def decode_postings(buffer):
+    """:return: list of the recipe ids encoded by `encode_postings`"""
+    ids, value, shift, current = [], 0, 0, 0
+    for byte in buffer:
+        if byte & 0x80:
+            value |= (byte & 0x7f) << shift
+            shift += 7
+        else:
+            current += value | (byte << shift)
+            ids.append(current)
+            value, shift = 0, 0
+    return ids
+
+
+class _Segment:
+    """Read side of one segment: a lexicon of term -> (offset, length, document frequency) and the mapped postings"""
+
+    def __init__(self, directory, name):
+        with open(os.path.join(directory, name + '.lexicon.json'), 'r') as f:
+            self.lexicon = json.load(f)
+        self._file = open(os.path.join(directory, name + '.postings'), 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def postings(self, term):
+        entry = self.lexicon.get(term)
+        if entry is None:
+            return []
+        offset, length, _ = entry
+        return decode_postings(self._map[offset:offset + length])
+
+    def frequency(self, term):
+        entry = self.lexicon.get(term)
+        return entry[2] if entry else 0
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+class IngredientIndex:
+    """
+    Inverted index of the scraped corpus from ingredient term to the sorted ids of the recipes using it, for "what
+    can I cook with X, Y and Z" queries without scanning every data file.
+
+    Recipes get sequential ids as they are indexed. Posting lists are gap encoded with variable byte codes and
+    written in segments, a lexicon json and a postings file that is memory-mapped when queried. `update` indexes only
+    the recipes added to the data files since the last update into a new segment, and merges the segments once there
+    are more than MAX_SEGMENTS. Each recipe's url and title are appended to a documents file, and its rating count to
+    a fixed width array used to rank the results.
+    """
+
+    def __init__(self, directory, verbose=True):
+        self.directory = directory
+        self.verbose = verbose
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.manifest = self._read_manifest()
+        self._segments = None
+        self._ratings = None
+        self._offsets = None
+
+    @property
+    def recipe_count(self):
+        return self.manifest['next_id']
+
+    def update(self, data_loader=None):
+        """
+        Indexes the recipes added to the corpus since the last update
+        :param data_loader: DataLoader of the corpus, defaults to the data directory
+        :return: number of recipes indexed
+        """
+        data_loader = data_loader or DataLoader(verbose=self.verbose)
+        self.close()
+        indexed = self.manifest['files']
+        postings, added = {}, 0
+        # drop whatever an interrupted update appended after the last manifest
+        documents = self._open_truncated(DOCUMENTS_FILE, self.manifest['documents_size'])
+        offsets = self._open_truncated(DOCUMENT_OFFSETS_FILE, self.recipe_count * 8)
+        ratings = self._open_truncated(RATINGS_FILE, self.recipe_count * 4)
+        try:
+            for _file in sorted(data_loader.files):
+                name = os.path.basename(_file)
+                try:
+                    recipes = data_loader.load_file(_file) or []
+                except ValueError:  # a data file being written by a running crawl, picked up next time
+                    continue
+                for recipe in recipes[indexed.get(name, 0):]:
+                    if isinstance(recipe, dict):
+                        self._add(recipe, postings, documents, offsets, ratings)
+                        added += 1
+                        if len(postings) and self.manifest['next_id'] % SEGMENT_RECIPES == 0:
+                            self._write_segment(postings)
+                            postings = {}
+                indexed[name] = len(recipes)
+            self._write_segment(postings)
+            self.manifest['documents_size'] = documents.tell()
+        finally:
+            documents.close()
+            offsets.close()
+            ratings.close()
+        self._write_manifest()
+        if len(self.manifest['segments']) > MAX_SEGMENTS:
+            self.compact()
+        self.close()
+        if self.verbose:
+            print("Indexed {0} new recipes, {1} in total".format(added, self.recipe_count))
+        return added
+
+    def postings(self, term):
+        """:return: sorted ids of the recipes with an ingredient matching the term"""
+        ids = []
+        for segment in self._open_segments():
+            ids.extend(segment.postings(term))  # segments hold increasing id ranges
+        return ids
+
+    def frequency(self, term):
+        return sum(segment.frequency(term) for segment in self._open_segments())
+
+    def search(self, require=(), exclude=(), limit=DEFAULT_SEARCH_LIMIT):
+        """
+        :param require: ingredients that must all be used; an ingredient is a string (all of its terms must match) or
+            a tuple of alternatives of which one must match, e.g. ['chicken', ('garlic', 'shallot')]
+        :param exclude: ingredients none of which may be used
+        :param limit: number of results
+        :return: list of dicts of id, url, title and rating count of the matching recipes, most rated first
+        """
+        matches = None
+        groups = [group if isinstance(group, (tuple, list)) else (group,) for group in require]
+        # the rarest requirement first keeps the candidate set small
+        groups.sort(key=lambda group: sum(self._estimate(alternative) for alternative in group))
+        for group in groups:
+            ids = set()
+            for alternative in group:
+                ids.update(self._all_terms(alternative, matches))
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+        if matches is None:
+            return []
+        for ingredient in exclude:
+            matches.difference_update(self._all_terms(ingredient, matches))
+        ratings = self._open_ratings()
+        return [self.document(recipe_id) for recipe_id in nlargest(limit, matches, key=lambda i: (ratings[i], -i))]
+
+    def query(self, text, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        Searches with a query string of comma separated ingredients, where 'a|b' accepts either ingredient and a
+        leading '-' excludes an ingredient, e.g. 'chicken, garlic|shallot, -cream'
+        """
+        require, exclude = [], []
+        for item in text.split(','):
+            item = item.strip()
+            if item.startswith('-'):
+                exclude.append(item[1:])
+            elif '|' in item:
+                require.append(tuple(part for part in item.split('|') if part.strip()))
+            elif item:
+                require.append(item)
+        return self.search(require, exclude, limit)
+
+    def document(self, recipe_id):
+        """:return: dict of id, url, title and rating count of an indexed recipe"""
+        offsets = self._open_offsets()
+        with open(os.path.join(self.directory, DOCUMENTS_FILE), 'rb') as f:
+            f.seek(offsets[recipe_id])
+            url, title = json.loads(f.readline().decode('utf-8'))
+        return {'id': recipe_id, 'url': url, 'title': title, 'rating_count': self._open_ratings()[recipe_id]}
+
+    def compact(self):
+        """
+        Merges every segment into one. The segments' lexicons are walked together in sorted term order, and each
+        term's merged posting list is encoded and written before the next term is read, so only one posting list is
+        held in memory at a time.
+        """
+        segments = self._open_segments()
+        terms = merge(*(sorted(segment.lexicon) for segment in segments))
+        merged = ((term, [recipe_id for segment in segments for recipe_id in segment.postings(term)])
+                  for term, _ in groupby(terms))
+        old = self.manifest['segments']
+        name = self._write_postings(merged)
+        self.close()
+        self.manifest['segments'] = [name] if name else []
+        self._write_manifest()
+        for name in old:
+            for extension in ('.lexicon.json', '.postings'):
+                os.remove(os.path.join(self.directory, name + extension))
+
+    def close(self):
+        for segment in self._segments or []:
+            segment.close()
+        self._segments = None
+        self._ratings = None
+        self._offsets = None
+
+    def _add(self, recipe, postings, documents, offsets, ratings):
+        recipe_id = self.manifest['next_id']
+        self.manifest['next_id'] += 1
+        row = ColumnarExporter.flatten(recipe)
+        terms = set()
+        for line in row['ingredients']:
+            terms.update(ingredient_terms(line))
+        for term in terms:
+            postings.setdefault(term, []).append(recipe_id)
+        offsets.write(array('Q', [documents.tell()]).tobytes())
+        documents.write((json.dumps([row['url'], row['title']]) + '\n').encode('utf-8'))
+        ratings.write(array('I', [min(max(row['rating_count'] or 0, 0), 0xffffffff)]).tobytes())
+
+    def _all_terms(self, ingredient, candidates=None):
+        """:return: ids of the recipes matching every term of an ingredient, within candidates when given"""
+        terms = sorted(set(ingredient_terms(ingredient)), key=self.frequency)
+        if not terms:
+            return set()
+        ids = set(self.postings(terms[0]))
+        if candidates is not None:
+            ids &= candidates
+        for term in terms[1:]:
+            if not ids:
+                break
+            ids.intersection_update(self.postings(term))
+        return ids
+
+    def _estimate(self, ingredient):
+        return min([self.frequency(term) for term in ingredient_terms(ingredient)] or [0])
+
+    def _write_segment(self, postings):
+        if postings:
+            self.manifest['segments'].append(self._write_postings((term, postings[term]) for term in sorted(postings)))
+
+    def _write_postings(self, postings):
+        """
+        Writes a new segment
+        :param postings: iterable of (term, sorted recipe ids) in term order
+        :return: name of the segment, None if there were no postings
+        """
+        name = SEGMENT_FORMAT.format(self.manifest['segment_sequence'])
+        lexicon, offset = {}, 0
+        with open(os.path.join(self.directory, name + '.postings'), 'wb') as f:
+            for term, ids in postings:
+                encoded = encode_postings(ids)
+                f.write(encoded)
+                lexicon[term] = [offset, len(encoded), len(ids)]
+                offset += len(encoded)
+        if not lexicon:
+            os.remove(os.path.join(self.directory, name + '.postings'))
+            return None
+        with open(os.path.join(self.directory, name + '.lexicon.json'), 'w') as f:
+            json.dump(lexicon, f, separators=(',', ':'))
+        self.manifest['segment_sequence'] += 1
+        return name
+
+    def _read_manifest(self):
+        manifest_file = os.path.join(self.directory, MANIFEST_FILE)
+        if os.path.isfile(manifest_file):
+            with open(manifest_file, 'r') as f:
+                return json.load(f)
+        return {'next_id': 0, 'segment_sequence': 0, 'segments': [], 'files': {}, 'documents_size': 0}
+
+    def _write_manifest(self):
+        manifest_file = os.path.join(self.directory, MANIFEST_FILE)
+        with open(manifest_file + '.tmp', 'w') as f:
+            json.dump(self.manifest, f)
+        os.replace(manifest_file + '.tmp', manifest_file)
+
+    def _open_truncated(self, file_name, size):
+        path = os.path.join(self.directory, file_name)
+        f = open(path, 'r+b' if os.path.isfile(path) else 'w+b')
+        f.truncate(size)
+        f.seek(size)
+        return f
+
+    def _open_segments(self):
+        if self._segments is None:
+            self._segments = [_Segment(self.directory, name) for name in self.manifest['segments']]
+        return self._segments
+
+    def _open_ratings(self):
+        if self._ratings is None:
+            self._ratings = self._read_array('I', RATINGS_FILE)
+        return self._ratings
+
+    def _open_offsets(self):
+        if self._offsets is None:
+            self._offsets = self._read_array('Q', DOCUMENT_OFFSETS_FILE)
+        return self._offsets
+
+    def _read_array(self, typecode, file_name):
+        values = array(typecode)
+        with open(os.path.join(self.directory, file_name), 'rb') as f:
+            values.frombytes(f.read(self.recipe_count * values.itemsize))
+        return values
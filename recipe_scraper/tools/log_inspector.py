@@ -25,5 +25,21 @@ class LogInspector:
                     largest_ids[site] = int(_id.group()) + 1
         return largest_ids
 
+    @staticmethod
+    def find_largest_ids_from_fetch_log(records):
+        """
+        Same as find_largest_ids, but for structured fetch log records (see recipe_scraper.log_pipeline.FetchLog)
+        :param records: iterable of fetch log record dicts
+        :return: dict of site -> next id to request
+        """
+        largest_ids = dict()
+        for record in records:
+            if record.get('site') not in PATTERNS or record.get('status') != 200:
+                continue
+            _id = record['url'].rstrip('/').rsplit('/', 1)[-1]
+            if _id.isdigit() and int(_id) + 1 > largest_ids.get(record['site'], 0):
+                largest_ids[record['site']] = int(_id) + 1
+        return largest_ids
+
     def calculate_stats(self):
         pass
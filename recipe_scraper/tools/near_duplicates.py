@@ -0,0 +1,210 @@
+import re
+import json
+import itertools
+from zlib import crc32
+from recipe_scraper.tools.data_loader import DataLoader
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+###############################################
+#         Near Duplicate Search Settings      #
+NUM_PERMUTATIONS = 128  # MinHash signature length
+LSH_BANDS = 16  # bands of NUM_PERMUTATIONS // LSH_BANDS rows, pairs agreeing on a whole band become candidates
+SIMILARITY_THRESHOLD = 0.8  # estimated Jaccard similarity of a reported near-duplicate
+SHINGLE_SIZE = 3  # words per shingle
+CHUNK_WORDS = 1 << 16  # words hashed per vectorized step, bounds memory to ~NUM_PERMUTATIONS * 512KB
+SIGNATURE_SEED = 1
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+
+def _texts(values):
+    if isinstance(values, str):
+        values = [values]
+    for value in values or []:
+        if isinstance(value, dict):  # JSON-LD HowToStep entries
+            value = value.get('text')
+        if value:
+            yield str(value)
+
+
+class _WordHashes(dict):
+    """Memoized 32 bit word hashes, offset by one so 0 is free for pads"""
+
+    def __missing__(self, word):
+        value = self[word] = crc32(word.encode('utf-8')) + 1
+        return value
+
+
+def token_stream(recipe, shingle_size=SHINGLE_SIZE, word_hashes=None):
+    """
+    :return: (hashes of the lower cased words of a recipe's ingredient lines and instructions, with every line
+        followed by shingle_size - 1 zero pads so a shingle never spans two lines, number of words)
+    """
+    word_hashes = _WordHashes() if word_hashes is None else word_hashes
+    stream, pad, words = [], [0] * (shingle_size - 1), 0
+    for line in itertools.chain(_texts(recipe.get('ingredients')), _texts(recipe.get('instructions'))):
+        tokens = TOKEN_PATTERN.findall(line.lower())
+        if tokens:
+            stream.extend([word_hashes[token] for token in tokens])
+            stream.extend(pad)
+            words += len(tokens)
+    return stream, words
+
+
+class _DisjointSet:
+
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, item):
+        root = self.parent.setdefault(item, item)
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while item != root:  # path compression
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+class NearDuplicateFinder:
+    """
+    Clusters recipes whose ingredients and instructions are nearly the same, e.g. a syndicated recipe with different
+    whitespace or one changed ingredient. Each recipe's word shingles are reduced to a MinHash signature: word
+    hashes are combined into shingle hashes and the hash permutations applied to a whole chunk of recipes at once
+    with NumPy (multiply-shift hashing), then reduced per recipe. Signatures are then cut into LSH bands: recipes
+    that agree on every row of any band land in the same bucket, every bucket member is compared with the bucket's
+    first member on the full signature, and pairs at or above the similarity threshold are joined into clusters.
+    Memory is NUM_PERMUTATIONS * 4 bytes per recipe.
+    """
+
+    def __init__(self, num_permutations=NUM_PERMUTATIONS, bands=LSH_BANDS, threshold=SIMILARITY_THRESHOLD,
+                 shingle_size=SHINGLE_SIZE, seed=SIGNATURE_SEED, verbose=True):
+        if numpy is None:
+            raise ImportError("numpy is required for near-duplicate search: pip install numpy")
+        if num_permutations % bands:
+            raise ValueError("num_permutations must be a multiple of bands")
+        self.num_permutations = num_permutations
+        self.bands = bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.verbose = verbose
+        random = numpy.random.RandomState(seed)
+        self._multipliers = (random.randint(0, 1 << 62, num_permutations, dtype=numpy.uint64) << 1) | 1
+        self._increments = random.randint(0, 1 << 62, num_permutations, dtype=numpy.uint64)
+        self._band_multipliers = random.randint(0, 1 << 62, num_permutations // bands, dtype=numpy.uint64) | 1
+        self._shingle_multipliers = random.randint(0, 1 << 62, shingle_size, dtype=numpy.uint64) | 1
+        self.recipes = []  # (url, title) per signature row
+        self._signatures = []
+        self._tokens = []
+        self._lengths = []
+        self._word_hashes = _WordHashes()  # bounded by the vocabulary
+
+    def add(self, recipe):
+        """Queues a recipe for signing, recipes without ingredient or instruction text are ignored"""
+        if not isinstance(recipe, dict):
+            return
+        tokens, words = token_stream(recipe, self.shingle_size, self._word_hashes)
+        if not words:
+            return
+        self.recipes.append((recipe.get('url'), recipe.get('title')))
+        self._tokens.extend(tokens)
+        self._lengths.append(words)
+        if len(self._tokens) >= CHUNK_WORDS:
+            self._sign_pending()
+
+    def find(self, recipe_lists=None):
+        """
+        :param recipe_lists: iterable of lists of recipe dicts, defaults to the DataLoader corpus
+        :return: list of clusters, each a list of (recipe index, estimated similarity to the cluster's first
+            recipe) with the first recipe at similarity 1.0, largest clusters first
+        """
+        if recipe_lists is None:
+            recipe_lists = DataLoader(verbose=self.verbose).iter_json_data()
+        for recipes in recipe_lists:
+            for recipe in recipes or []:
+                self.add(recipe)
+        signatures = self.signatures
+        clusters = _DisjointSet()
+        rows = self.num_permutations // self.bands
+        for band in range(self.bands):
+            keys = signatures[:, band * rows:(band + 1) * rows].astype(numpy.uint64).dot(self._band_multipliers)
+            order = numpy.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            in_bucket = numpy.empty(len(order), dtype=bool)
+            if len(order):
+                in_bucket[0] = False
+                in_bucket[1:] = sorted_keys[1:] == sorted_keys[:-1]
+            members = numpy.nonzero(in_bucket)[0]
+            if not len(members):
+                continue
+            # the first member of each bucket is the nearest earlier position not continuing a bucket
+            starts = numpy.where(in_bucket, 0, numpy.arange(len(order)))
+            heads = numpy.maximum.accumulate(starts)[members]
+            members, heads = order[members], order[heads]
+            similar = self._similarity(members, heads) >= self.threshold
+            for member, head in zip(members[similar].tolist(), heads[similar].tolist()):
+                clusters.union(head, member)
+        groups = {}
+        for item in list(clusters.parent):
+            groups.setdefault(clusters.find(item), []).append(item)
+        result = []
+        for root, items in groups.items():
+            if len(items) < 2:
+                continue
+            items = sorted(items)
+            scores = self._similarity(numpy.array(items), numpy.full(len(items), items[0]))
+            result.append([(item, round(float(score), 3)) for item, score in zip(items, scores)])
+        result.sort(key=lambda cluster: (-len(cluster), cluster[0][0]))
+        if self.verbose:
+            print("Found {0} near-duplicate clusters among {1} recipes".format(len(result), len(self.recipes)))
+        return result
+
+    def write(self, output_file, clusters):
+        """Writes clusters as JSON lines of {"size", "recipes": [{"url", "title", "similarity"}]}"""
+        with open(output_file, 'w') as f:
+            for cluster in clusters:
+                f.write(json.dumps({
+                    'size': len(cluster),
+                    'recipes': [{'url': self.recipes[i][0], 'title': self.recipes[i][1], 'similarity': score}
+                                for i, score in cluster],
+                }) + '\n')
+
+    @property
+    def signatures(self):
+        """uint32 array of one MinHash signature row per added recipe"""
+        self._sign_pending()
+        if len(self._signatures) != 1:
+            self._signatures = [numpy.vstack(self._signatures) if self._signatures
+                                else numpy.empty((0, self.num_permutations), dtype=numpy.uint32)]
+        return self._signatures[0]
+
+    def _sign_pending(self):
+        if not self._lengths:
+            return
+        tokens = numpy.array(self._tokens + [0] * (self.shingle_size - 1), dtype=numpy.uint64)
+        count = len(self._tokens)
+        # a shingle starts at every word, pads only end shingles of the last words of a line
+        shingles = tokens[:count] * self._shingle_multipliers[0]
+        for i in range(1, self.shingle_size):
+            shingles += tokens[i:count + i] * self._shingle_multipliers[i]
+        shingles = shingles[tokens[:count] != 0]
+        offsets = numpy.concatenate(([0], numpy.cumsum(self._lengths)[:-1]))
+        # multiply-shift hashing: the uint64 products wrap around and the top 32 bits of the minimum are kept
+        permuted = numpy.outer(self._multipliers, shingles)
+        permuted += self._increments[:, None]
+        minimums = numpy.minimum.reduceat(permuted, offsets, axis=1) >> numpy.uint64(32)
+        self._signatures.append(minimums.T.astype(numpy.uint32))
+        self._tokens = []
+        self._lengths = []
+
+    def _similarity(self, a, b):
+        """Estimated Jaccard similarity of the recipes at indexes a and b: the share of equal signature values"""
+        signatures = self.signatures
+        return (signatures[a] == signatures[b]).mean(axis=1)
@@ -0,0 +1,172 @@
+import os
+import json
+import tarfile
+import gzip
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from timeit import default_timer
+from bs4 import BeautifulSoup
+from recipe_scraper.recipe_parsers import HRecipeParser, JsonLdParser
+from recipe_scraper.records import recipe_json
+from recipe_scraper.urls import site_from_url
+from recipe_scraper.page_archive import PageArchive, ARCHIVE_INDEX_FILE
+from recipe_scraper.async_scraper import DataFileManager, write_data_to_file
+
+###############################################
+#             Re-parse Settings               #
+PARSERS = {
+    'hrecipe': HRecipeParser,
+    'jsonld': JsonLdParser,
+}
+HTML_EXTENSIONS = ('.html', '.htm', '.html.gz', '.htm.gz')
+MAX_PENDING_PAGES_PER_PROCESS = 64  # bounds the number of page bodies held in memory at once
+DEFAULT_SITE_KEY = 'default'
+
+_process_parsers = {}
+
+
+def parser_map_from_downloaders(downloaders):
+    """Builds a site -> parser name mapping from SiteMapDownloader instances"""
+    names = {cls: name for name, cls in PARSERS.items()}
+    return {downloader.subdirectory_output: names[type(downloader.parser.__self__)] for downloader in downloaders}
+
+
+def _parse_page(site, parser_name, name, body):
+    """
+    Runs in a worker process: parses a single saved page.
+    :return: (site, parser_name, json data or None, seconds spent parsing)
+    """
+    start = default_timer()
+    if parser_name not in _process_parsers:
+        _process_parsers[parser_name] = PARSERS[parser_name].get_parser()
+    try:
+        soup = BeautifulSoup(body, 'lxml')
+        data = _process_parsers[parser_name](soup)
+        data['url'] = name if '://' in name else _find_page_url(soup) or name
+        result = recipe_json(data) if data.get('ingredients') else None
+    except Exception:
+        result = None
+    return site, parser_name, result, default_timer() - start
+
+
+def _find_page_url(soup):
+    """Saved pages lose their url, so recover it from the canonical link or open graph tags when possible"""
+    tag = soup.find('link', rel='canonical')
+    if tag and tag.get('href'):
+        return tag['href']
+    tag = soup.find('meta', property='og:url')
+    if tag and tag.get('content'):
+        return tag['content']
+    return None
+
+
+class BulkReparser:
+    """
+    Re-runs the recipe parsers over pages saved to disk, in a process pool, writing the results through the normal
+    DataFileManager output files. Pages can be read from a directory tree, a tar (optionally gzipped) bundle or a
+    PageArchive directory. The site of each page is the first path component that matches a key of the parser
+    mapping, or for urls, the longest mapping key that is a label of the host name ('foodnetwork') or its domain
+    ('food.com').
+    """
+
+    def __init__(self, parser_map, processes=None, data_file_manager=None, recipe_store=None, verbose=True):
+        """
+        :param parser_map: dict of site -> parser name ('hrecipe' or 'jsonld'), may contain a 'default' entry
+        :param processes: number of worker processes, defaults to the number of cores
+        :param data_file_manager: output file manager, defaults to the shared DataFileManager
+        :param recipe_store: optional recipe store that also receives each parsed recipe
+        :param verbose: prints a throughput summary when finished
+        """
+        unknown = set(parser_map.values()) - set(PARSERS)
+        if unknown:
+            raise ValueError("Unknown parsers in mapping: {0}".format(', '.join(sorted(unknown))))
+        self.parser_map = parser_map
+        self.processes = processes or os.cpu_count() or 1
+        self.data_file_manager = data_file_manager or DataFileManager()
+        self.recipe_store = recipe_store
+        self.verbose = verbose
+        self.stats = {name: {'pages': 0, 'recipes': 0, 'seconds': 0.0} for name in PARSERS}
+        self.skipped = 0
+
+    def run(self, source):
+        """
+        Parses every page found at `source` and writes the recipes found.
+        :param source: directory, tar bundle or PageArchive directory
+        :return: per parser statistics
+        """
+        start = default_timer()
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            pending = set()
+            for name, body in self.iter_pages(source):
+                site = self.site_for(name)
+                if not site:
+                    self.skipped += 1
+                    continue
+                pending.add(executor.submit(_parse_page, site, self.parser_map[site], name, body))
+                if len(pending) >= self.processes * MAX_PENDING_PAGES_PER_PROCESS:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._collect(done)
+            self._collect(wait(pending).done)
+        if self.verbose:
+            self.report(default_timer() - start)
+        return self.stats
+
+    def site_for(self, name):
+        """
+        :param name: url or path of a saved page
+        :return: the parser mapping key of the page's site, the default key or None
+        """
+        if '://' in name:
+            host = site_from_url(name)
+            labels = host.split('.')
+            # whole labels only, so 'food' does not claim foodnetwork.com; the longest key wins, e.g. 'food.com'
+            candidates = sorted((site for site in self.parser_map if site != DEFAULT_SITE_KEY and
+                                 (site in labels or host == site or host.endswith('.' + site))), key=len, reverse=True)
+        else:
+            candidates = [part for part in name.replace('\\', '/').split('/') if part in self.parser_map]
+        if candidates:
+            return candidates[0]
+        return DEFAULT_SITE_KEY if DEFAULT_SITE_KEY in self.parser_map else None
+
+    @staticmethod
+    def iter_pages(source):
+        """Yields (name, body) for each saved page, where name is a url or the path inside the source"""
+        if os.path.isdir(source) and os.path.isfile(os.path.join(source, ARCHIVE_INDEX_FILE)):
+            for page, body in PageArchive(source).iter_pages():
+                yield page.final_url, body
+        elif os.path.isdir(source):
+            for root, _, files in os.walk(source):
+                for _file in sorted(files):
+                    if _file.lower().endswith(HTML_EXTENSIONS):
+                        path = os.path.join(root, _file)
+                        opener = gzip.open if _file.lower().endswith('.gz') else open
+                        with opener(path, 'rb') as f:
+                            yield os.path.relpath(path, source), f.read()
+        elif tarfile.is_tarfile(source):
+            with tarfile.open(source, 'r|*') as bundle:
+                for member in bundle:
+                    if member.isfile() and member.name.lower().endswith(HTML_EXTENSIONS):
+                        body = bundle.extractfile(member).read()
+                        yield member.name, gzip.decompress(body) if member.name.lower().endswith('.gz') else body
+        else:
+            raise ValueError("Re-parse source must be a directory or tar bundle: {0}".format(source))
+
+    def report(self, elapsed):
+        print("Re-parsed pages in {0:.1f}s ({1} skipped, no parser for site)".format(elapsed, self.skipped))
+        for name, stats in self.stats.items():
+            if stats['pages']:
+                print("\t{0}: {1} pages, {2} recipes, {3:.1f} pages/sec per process".format(
+                    name, stats['pages'], stats['recipes'], stats['pages'] / max(stats['seconds'], 1e-9)))
+        total = sum(stats['pages'] for stats in self.stats.values())
+        print("\ttotal: {0:.1f} pages/sec".format(total / max(elapsed, 1e-9)))
+
+    def _collect(self, futures):
+        for future in futures:
+            site, parser_name, result, seconds = future.result()
+            stats = self.stats[parser_name]
+            stats['pages'] += 1
+            stats['seconds'] += seconds
+            if result:
+                stats['recipes'] += 1
+                write_data_to_file(result, self.data_file_manager.current_data_file)
+                if self.recipe_store:
+                    self.recipe_store.add(json.loads(result))
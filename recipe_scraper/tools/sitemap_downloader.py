@@ -1,16 +1,16 @@
-import re
 import os
+import json
 import xmltodict
 import gzip
 import aiofiles
 from io import BytesIO
 from aiohttp import ClientSession, TCPConnector
 from abc import ABCMeta
-from collections import OrderedDict
 from xml.parsers.expat import ExpatError
 from recipe_scraper.recipe_parsers import HRecipeParser, JsonLdParser
-
-SITEMAP_PATTERN = re.compile(r'(?<=sitemap:).+')
+from recipe_scraper import settings
+from recipe_scraper.robots import ROBOTS
+from recipe_scraper.urls import canonical_url
 
 
 class SiteMapDownloader:
@@ -47,6 +47,8 @@ class SiteMapDownloader:
         except OSError:
             pass
         self._reverse = False
+        self.position = None
+        self._resume_position = None
 
     async def get_sitemaps(self):
         if isinstance(self.robots_url, str):
@@ -75,14 +77,8 @@ class SiteMapDownloader:
 
     @staticmethod
     async def _find_sitemaps_from_robots(url):
-        conn = TCPConnector(verify_ssl=False)
-        sitemaps = []
-        async with ClientSession(connector=conn) as client:
-            async with client.get(url) as response:
-                if response.status == 200:
-                    txt = (await response.read()).decode('utf-8').lower()
-                    sitemaps = [i.strip() for i in SITEMAP_PATTERN.findall(txt)]
-        return sitemaps
+        """Sitemaps listed in the site's robots.txt, which is parsed once into the shared robots cache"""
+        return list((await ROBOTS.policy_for(url)).sitemaps)
 
     @staticmethod
     def _search_sitemaps(xml, link_filter=None):
@@ -91,7 +87,7 @@ class SiteMapDownloader:
             link_filter = lambda link: 'xml' in link and any(i in link for i in ['sitemap', 'site-map'])
 
         def _search_helper_for_sitemaps(obj):
-            if isinstance(obj, OrderedDict):
+            if isinstance(obj, dict):  # OrderedDict before xmltodict 0.13
                 link = obj.get('loc')
                 if link:
                     sitemaps.append(link)
@@ -120,25 +116,41 @@ class SiteMapDownloader:
 
     @property
     def get_links(self):
+        """
+        Generator over the recipe links of the downloaded sitemap files, moving each file to the collected directory
+        once all of its links were taken. `position` tracks the file being read and the number of its links taken so
+        far, and a generator created after `resume_from(position)` continues at exactly that link.
+        """
         path = os.path.join(self.output_directory, self.subdirectory_output)
         files = sorted(os.listdir(path)) if not self._reverse else sorted(os.listdir(path), reverse=True)
+        resume_file, resume_index = self._resume_position or (None, 0)
+        self._resume_position = None
         for _file in files:
             print("\t Loading Sitemap File: {0}".format(_file))
             if os.path.isfile(os.path.join(path, _file)):
+                skip = resume_index if _file == resume_file else 0
+                self.position = (_file, skip)
                 with gzip.open(os.path.join(path, _file), 'r') as f:
                     try:
                         xml = xmltodict.parse(f.read())
                         links = self._search_sitemaps(xml, link_filter=self._recipe_link_filter)
-                        for link in links:
-                            if link not in self.site_set:
-                                yield link
+                        for i in range(skip, len(links)):
+                            self.position = (_file, i + 1)
+                            if canonical_url(links[i]) not in self.site_set:
+                                yield links[i]
                     except ExpatError:
                         pass
                 os.rename(
                     os.path.join(path, _file),
                     os.path.join(path, self.completed_dir, _file)
                 )
-        raise StopIteration()
+        self.position = None
+
+    def resume_from(self, position):
+        """
+        :param position: a `position` saved from an earlier run, (sitemap file name, links taken from it)
+        """
+        self._resume_position = tuple(position) if position else None
 
     def _recipe_link_filter(self, link):
         if hasattr(self, 'ignore_recipe_pattern'):
@@ -149,16 +161,24 @@ class SiteMapDownloader:
             return all(i in link for i in self.recipe_url_pattern)
 
     async def create_links_set_from_log(self):
-        log_file = os.path.join(
-            os.environ["EATERATOR_DATA_SCRAPING_PATH"],
-            'log', 'log.txt'
-        )
-        async with aiofiles.open(log_file, 'r') as f:
-            async for line in f:
-                tmp = line.strip().strip(',').split()
-                for word in tmp:
-                    if self._recipe_link_filter(word):
-                        self.site_set.add(word)
+        log_file = settings.logging_file
+        if os.path.isfile(log_file):
+            async with aiofiles.open(log_file, 'r') as f:
+                async for line in f:
+                    tmp = line.strip().strip(',').split()
+                    for word in tmp:
+                        if self._recipe_link_filter(word):
+                            self.site_set.add(canonical_url(word))
+        for fetch_log_file in settings.fetch_log_files:
+            async with aiofiles.open(fetch_log_file, 'r') as f:
+                async for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    for link in (record.get('url'), record.get('final')):
+                        if link and self._recipe_link_filter(link):
+                            self.site_set.add(canonical_url(link))
         return
 
     @property
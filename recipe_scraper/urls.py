@@ -0,0 +1,150 @@
+import os
+import json
+from time import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from . import settings, init
+
+###############################################
+#          URL Canonicalization Settings      #
+TRACKING_PARAMETERS = frozenset(['fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'src'])
+TRACKING_PREFIXES = ('utm_',)
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+class UrlCanonicalizer:
+    """
+    Normalizes the urls of a site so every way of writing a recipe's address maps to one string: lower case scheme
+    and host, no default port, no fragment, no trailing slash and a sorted query without tracking parameters. A site
+    can force its scheme and host (e.g. when it redirects everything to https://www.), keep only the query parameters
+    that select a page, or keep its trailing slashes.
+    """
+
+    __slots__ = ('scheme', 'host', 'keep_query', 'trailing_slash')
+
+    def __init__(self, scheme=None, host=None, keep_query=None, trailing_slash=False):
+        """
+        :param scheme: scheme every url of the site is rewritten to, None keeps the url's own
+        :param host: host every url of the site is rewritten to, None keeps the url's own
+        :param keep_query: names of the query parameters to keep, None keeps every non tracking parameter
+        :param trailing_slash: end every path with a slash instead of stripping it
+        """
+        self.scheme = scheme
+        self.host = host
+        self.keep_query = frozenset(keep_query) if keep_query is not None else None
+        self.trailing_slash = trailing_slash
+
+    def __call__(self, url):
+        scheme, netloc, path, query, _ = urlsplit(str(url).strip())
+        scheme = self.scheme or scheme.lower()
+        netloc = self.host or netloc.lower()
+        host, _, port = netloc.partition(':')
+        if port and DEFAULT_PORTS.get(scheme) == port:
+            netloc = host
+        path = path.rstrip('/')
+        if self.trailing_slash or not path:
+            path += '/'
+        if query:
+            query = urlencode(sorted((name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+                                     if self._keep_parameter(name)))
+        return urlunsplit((scheme, netloc, path, query, ''))
+
+    def _keep_parameter(self, name):
+        if self.keep_query is not None:
+            return name in self.keep_query
+        return name.lower() not in TRACKING_PARAMETERS and not name.lower().startswith(TRACKING_PREFIXES)
+
+
+DEFAULT_CANONICALIZER = UrlCanonicalizer()
+SITE_CANONICALIZERS = {}  # site (host without www.) -> UrlCanonicalizer overriding the default
+
+
+def site_from_url(url):
+    """:return: the url's host without 'www.', which also accepts urls without a scheme"""
+    if not url:
+        return None
+    url = str(url)
+    host = urlsplit(url if '//' in url else '//' + url).netloc.lower().partition(':')[0]
+    return host[4:] if host.startswith('www.') else host
+
+
+def canonical_url(url):
+    """:return: the url normalized by its site's UrlCanonicalizer, so one recipe maps to one string"""
+    return SITE_CANONICALIZERS.get(site_from_url(url), DEFAULT_CANONICALIZER)(url)
+
+
+class RedirectMap:
+    """
+    Persisted map from requested urls to the final url they redirected to, e.g. from an id url
+    (http://allrecipes.com/recipe/6663) to its slug url. Later visits request the final url directly and skip the
+    redirect round trip, and the final url tells before a request whether the recipe was already fetched under
+    another address. Entries are appended to a JSON lines file per output segment; on load the files of all
+    segments are read, so worker processes share what each of them learned on earlier runs.
+    """
+
+    def __init__(self, file_name=None):
+        self._file_name = file_name
+        self._finals = None
+        self._file = None
+
+    @property
+    def file_name(self):
+        """Defaults to redirects.jsonl (redirects.<segment>.jsonl for worker processes) in the log directory"""
+        return self._file_name or settings.redirect_map_file
+
+    def load(self):
+        """Reads the persisted entries, later entries win"""
+        self._finals = {}
+        for file_name in ([self._file_name] if self._file_name else settings.redirect_map_files):
+            if not os.path.isfile(file_name):
+                continue
+            with open(file_name, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn write of the last entry
+                    if entry.get('final'):
+                        self._finals[entry['url']] = entry['final']
+                    else:
+                        self._finals.pop(entry['url'], None)
+        return self
+
+    def resolve(self, url):
+        """:return: the final url url redirected to on an earlier visit, else url itself"""
+        return self._entries().get(canonical_url(url), url)
+
+    def add(self, url, final_url):
+        """Remembers that url redirected to final_url, a no-op if both are the same page"""
+        key, final_url = canonical_url(url), str(final_url)
+        if key == canonical_url(final_url) or self._entries().get(key) == final_url:
+            return
+        self._finals[key] = final_url
+        self._append(key, final_url)
+
+    def forget(self, url):
+        """Drops the entry of url, e.g. when its final url stopped working"""
+        key = canonical_url(url)
+        if self._entries().pop(key, None) is not None:
+            self._append(key, None)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, url):
+        return canonical_url(url) in self._entries()
+
+    def _entries(self):
+        if self._finals is None:
+            self.load()
+        return self._finals
+
+    def _append(self, key, final_url):
+        # entries are buffered, losing the last few in a crash only costs their redirects again
+        if self._file is None:
+            if not self._file_name:
+                init()
+            self._file = open(self.file_name, 'a')
+        self._file.write(json.dumps({'ts': round(time(), 3), 'url': key, 'final': final_url}, separators=(',', ':')))
+        self._file.write('\n')
@@ -1,5 +1,4 @@
-from distutils.core import setup
-from setuptools import find_packages
+from setuptools import setup, find_packages
 
 setup(
     name="recipe-scraper",
@@ -9,5 +8,12 @@ setup(
     author="Lucas Currah",
     license="MIT",
     keywords="hrecipe parser recipe_scraper recipe cooking",
-    packages=find_packages(exclude=['tests*'])
+    packages=find_packages(exclude=['tests*']),
+    package_data={
+        'recipe_scraper.tools': ['user_agents.txt'],
+    },
+    extras_require={
+        'columnar': ['pyarrow'],
+        'analysis': ['numpy', 'scipy'],
+    }
 )
@@ -0,0 +1,96 @@
+import os
+import gzip
+import shutil
+import tempfile
+import unittest
+from recipe_scraper.checkpoint import CrawlCheckpoint
+from recipe_scraper.recipe_parsers import JsonLdParser
+from recipe_scraper.tools import SiteMapDownloader
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset>{0}</urlset>"""
+
+
+class _Scraper:
+
+    def __init__(self, state):
+        self.state = state
+
+    def checkpoint_state(self):
+        return dict(self.state)
+
+
+class _TestSiteMapDownloader(SiteMapDownloader):
+    robots_url = ['http://test.com/sitemap.xml']
+    recipe_url_pattern = ['test.com/recipe']
+    subdirectory_output = 'checkpoint_test'
+    parser = JsonLdParser.get_parser()
+
+
+class TestCrawlCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='checkpoint_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_journal_and_snapshot_round_trip(self):
+        checkpoint = CrawlCheckpoint(self.directory)
+        scraper = _Scraper({'current_id': 10, 'queue': ['http://a.com/10']})
+        checkpoint._scrapers = {'a': scraper}
+        checkpoint.save().result()
+        self.assertIsNone(checkpoint.save())  # unchanged state is not journaled again
+        scraper.state['current_id'] = 11
+        checkpoint.save().result()
+        self.assertEqual(CrawlCheckpoint(self.directory).state_for('a')['current_id'], 11)
+        checkpoint.save(snapshot=True).result()
+        scraper.state['current_id'] = 12
+        checkpoint.close()
+        self.assertEqual(os.path.getsize(checkpoint.journal_file), 0)
+        self.assertEqual(CrawlCheckpoint(self.directory).state_for('a')['current_id'], 12)
+
+    def test_stale_and_torn_journal_entries_are_skipped(self):
+        checkpoint = CrawlCheckpoint(self.directory)
+        scraper = _Scraper({'current_id': 1})
+        checkpoint._scrapers = {'a': scraper, 'b': _Scraper({'current_id': 7})}
+        checkpoint.save().result()
+        with open(checkpoint.journal_file, 'r') as f:
+            stale_entry = f.read()
+        scraper.state['current_id'] = 2
+        checkpoint.save(snapshot=True).result()
+        # crash between replacing the snapshot and truncating the journal, then a torn write
+        with open(checkpoint.journal_file, 'w') as f:
+            f.write(stale_entry + '{"sequence": 99, "scrap')
+        state = CrawlCheckpoint(self.directory).state
+        self.assertEqual(state, {'a': {'current_id': 2}, 'b': {'current_id': 7}})
+
+
+class TestSiteMapResume(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='checkpoint_test_')
+        _TestSiteMapDownloader.set_output_directory(self.directory)
+        self.downloader = _TestSiteMapDownloader()
+        for name, ids in (('a.xml.gz', range(0, 3)), ('b.xml.gz', range(3, 5))):
+            urls = ''.join('<url><loc>http://test.com/recipe/{0}</loc></url>'.format(i) for i in ids)
+            with gzip.open(os.path.join(self.directory, 'checkpoint_test', name), 'wb') as f:
+                f.write(SITEMAP.format(urls).encode('utf-8'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_resume_from_position(self):
+        links = self.downloader.get_links
+        self.assertEqual([next(links), next(links)], ['http://test.com/recipe/0', 'http://test.com/recipe/1'])
+        position = self.downloader.position
+        self.assertEqual(position, ('a.xml.gz', 2))
+        resumed = _TestSiteMapDownloader()
+        resumed.resume_from(position)
+        self.assertEqual(list(resumed.get_links), ['http://test.com/recipe/{0}'.format(i) for i in range(2, 5)])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.directory, 'checkpoint_test', 'collected'))),
+                         ['a.xml.gz', 'b.xml.gz'])
+
+
+if __name__ == '__main__':
+    unittest.main()
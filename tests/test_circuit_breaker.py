@@ -0,0 +1,105 @@
+import asyncio
+import tempfile
+import unittest
+from queue import Queue
+from unittest import mock
+from recipe_scraper import settings
+from recipe_scraper.async_scraper import AsyncScraper
+from recipe_scraper.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN, PROBE_WAIT, breaker_for
+from recipe_scraper.exceptions import InvalidResponse
+from recipe_scraper.robots import RobotsPolicy
+
+
+class _UnavailableRobots:
+
+    async def policy_for(self, url, user_agent=None):
+        return RobotsPolicy.unavailable()
+
+
+def _half_open_scraper(site):
+    scraper = AsyncScraper(base_path=['probe.com/recipe'], start_id=1, url_id_format='http://probe.com/recipe/{0}',
+                           site=site)
+    scraper.url_queue = Queue()
+    breaker = breaker_for(site)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(now=100.0)
+    breaker.wait_time(now=100.0 + breaker.reset_timeout)  # the scraper takes the probe slot
+    return scraper, breaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        # scrapers resolve the data directory on creation, point it at a temp directory instead of the environment
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_path = mock.patch.object(settings, '_data_path', self.directory.name)
+        self.data_path.start()
+
+    def tearDown(self):
+        self.data_path.stop()
+        self.directory.cleanup()
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker('test.com', failure_threshold=3, reset_timeout=10.0)
+        breaker.record_failure(now=100.0)
+        breaker.record_success()
+        breaker.record_failure(now=100.0)
+        breaker.record_failure(now=100.0)
+        self.assertEqual(breaker.wait_time(now=100.0), 0)
+        breaker.record_failure(now=100.0)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.wait_time(now=104.0), 6.0)
+
+    def test_single_probe_then_resume(self):
+        breaker = CircuitBreaker('test.com', failure_threshold=1, reset_timeout=10.0)
+        breaker.record_failure(now=100.0)
+        self.assertEqual(breaker.wait_time(now=110.0), 0)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertEqual(breaker.wait_time(now=110.0), PROBE_WAIT)  # only one probe at a time
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertEqual(breaker.wait_time(now=110.0), 0)
+
+    def test_failed_probe_doubles_pause(self):
+        breaker = CircuitBreaker('test.com', failure_threshold=1, reset_timeout=10.0, max_reset_timeout=15.0)
+        breaker.record_failure(now=100.0)
+        breaker.wait_time(now=110.0)
+        breaker.record_failure(now=110.0)
+        self.assertEqual(breaker.wait_time(now=110.0), 15.0)
+        breaker.wait_time(now=125.0)
+        breaker.record_failure(now=125.0)
+        self.assertEqual(breaker.wait_time(now=125.0), 15.0)
+
+    def test_cancelled_probe_lets_another_probe_through(self):
+        breaker = CircuitBreaker('test.com', failure_threshold=1, reset_timeout=10.0)
+        breaker.record_failure(now=100.0)
+        self.assertEqual(breaker.wait_time(now=110.0), 0)
+        breaker.cancel_probe()
+        self.assertEqual(breaker.wait_time(now=110.0), 0)
+        self.assertEqual(breaker.state, HALF_OPEN)
+
+    def test_probe_released_when_no_request_is_made(self):
+        loop = asyncio.new_event_loop()
+        try:
+            scraper, breaker = _half_open_scraper('probe-empty.com')
+            self.assertEqual(breaker.state, HALF_OPEN)
+            self.assertEqual(loop.run_until_complete(scraper.make_request()), (None, None))  # no url queued
+            self.assertEqual(breaker.wait_time(), 0)
+
+            scraper, breaker = _half_open_scraper('probe-robots.com')
+            scraper.url_queue.put('http://probe.com/recipe/7')
+            scraper.robots = _UnavailableRobots()
+            with self.assertRaises(InvalidResponse):
+                loop.run_until_complete(scraper.make_request())
+            self.assertEqual(scraper._deferred, 'http://probe.com/recipe/7')
+            self.assertEqual(breaker.wait_time(), 0)
+        finally:
+            loop.close()
+
+    def test_breakers_are_shared_per_domain(self):
+        self.assertIs(breaker_for('shared.com'), breaker_for('shared.com'))
+        self.assertIsNot(breaker_for('shared.com'), breaker_for('other.com'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import asyncio
+import shutil
+import tempfile
+import unittest
+from recipe_scraper.content_index import ContentHashIndex, content_hash
+
+RECIPE = {
+    'url': 'http://food.com/recipe/tea-1',
+    'title': 'Iced  Tea',
+    'ingredients': ['2 cups water', '1 tea bag'],
+    'instructions': ['Brew the tea.', 'Chill.'],
+}
+
+
+class TestContentHash(unittest.TestCase):
+
+    def test_normalized_content_hashes_the_same(self):
+        same = dict(RECIPE, url='http://food.com/recipe/1', title='iced tea ',
+                    instructions=[{'text': 'Brew the  tea.'}, 'CHILL.'])
+        self.assertEqual(content_hash(RECIPE), content_hash(same))
+
+    def test_fields_do_not_run_together(self):
+        moved = dict(RECIPE, ingredients=RECIPE['ingredients'][:1],
+                     instructions=RECIPE['ingredients'][1:] + RECIPE['instructions'])
+        self.assertNotEqual(content_hash(RECIPE), content_hash(moved))
+
+
+class TestContentHashIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index_file = os.path.join(self.directory, 'content_hashes.db')
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        shutil.rmtree(self.directory)
+
+    def check(self, index, recipe, written=True):
+        """Claims the recipe's hash like the scraper does, then records or releases it after the write"""
+        key = content_hash(recipe)
+        original = self.loop.run_until_complete(index.claim(key, recipe['url'], self.loop))
+        if original is None:
+            if written:
+                index.record(key)
+            else:
+                index.release(key)
+        return original
+
+    def test_duplicates_are_reported_with_the_first_url(self):
+        index = ContentHashIndex(self.index_file)
+        self.assertIsNone(self.check(index, RECIPE))
+        self.assertEqual(self.check(index, dict(RECIPE, url='http://food.com/recipe/1')), RECIPE['url'])
+        self.assertEqual((index.hits, index.misses), (1, 1))
+        index.close()
+
+    def test_evicted_hashes_are_found_on_disk(self):
+        index = ContentHashIndex(self.index_file, memory_size=2, batch_size=2)
+        recipes = [dict(RECIPE, title='tea {0}'.format(i), url='http://food.com/{0}'.format(i)) for i in range(5)]
+        for recipe in recipes:
+            self.assertIsNone(self.check(index, recipe))
+        self.assertEqual(len(index._recent), 2)
+        self.assertEqual(self.check(index, recipes[0]), 'http://food.com/0')
+        self.assertEqual(self.check(index, recipes[4]), 'http://food.com/4')  # still pending, not yet on disk
+        index.close()
+
+    def test_index_persists_across_runs(self):
+        index = ContentHashIndex(self.index_file)
+        self.check(index, RECIPE)
+        index.close()
+        index = ContentHashIndex(self.index_file)
+        self.assertEqual(self.check(index, RECIPE), RECIPE['url'])
+        self.assertEqual(index.hit_rate, 1.0)
+        index.close()
+
+    def test_failed_write_is_not_recorded(self):
+        index = ContentHashIndex(self.index_file)
+        self.assertIsNone(self.check(index, RECIPE, written=False))
+        self.assertIsNone(self.check(index, dict(RECIPE, url='http://food.com/recipe/1')))
+        index.close()
+        index = ContentHashIndex(self.index_file)
+        self.assertEqual(self.check(index, RECIPE), 'http://food.com/recipe/1')
+        index.close()
+
+    def test_hash_being_written_is_a_duplicate(self):
+        index = ContentHashIndex(self.index_file)
+        key = content_hash(RECIPE)
+
+        async def claim_both():
+            return await asyncio.gather(index.claim(key, RECIPE['url'], self.loop),
+                                        index.claim(key, 'http://food.com/recipe/1', self.loop))
+
+        claims = self.loop.run_until_complete(claim_both())
+        self.assertEqual(claims, [None, RECIPE['url']])
+        index.close()
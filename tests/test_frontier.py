@@ -0,0 +1,176 @@
+import os
+import asyncio
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from recipe_scraper import async_scraper, settings
+from recipe_scraper.async_scraper import AsyncScraper, RequestTimeouts, SITE_REQUEST_TIMEOUTS
+from recipe_scraper.exceptions import InvalidResponse
+from recipe_scraper.frontier import SQLiteFrontier, FrontierQueue
+from recipe_scraper.log_pipeline import FetchLog
+
+
+class _StalledResponse:
+    """Response whose headers arrived but whose body never does"""
+    status = 200
+    url = 'http://stall.com/recipe/1'
+
+    async def read(self):
+        await asyncio.sleep(10)
+
+    def release(self):
+        pass
+
+
+class _StalledSession:
+
+    def __init__(self, connector=None):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def get(self, url, headers=None):
+        return _StalledResponse()
+
+
+class TestSQLiteFrontier(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='frontier_test_')
+        self.db_file = os.path.join(self.directory, 'frontier.db')
+        self.node_a = SQLiteFrontier(self.db_file)
+        self.node_b = SQLiteFrontier(self.db_file)
+
+    def tearDown(self):
+        self.node_a.close()
+        self.node_b.close()
+        shutil.rmtree(self.directory)
+
+    def test_add_ignores_known_urls(self):
+        self.assertEqual(self.node_a.add('food', ['http://food.com/1', 'http://food.com/2']), 2)
+        self.assertEqual(self.node_b.add('food', ['http://food.com/2', 'http://food.com/3']), 1)
+        self.assertEqual(self.node_a.counts('food'), {'pending': 3, 'leased': 0, 'done': 0})
+
+    def test_nodes_never_lease_the_same_url(self):
+        self.node_a.add('food', ['http://food.com/{0}'.format(i) for i in range(10)])
+        self.node_a.add('chow', ['http://chow.com/1'])
+        leased_a = self.node_a.lease('food', 6, 'a')
+        leased_b = self.node_b.lease('food', 6, 'b')
+        self.assertEqual(len(leased_a), 6)
+        self.assertEqual(len(leased_b), 4)
+        self.assertFalse(set(leased_a) & set(leased_b))
+        self.assertEqual(self.node_b.lease('food', 6, 'b'), [])
+
+    def test_ack_release_and_expiry(self):
+        self.node_a.add('food', ['http://food.com/1', 'http://food.com/2', 'http://food.com/3'])
+        leased = self.node_a.lease('food', 3, 'a', visibility_timeout=-1)
+        self.node_a.ack([leased[0]], 'a')
+        self.node_a.release([leased[1]], 'a')
+        # leased[2] expired immediately and is handed to node b together with the released url
+        self.assertEqual(sorted(self.node_b.lease('food', 5, 'b')), sorted(leased[1:]))
+        # node a lost its lease, so its late ack must not finish node b's lease
+        self.node_a.ack([leased[2]], 'a')
+        self.assertEqual(self.node_a.counts(), {'pending': 0, 'leased': 2, 'done': 1})
+
+    def test_requeue_makes_done_urls_pending(self):
+        self.node_a.add('food', ['http://food.com/1'])
+        self.node_a.ack(self.node_a.lease('food', 1, 'a'), 'a')
+        self.node_a.add('food', ['http://food.com/1'])
+        self.assertEqual(self.node_a.lease('food', 1, 'a'), [])
+        self.node_a.requeue('food', ['http://food.com/1', 'http://food.com/2'])
+        self.assertEqual(sorted(self.node_b.lease('food', 5, 'b')), ['http://food.com/1', 'http://food.com/2'])
+
+
+class TestFrontierQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='frontier_test_')
+        self.frontier = SQLiteFrontier(os.path.join(self.directory, 'frontier.db'))
+        # scrapers resolve the data directory and log every fetch, keep both inside the test directory
+        self.fetch_log = FetchLog(os.path.join(self.directory, 'fetch.jsonl'))
+        self.patches = [mock.patch.object(settings, '_data_path', self.directory),
+                        mock.patch.object(async_scraper, 'FETCH_LOG', self.fetch_log)]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.fetch_log.close()
+        self.frontier.close()
+        shutil.rmtree(self.directory)
+
+    def test_queue_interface(self):
+        queue = FrontierQueue(self.frontier, 'food', owner='a', batch_size=2)
+        for i in range(3):
+            queue.put('http://food.com/{0}'.format(i))
+        self.assertFalse(queue.empty())
+        self.assertEqual(queue.qsize(), 2)
+        first = queue.get()
+        queue.ack(first)
+        queue.close()
+        self.assertEqual(self.frontier.counts('food'), {'pending': 2, 'leased': 0, 'done': 1})
+        other = FrontierQueue(self.frontier, 'food', owner='b', batch_size=5)
+        self.assertEqual(sorted([other.get(), other.get()]), ['http://food.com/1', 'http://food.com/2'])
+        self.assertTrue(other.empty())
+
+    def test_acknowledgements_are_batched(self):
+        queue = FrontierQueue(self.frontier, 'food', owner='a', batch_size=3, flush_interval=60.0)
+        for i in range(3):
+            queue.put('http://food.com/{0}'.format(i))
+        loop = asyncio.new_event_loop()
+        try:
+            urls = [loop.run_until_complete(queue.next_url(loop)) for _ in range(4)]
+        finally:
+            loop.close()
+        self.assertEqual(urls[3], None)
+        queue.ack(urls[0])
+        queue.release(urls[1])
+        self.frontier.submit(lambda: None).result()
+        self.assertEqual(self.frontier.counts('food'), {'pending': 0, 'leased': 3, 'done': 0})
+        queue.ack(urls[2])  # the third buffered url fills the batch
+        self.frontier.submit(lambda: None).result()
+        self.assertEqual(self.frontier.counts('food'), {'pending': 1, 'leased': 0, 'done': 2})
+
+    def test_failed_body_read_releases_the_url(self):
+        AsyncScraper.set_frontier(self.frontier, owner='a')
+        SITE_REQUEST_TIMEOUTS['stall.com'] = RequestTimeouts(read=0.01)
+        try:
+            scraper = AsyncScraper(base_path=['stall.com/recipe'], start_id=1,
+                                   url_id_format='http://stall.com/recipe/{0}', site='stall.com')
+            loop = asyncio.new_event_loop()
+            try:
+                with mock.patch.object(async_scraper, 'ClientSession', _StalledSession), \
+                        mock.patch.object(async_scraper, 'TCPConnector', mock.Mock()):
+                    with self.assertRaises(InvalidResponse):
+                        loop.run_until_complete(scraper.make_request())
+            finally:
+                loop.close()
+            scraper.url_queue.close()
+        finally:
+            AsyncScraper.set_frontier(None)
+            del SITE_REQUEST_TIMEOUTS['stall.com']
+        # the url whose body never arrived is pending again instead of acknowledged
+        self.assertEqual(self.frontier.counts('stall.com')['done'], 0)
+        self.assertEqual(self.frontier.counts('stall.com')['pending'], 50)
+
+    def test_restoring_a_checkpoint_hands_back_the_leases(self):
+        AsyncScraper.set_frontier(self.frontier, owner='a')
+        try:
+            scraper = AsyncScraper(base_path=['food.com/recipe'], start_id=1,
+                                   url_id_format='http://food.com/recipe/{0}', site='food.com')
+            self.assertFalse(scraper.url_queue_is_empty)  # leases the generated urls
+            scraper.restore_checkpoint({'current_id': 51})
+            scraper.url_queue.close()
+        finally:
+            AsyncScraper.set_frontier(None)
+        self.assertEqual(self.frontier.counts('food.com'), {'pending': 50, 'leased': 0, 'done': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import json
+import tempfile
+from unittest import TestCase, main as run_tests
+
+from recipe_scraper.ingredients import IngredientNormalizer, IngredientLine, parse_ingredient_line, parse_quantity
+
+
+class TestIngredientLines(TestCase):
+
+    def test_parse_quantity(self):
+        self.assertEqual(parse_quantity('2'), 2.0)
+        self.assertEqual(parse_quantity('1 1/2'), 1.5)
+        self.assertEqual(parse_quantity('3/4'), 0.75)
+        self.assertEqual(parse_quantity('1½'), 1.5)
+        self.assertEqual(parse_quantity('¼'), 0.25)
+        self.assertEqual(parse_quantity('.5'), 0.5)
+        self.assertEqual(parse_quantity('1 1/ 2'), 1.5)
+        self.assertEqual(parse_quantity('1 1 /2'), 1.5)
+        self.assertEqual(parse_quantity('1-1/2'), 1.5)
+        self.assertIsNone(parse_quantity('1/0'))
+        self.assertIsNone(parse_quantity('a'))
+        self.assertIsNone(parse_quantity(None))
+
+    def test_parse_ingredient_line(self):
+        self.assertEqual(parse_ingredient_line('1 1/2 cups (packed) brown sugar'),
+                         IngredientLine(1.5, None, 'cup', 'brown sugar', 'packed'))
+        self.assertEqual(parse_ingredient_line('1 (14.5 ounce) can diced tomatoes, drained'),
+                         IngredientLine(1.0, None, 'can', 'tomatoes', 'diced, 14.5 ounce, drained'))
+        self.assertEqual(parse_ingredient_line('2-3 Cloves garlic, minced'),
+                         IngredientLine(2.0, 3.0, 'clove', 'garlic', 'minced'))
+        self.assertEqual(parse_ingredient_line('3 Tbsp. finely chopped fresh parsley'),
+                         IngredientLine(3.0, None, 'tablespoon', 'fresh parsley', 'finely chopped'))
+        self.assertEqual(parse_ingredient_line('1 1/ 2 cups sugar'), IngredientLine(1.5, None, 'cup', 'sugar', None))
+        self.assertEqual(parse_ingredient_line('1 1 /2 cup milk'), IngredientLine(1.5, None, 'cup', 'milk', None))
+        self.assertEqual(parse_ingredient_line('1-1/2 cups flour'), IngredientLine(1.5, None, 'cup', 'flour', None))
+        self.assertEqual(parse_ingredient_line('1-2 cups flour'), IngredientLine(1.0, 2.0, 'cup', 'flour', None))
+        self.assertEqual(parse_ingredient_line('200g flour'), IngredientLine(200.0, None, 'gram', 'flour', None))
+        self.assertEqual(parse_ingredient_line('8 fl. oz cream'),
+                         IngredientLine(8.0, None, 'fluid ounce', 'cream', None))
+        self.assertEqual(parse_ingredient_line('pinch of salt'), IngredientLine(None, None, 'pinch', 'salt', None))
+        self.assertEqual(parse_ingredient_line('2 large eggs'), IngredientLine(2.0, None, None, 'large eggs', None))
+        self.assertEqual(parse_ingredient_line('1 orange'), IngredientLine(1.0, None, None, 'orange', None))
+        self.assertEqual(parse_ingredient_line('Cloves, whole'), IngredientLine(None, None, None, 'cloves', 'whole'))
+        self.assertEqual(parse_ingredient_line(''), IngredientLine(None, None, None, None, None))
+
+
+class TestIngredientNormalizer(TestCase):
+
+    def test_cached_normalize(self):
+        normalizer = IngredientNormalizer(cache_size=2)
+        lines = ['1 teaspoon salt', '2 large eggs', '1 teaspoon salt', None]
+        parsed = normalizer.normalize(lines)
+        self.assertEqual(len(parsed), 3)
+        self.assertEqual(dict(parsed[0]), {'quantity': 1.0, 'quantity_max': None, 'unit': 'teaspoon',
+                                           'name': 'salt', 'preparation': None})
+        self.assertEqual(normalizer.hit_rate, 1 / 3)
+        self.assertEqual(normalizer.normalize('2 large eggs')[0]['name'], 'large eggs')
+        normalizer.normalize(['1 cup milk', '1 cup water', '1 teaspoon salt'])
+        self.assertEqual(normalizer.parse.cache_info().currsize, 2)
+        self.assertEqual(normalizer.parse.cache_info().misses, 5)  # salt was evicted
+
+    def test_write_corpus(self):
+        recipes = [{'url': 'http://a.com/1', 'ingredients': ['1 cup milk']}, {'url': 'http://a.com/2'}]
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, 'ingredients.jsonl')
+            self.assertEqual(IngredientNormalizer().write_corpus(output_file, [recipes, None], verbose=False), 2)
+            with open(output_file) as f:
+                written = [json.loads(line) for line in f]
+        self.assertEqual(written[0]['ingredients'][0]['unit'], 'cup')
+        self.assertEqual(written[1], {'url': 'http://a.com/2', 'ingredients': []})
+
+
+if __name__ == '__main__':
+    run_tests()
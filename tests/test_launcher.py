@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from recipe_scraper import launcher, settings
+from recipe_scraper.launcher import ShardedLauncher, assign_shards
+from recipe_scraper.metrics import RECIPES_WRITTEN
+
+
+def _record_segment(sites, directory):
+    """Worker target: writes the worker's segment and sites, crashing once per shard"""
+    marker = os.path.join(directory, sites[0])
+    crashed_before = os.path.exists(marker)
+    with open(marker, 'a') as f:
+        f.write('{0}\t{1}\n'.format(settings.data_segment, ','.join(sites)))
+    RECIPES_WRITTEN.labels(sites[0]).inc(2)
+    if not crashed_before:
+        os._exit(3)
+
+
+class TestLauncher(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='launcher_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_assign_shards_balances_weight(self):
+        shards = assign_shards({'a': 5, 'b': 3, 'c': 2, 'd': 1, 'e': 1}, 2)
+        self.assertEqual(shards, [['a', 'd'], ['b', 'c', 'e']])
+        self.assertEqual(assign_shards({'a': 1}, 4), [['a']])
+
+    def test_crashed_workers_are_restarted_on_their_segment(self):
+        with mock.patch.object(launcher, 'RESTART_DELAY', 0.0):
+            runner = ShardedLauncher(_record_segment, [['a', 'b'], ['c']], args=(self.directory,),
+                                     status_interval=60, verbose=False)
+            failed = runner.run()
+        self.assertEqual(failed, 0)
+        self.assertEqual(runner.restarts, [1, 1])
+        with open(os.path.join(self.directory, 'a')) as f:
+            self.assertEqual(f.read(), 'w00\ta,b\n' * 2)
+        with open(os.path.join(self.directory, 'c')) as f:
+            self.assertEqual(f.read(), 'w01\tc\n' * 2)
+        self.assertEqual(runner.totals()['a']['recipes'], 2)
+
+    def test_gives_up_after_max_restarts(self):
+        with mock.patch.object(launcher, 'RESTART_DELAY', 0.0):
+            runner = ShardedLauncher(_record_segment, [['x']], args=(self.directory,), max_restarts=0,
+                                     verbose=False)
+            self.assertEqual(runner.run(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
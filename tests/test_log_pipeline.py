@@ -0,0 +1,77 @@
+import os
+import json
+import shutil
+import logging
+import tempfile
+import unittest
+from recipe_scraper.log_pipeline import QueuedLogging, FetchLog, FETCH_LOG_FIELDS
+
+
+class TestQueuedLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='log_pipeline_test_')
+        self.root = logging.getLogger()
+        self.root_handlers = self.root.handlers[:]
+        self.root_level = self.root.level
+        for handler in self.root_handlers:
+            self.root.removeHandler(handler)
+        self.file_name = os.path.join(self.directory, 'scraper.log')
+        self.handler = logging.FileHandler(self.file_name)
+        self.handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        self.root.addHandler(self.handler)
+        self.root.setLevel(logging.INFO)
+
+    def tearDown(self):
+        self.root.removeHandler(self.handler)
+        self.handler.close()
+        for handler in self.root_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.root_level)
+        shutil.rmtree(self.directory)
+
+    def test_stop_flushes_every_record(self):
+        queued_logging = QueuedLogging().start()
+        self.assertNotIn(self.handler, self.root.handlers)
+        logger = logging.getLogger('recipe_scraper.test')
+        for number in range(500):
+            logger.info("record {0}".format(number))
+        logger.debug("below the level")
+        queued_logging.stop()
+        self.assertEqual(self.root.handlers, [self.handler])
+        with open(self.file_name) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines, ['INFO record {0}'.format(number) for number in range(500)])
+
+
+class TestFetchLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='log_pipeline_test_')
+        self.file_name = os.path.join(self.directory, 'fetch.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_record_shape(self):
+        fetch_log = FetchLog(self.file_name, batch_size=2)
+        fetch_log.record('food', 'http://food.com/1', 'http://www.food.com/1', 200, 3500, 0.123456)
+        fetch_log.record('food', 'http://food.com/2', None, None, 0, 10.0, 'timeout_read')
+        fetch_log.record('food', 'http://food.com/3', 'http://food.com/3', 404, 0, 0.5)
+        fetch_log.close()
+        with open(self.file_name) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(tuple(records[0]), FETCH_LOG_FIELDS)
+        self.assertEqual(dict(records[0], ts=None), {'ts': None, 'site': 'food', 'url': 'http://food.com/1',
+                                                     'final': 'http://www.food.com/1', 'status': 200, 'bytes': 3500,
+                                                     'seconds': 0.1235})
+        self.assertEqual(records[1]['error'], 'timeout_read')
+        self.assertIsNone(records[1]['final'])
+        self.assertIsNone(records[1]['status'])
+        self.assertNotIn('error', records[2])
+        self.assertEqual(list(FetchLog(self.file_name).iter_records()), records)
+
+
+if __name__ == '__main__':
+    unittest.main()
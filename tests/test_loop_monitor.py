@@ -0,0 +1,93 @@
+import os
+import asyncio
+import shutil
+import tempfile
+import threading
+import unittest
+from time import sleep
+from recipe_scraper.loop_monitor import LoopMonitor, SamplingProfiler, set_activity
+
+
+def _blocking_parse():
+    sleep(0.3)
+
+
+class TestLoopMonitor(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        set_activity(None)
+        self.loop.close()
+
+    def test_stall_is_attributed_to_the_current_activity(self):
+        monitor = LoopMonitor(self.loop, interval=0.02, threshold=0.1)
+
+        def block():
+            set_activity('food.com', 'http://food.com/recipe/1')
+            _blocking_parse()
+
+        async def crawl():
+            monitor.start()
+            await asyncio.sleep(0.1)
+            self.loop.call_soon(block)
+            await asyncio.sleep(0.2)
+            monitor.stop()
+
+        with self.assertLogs('recipe_scraper', level='WARNING') as logs:
+            self.loop.run_until_complete(crawl())
+        self.assertEqual(monitor.stalls, 1)
+        self.assertGreaterEqual(monitor.max_lag, 0.2)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('site: food.com, url: http://food.com/recipe/1', logs.output[0])
+        self.assertIn('_blocking_parse', logs.output[0])  # the stack of the loop thread while it was blocked
+
+    def test_no_stall_when_the_loop_keeps_up(self):
+        monitor = LoopMonitor(self.loop, interval=0.02, threshold=0.1)
+
+        async def crawl():
+            monitor.start()
+            for _ in range(10):
+                await asyncio.sleep(0.02)
+            monitor.stop()
+
+        self.loop.run_until_complete(crawl())
+        self.assertEqual(monitor.stalls, 0)
+        self.assertLess(monitor.max_lag, 0.1)
+
+
+class TestSamplingProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='profiler_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_writes_folded_stacks_of_the_sampled_thread(self):
+        output_file = os.path.join(self.directory, 'profile.folded')
+        profiler = SamplingProfiler(threading.get_ident(), output_file, interval=0.002, duration=0.2)
+        thread = profiler.start()
+        _blocking_parse()
+        thread.join()
+        with open(output_file) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        counts = [int(line.rsplit(' ', 1)[1]) for line in lines]
+        self.assertEqual(counts, sorted(counts, reverse=True))  # most sampled stack first
+        # outermost frame first, the sampled thread spent the profile in _blocking_parse
+        self.assertTrue(lines[0].rsplit(' ', 1)[0].split(';')[-1].startswith('test_loop_monitor.py:_blocking_parse:'))
+
+    def test_fold_joins_frames_outermost_first(self):
+        def inner():
+            import sys
+            return SamplingProfiler._fold(sys._getframe())
+
+        names = inner().split(';')
+        self.assertTrue(names[-1].startswith('test_loop_monitor.py:inner:'))
+        self.assertTrue(names[-2].startswith('test_loop_monitor.py:test_fold_joins_frames_outermost_first:'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+from unittest import TestCase, main as run_tests
+
+from recipe_scraper.metrics import MetricsRegistry, Counter, Histogram
+
+
+class TestMetricsRegistry(TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.responses = self.registry.register(Counter('responses_total', 'Responses.', ('site', 'status')))
+        self.latency = self.registry.register(Histogram('fetch_seconds', 'Latency.', buckets=(0.1, 1.0)))
+
+    def test_render_counters_and_histograms(self):
+        self.responses.labels('allrecipes', 200).inc()
+        self.responses.labels('allrecipes', 200).inc(2)
+        self.responses.labels('food', 'error').inc()
+        for value in (0.05, 0.1, 0.5, 3.0):
+            self.latency.labels('allrecipes').observe(value)
+        text = self.registry.render()
+        self.assertIn('# TYPE responses_total counter', text)
+        self.assertIn('responses_total{site="allrecipes",status="200"} 3', text)
+        self.assertIn('responses_total{site="food",status="error"} 1', text)
+        self.assertIn('fetch_seconds_bucket{site="allrecipes",le="0.1"} 2', text)
+        self.assertIn('fetch_seconds_bucket{site="allrecipes",le="1.0"} 3', text)
+        self.assertIn('fetch_seconds_bucket{site="allrecipes",le="+Inf"} 4', text)
+        self.assertIn('fetch_seconds_sum{site="allrecipes"} 3.65', text)
+        self.assertIn('fetch_seconds_count{site="allrecipes"} 4', text)
+
+    def test_label_count_is_checked(self):
+        with self.assertRaises(ValueError):
+            self.responses.labels('allrecipes')
+
+    def test_write_textfile(self):
+        self.responses.labels('chow', 404).inc()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'scraper.prom')
+            self.registry.write_textfile(path)
+            with open(path, 'r') as f:
+                self.assertIn('responses_total{site="chow",status="404"} 1', f.read())
+            self.assertEqual(os.listdir(directory), ['scraper.prom'])
+
+
+if __name__ == '__main__':
+    run_tests()
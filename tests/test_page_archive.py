@@ -0,0 +1,36 @@
+import os
+import tempfile
+from unittest import TestCase, main as run_tests
+
+from recipe_scraper.page_archive import PageArchive
+
+
+class TestPageArchive(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_store_deduplicates_and_reads_back(self):
+        archive = PageArchive(self.directory.name)
+        archive.store('http://allrecipes.com/recipe/1', 'http://allrecipes.com/recipe/1/bread/', 200, b'<html>a</html>')
+        archive.store('http://allrecipes.com/recipe/2', 'http://allrecipes.com/recipe/2/soup/', 200, b'<html>b</html>')
+        archive.store('http://allrecipes.com/recipe/1/bread', 'http://allrecipes.com/recipe/1/bread/', 200,
+                      b'<html>a</html>')
+        archive.close()
+        self.assertEqual((archive.stored, archive.duplicates), (2, 1))
+
+        reopened = PageArchive(self.directory.name)
+        index = list(reopened.iter_index())
+        self.assertEqual(len(index), 3)
+        self.assertEqual((index[0].segment, index[0].offset), (index[2].segment, index[2].offset))
+        pages = {page.url: body for page, body in reopened.iter_pages()}
+        self.assertEqual(pages['http://allrecipes.com/recipe/2'], b'<html>b</html>')
+        self.assertEqual(pages['http://allrecipes.com/recipe/1/bread'], b'<html>a</html>')
+        self.assertEqual(len([f for f in os.listdir(self.directory.name) if f.endswith('.warc.gz')]), 1)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,77 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase, main as run_tests
+
+from recipe_scraper.recipe_store import SQLiteRecipeStore, canonical_url
+
+
+class TestSQLiteRecipeStore(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.directory.name, 'recipes.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_canonical_url(self):
+        self.assertEqual(canonical_url('HTTP://WWW.Food.com/recipe/tea-2/#reviews'), 'http://www.food.com/recipe/tea-2')
+
+    def test_upsert_keeps_latest_version(self):
+        store = SQLiteRecipeStore(self.db_file, batch_size=2)
+        store.add({'url': 'http://www.food.com/recipe/tea-2/', 'title': 'Tea', 'ingredients': ['tea']})
+        store.add({'url': 'http://www.food.com/recipe/tea-2', 'title': 'Iced Tea', 'ingredients': ['tea', 'ice']})
+        store.add({'url': 'http://allrecipes.com/recipe/1', 'title': 'Bread', 'ingredients': ['flour']})
+        self.assertEqual(store.get('http://www.food.com/recipe/tea-2#top')['title'], 'Iced Tea')
+        store.close()
+
+        connection = sqlite3.connect(self.db_file)
+        rows = connection.execute('SELECT site, title FROM recipes ORDER BY site').fetchall()
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        connection.close()
+        self.assertEqual(rows, [('allrecipes.com', 'Bread'), ('food.com', 'Iced Tea')])
+        self.assertIn('recipes_site_idx', indexes)
+        self.assertIn('recipes_fetched_at_idx', indexes)
+
+    def indexes(self):
+        connection = sqlite3.connect(self.db_file)
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        connection.close()
+        return indexes
+
+    def test_crawl_store_keeps_its_indexes(self):
+        store = SQLiteRecipeStore(self.db_file, bulk_load=True)
+        self.assertNotIn('recipes_site_idx', self.indexes())  # dropped until the bulk load is closed
+        store.close()
+        store = SQLiteRecipeStore(self.db_file)
+        store.add({'url': 'http://allrecipes.com/recipe/1', 'title': 'Bread', 'ingredients': ['flour']})
+        store.flush()
+        self.assertIsNotNone(store.get('http://allrecipes.com/recipe/1'))
+        self.assertIn('recipes_site_idx', self.indexes())
+        store.close()
+
+    def test_buffered_recipes_are_found(self):
+        store = SQLiteRecipeStore(self.db_file, batch_size=100)
+        store.add({'url': 'http://www.food.com/recipe/tea-2', 'title': 'Tea', 'ingredients': ['tea']})
+        store.add({'url': 'http://www.food.com/recipe/tea-2/', 'title': 'Iced Tea', 'ingredients': ['tea', 'ice']})
+        self.assertEqual(store.get('http://www.food.com/recipe/tea-2')['title'], 'Iced Tea')
+        self.assertIn('http://www.food.com/recipe/tea-2#top', store)
+        self.assertNotIn('http://www.food.com/recipe/coffee-3', store)
+        self.assertEqual(store.written, 0)
+        store.close()
+        self.assertEqual(store.written, 2)
+
+    def test_failed_batches_are_logged(self):
+        store = SQLiteRecipeStore(self.db_file, batch_size=1)
+        with self.assertLogs('recipe_scraper', level='ERROR') as logs:
+            store.add({'url': 'http://food.com/recipe/1', 'title': 'Tea', 'ingredients': {'not', 'serializable'}})
+            store.add({'url': 'http://food.com/recipe/2', 'title': 'Coffee', 'ingredients': ['coffee']})
+            store.close()
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('Error writing 1 recipes', logs.output[0])
+        self.assertEqual(store.written, 1)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,62 @@
+import json
+from unittest import TestCase, main as run_tests
+
+from recipe_scraper.records import RecipeRecord, recipe_json
+from recipe_scraper.ingredients import IngredientNormalizer
+from recipe_scraper.content_index import content_hash
+
+RECIPE = {
+    'title': 'Pancakes',
+    'ingredients': ['1 cup flour', '1 egg'],
+    'instructions': ['Mix.', 'Fry.'],
+    'time': {'prepTime': 'PT5M', 'cookTime': None},
+    'yield': '4 pancakes',
+    'reviews': {'text': [], 'ratings': {'count': '3'}},
+    'url': 'http://a.com/pancakes',
+}
+
+
+def _record():
+    return RecipeRecord(title=RECIPE['title'], ingredients=RECIPE['ingredients'],
+                        instructions=RECIPE['instructions'], time=RECIPE['time'], recipe_yield=RECIPE['yield'],
+                        reviews=RECIPE['reviews'], url=RECIPE['url'])
+
+
+class TestRecipeRecord(TestCase):
+
+    def test_reads_like_a_dict(self):
+        record = _record()
+        self.assertEqual(record['yield'], '4 pancakes')
+        self.assertEqual(record.get('url'), 'http://a.com/pancakes')
+        self.assertIsNone(record.get('parsed_ingredients'))
+        self.assertEqual(record.get('missing', 'default'), 'default')
+        self.assertNotIn('parsed_ingredients', record)
+        self.assertEqual(list(record), list(RECIPE))
+        self.assertEqual(record, RECIPE)
+        self.assertEqual(content_hash(record), content_hash(RECIPE))
+        with self.assertRaises(KeyError):
+            record['missing'] = 1
+        with self.assertRaises(AttributeError):
+            record.missing = 1
+
+    def test_serializes_once(self):
+        record = _record()
+        serialized = recipe_json(record)
+        self.assertEqual(serialized, json.dumps(RECIPE))
+        self.assertIs(record.to_json(), serialized)
+        record['url'] = 'http://a.com/pancakes-2'
+        self.assertEqual(json.loads(record.to_json())['url'], 'http://a.com/pancakes-2')
+        record.title = 'Crepes'
+        self.assertEqual(json.loads(record.to_json())['title'], 'Crepes')
+        self.assertEqual(recipe_json(RECIPE), json.dumps(RECIPE))
+
+    def test_parsed_ingredients_are_written_when_set(self):
+        record = IngredientNormalizer().normalize_recipe(_record())
+        self.assertIn('parsed_ingredients', record)
+        written = json.loads(record.to_json())
+        self.assertEqual(list(written)[-1], 'parsed_ingredients')
+        self.assertEqual(written['parsed_ingredients'][0]['unit'], 'cup')
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,84 @@
+import os
+import asyncio
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict
+from queue import Queue
+from time import time
+from unittest import mock
+from recipe_scraper import settings
+from recipe_scraper.async_scraper import AsyncScraper
+from recipe_scraper.retry import RetryScheduler, RetryPolicy, DeadLetterFile
+
+
+class TestRetryScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='retry_test_')
+        self.dead_letters = DeadLetterFile(os.path.join(self.directory, 'dead_letters.jsonl'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_backoff_grows_with_jitter(self):
+        policy = RetryPolicy(base_delay=2.0, max_delay=10.0)
+        for attempts, low, high in ((1, 1.0, 2.0), (2, 2.0, 4.0), (3, 4.0, 8.0), (10, 5.0, 10.0)):
+            delay = policy.delay(attempts)
+            self.assertTrue(low <= delay <= high, (attempts, delay))
+
+    def test_retries_wait_until_due(self):
+        scheduler = RetryScheduler(self.dead_letters, policy=RetryPolicy(base_delay=10.0))
+        self.assertTrue(scheduler.schedule('food', 'http://food.com/1', 'ClientOSError'))
+        self.assertIsNone(scheduler.pop_due('food'))
+        self.assertIsNone(scheduler.pop_due('chow', now=time() + 60))
+        self.assertEqual(scheduler.pop_due('food', now=time() + 60), 'http://food.com/1')
+        self.assertEqual(scheduler.waiting, 0)
+
+    def test_dead_letter_after_max_attempts(self):
+        scheduler = RetryScheduler(self.dead_letters, policy=RetryPolicy(max_attempts=3))
+        self.assertTrue(scheduler.schedule('food', 'http://food.com/1', 'HTTP 503'))
+        self.assertTrue(scheduler.schedule('food', 'http://food.com/1', 'HTTP 503'))
+        self.assertFalse(scheduler.schedule('food', 'http://food.com/1', 'HTTP 502'))
+        entries = self.dead_letters.drain()
+        self.assertEqual([(e['site'], e['url'], e['attempts'], e['error']) for e in entries],
+                         [('food', 'http://food.com/1', 3, 'HTTP 502')])
+        self.assertEqual(self.dead_letters.drain(), [])
+
+    def test_finished_resets_attempts(self):
+        scheduler = RetryScheduler(self.dead_letters, policy=RetryPolicy(max_attempts=2))
+        scheduler.schedule('food', 'http://food.com/1', 'HTTP 503')
+        scheduler.finished('http://food.com/1')
+        self.assertEqual(scheduler._attempts, {})
+        self.assertTrue(scheduler.schedule('food', 'http://food.com/1', 'HTTP 503'))
+
+    def test_skipped_retry_forgets_attempts(self):
+        scheduler = RetryScheduler(self.dead_letters, policy=RetryPolicy(base_delay=0.0))
+        scheduler.schedule('food.com', 'http://food.com/recipe/1', 'HTTP 503')
+        with mock.patch.object(settings, '_data_path', self.directory), \
+                mock.patch.object(AsyncScraper, 'retry_scheduler', scheduler), \
+                mock.patch.object(AsyncScraper, 'fetched_urls', OrderedDict()):
+            scraper = AsyncScraper(base_path=['food.com/recipe'], start_id=1,
+                                   url_id_format='http://food.com/recipe/{0}', site='food.com')
+            scraper._url_queue = Queue()
+            scraper._remember_fetched('http://food.com/recipe/1')  # fetched by another scraper meanwhile
+            loop = asyncio.new_event_loop()
+            try:
+                self.assertEqual(loop.run_until_complete(scraper.make_request()), (None, None))
+            finally:
+                loop.close()
+        self.assertEqual(scheduler._attempts, {})
+
+    def test_pending_round_trip(self):
+        scheduler = RetryScheduler(self.dead_letters, site_policies={'food': RetryPolicy(base_delay=100.0)})
+        scheduler.schedule('food', 'http://food.com/1', 'HTTP 503')
+        pending = scheduler.pending('food')
+        self.assertEqual(pending[0][:2], ['http://food.com/1', 1])
+        restored = RetryScheduler(self.dead_letters)
+        restored.restore('food', pending)
+        self.assertEqual(restored.pending('food')[0][:2], ['http://food.com/1', 1])
+        self.assertEqual(restored.pop_due('food', now=time() + 200), 'http://food.com/1')
+
+
+if __name__ == '__main__':
+    unittest.main()
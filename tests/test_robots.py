@@ -0,0 +1,89 @@
+import unittest
+import asyncio
+from recipe_scraper.robots import RobotsPolicy, RobotsCache
+
+ROBOTS_TXT = """
+# comment
+User-agent: Googlebot
+Disallow: /
+
+User-agent: *
+Disallow: /Search
+Disallow: /recipe/*/print$
+Allow: /Search/Recipes
+Crawl-delay: 10
+
+Sitemap: https://www.Example.com/Sitemaps/Index.xml
+"""
+
+
+class TestRobotsPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = RobotsPolicy.parse(ROBOTS_TXT)
+
+    def test_longest_match_wins(self):
+        self.assertTrue(self.policy.allowed('http://example.com/recipe/123'))
+        self.assertFalse(self.policy.allowed('http://example.com/Search?q=cake'))
+        self.assertTrue(self.policy.allowed('http://example.com/Search/Recipes/cake'))
+
+    def test_paths_are_case_sensitive(self):
+        self.assertTrue(self.policy.allowed('http://example.com/search'))
+
+    def test_wildcard_and_end_anchor(self):
+        self.assertFalse(self.policy.allowed('http://example.com/recipe/123/print'))
+        self.assertTrue(self.policy.allowed('http://example.com/recipe/123/print/again'))
+
+    def test_crawl_delay_and_sitemaps_keep_case(self):
+        self.assertEqual(self.policy.crawl_delay, 10.0)
+        self.assertEqual(self.policy.sitemaps, ['https://www.Example.com/Sitemaps/Index.xml'])
+
+    def test_named_group_overrides_wildcard(self):
+        policy = RobotsPolicy.parse(ROBOTS_TXT, user_agent='Googlebot/2.1')
+        self.assertFalse(policy.allowed('http://example.com/recipe/123'))
+        self.assertIsNone(policy.crawl_delay)
+
+    def test_request_rate(self):
+        policy = RobotsPolicy.parse("User-agent: *\nRequest-rate: 1/5\n")
+        self.assertEqual(policy.crawl_delay, 5.0)
+
+    def test_empty_disallow_allows_everything(self):
+        policy = RobotsPolicy.parse("User-agent: *\nDisallow:\n")
+        self.assertTrue(policy.allowed('http://example.com/anything'))
+
+    def test_unavailable_disallows_until_expired(self):
+        policy = RobotsPolicy.unavailable(ttl=0)
+        self.assertFalse(policy.available)
+        self.assertFalse(policy.allowed('http://example.com/recipe/1'))
+        self.assertTrue(policy.expired)
+
+
+class TestRobotsCache(unittest.TestCase):
+
+    def test_one_fetch_per_host_until_expired(self):
+        fetched, agents = [], []
+
+        class FakeCache(RobotsCache):
+            async def _fetch(self, robots_url, user_agent):
+                fetched.append(robots_url)
+                agents.append(user_agent)
+                return RobotsPolicy.parse(ROBOTS_TXT, ttl=self.ttl)
+
+        async def concurrent_lookups():
+            return await asyncio.gather(cache.policy_for('http://Example.com/recipe/1', 'TestAgent/1.0'),
+                                        cache.policy_for('http://example.com/recipe/2', 'TestAgent/1.0'))
+
+        cache = FakeCache()
+        loop = asyncio.new_event_loop()
+        try:
+            policies = loop.run_until_complete(concurrent_lookups())
+            self.assertIs(policies[0], policies[1])
+            self.assertEqual(fetched, ['http://example.com/robots.txt'])
+            self.assertEqual(agents, ['TestAgent/1.0'])
+            self.assertIs(cache.cached('http://example.com/recipe/3'), policies[0])
+            policies[0].expires_at = 0
+            loop.run_until_complete(cache.policy_for('http://example.com/recipe/4'))
+            self.assertEqual(len(fetched), 2)
+            self.assertTrue(agents[1])  # a random agent without the scraper's
+        finally:
+            loop.close()
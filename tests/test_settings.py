@@ -0,0 +1,43 @@
+import os
+import unittest
+from unittest import mock
+from recipe_scraper import settings as package_settings
+from recipe_scraper.async_scraper import DataFileManager
+from recipe_scraper.settings import Settings, EATERATOR_ENV_VARIABLE
+from recipe_scraper.exceptions import ScraperSettingsError
+
+
+class TestSettings(unittest.TestCase):
+
+    def test_missing_data_path_raises_on_use(self):
+        with mock.patch.dict(os.environ, clear=True):
+            settings = Settings()
+            with self.assertRaises(ScraperSettingsError):
+                settings.data_path
+
+    def test_environment_read_lazily(self):
+        settings = Settings()
+        with mock.patch.dict(os.environ, {EATERATOR_ENV_VARIABLE: '/data', 'MAX_FILE_SIZE': '2048'}):
+            self.assertEqual(settings.data_path, '/data')
+            self.assertEqual(settings.max_file_size, 2048)
+            self.assertEqual(settings.logging_file, os.path.join('/data', 'log', 'log.txt'))
+
+    def test_configure_overrides_environment(self):
+        settings = Settings().configure(data_path='/configured', max_daily_files='5')
+        with mock.patch.dict(os.environ, {EATERATOR_ENV_VARIABLE: '/data'}):
+            self.assertEqual(settings.data_path, '/configured')
+            self.assertEqual(settings.max_daily_files, 5)
+            self.assertEqual(settings.sitemap_path, os.path.join('/configured', 'sitemaps'))
+
+
+    def test_data_file_manager_resolves_data_path_on_use(self):
+        with mock.patch.dict(os.environ, clear=True), mock.patch.object(package_settings, '_data_path', None):
+            manager = DataFileManager()
+            with self.assertRaises(ScraperSettingsError):
+                manager.data_folder
+            with mock.patch.object(package_settings, '_data_path', '/configured'):
+                self.assertEqual(manager.data_folder, '/configured')
+
+
+if __name__ == '__main__':
+    unittest.main()
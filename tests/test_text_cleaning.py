@@ -0,0 +1,65 @@
+import json
+from unittest import TestCase, main as run_tests
+
+from bs4 import BeautifulSoup
+
+from recipe_scraper.recipe_parsers import HRecipeParser, JsonLdParser
+from recipe_scraper.text_cleaning import clean_text, clean_texts
+
+HRECIPE_PAGE = """<html><body><div class="hrecipe">
+<h1 itemprop="name">  Crème   Brûlée </h1>
+<ul><li itemprop="ingredients">  2 cups
+      heavy cream</li><li itemprop="ingredients">   </li><li itemprop="ingredients">1&frac12; tsp vanilla</li></ul>
+<p itemprop="recipeInstructions">Heat the cream.
+
+   Whisk in the\u200b yolks.</p>
+<p itemprop="reviewBody">  So   good!  </p>
+</div></body></html>"""
+
+JSON_LD_RECIPE = {
+    '@type': 'Recipe',
+    'name': 'Café Brownies &amp; More',
+    'recipeIngredient': ['1 cup sugar', ' 2 eggs ', ''],
+    'recipeInstructions': [{'@type': 'HowToStep', 'text': '&lt;p&gt;Bake for\n30 minutes.&lt;/p&gt;'}],
+    'recipeYield': ' 12  brownies ',
+}
+
+
+class TestTextCleaning(TestCase):
+
+    def test_clean_text(self):
+        self.assertEqual(clean_text('  two\n\n  large\teggs  '), 'two large eggs')
+        self.assertEqual(clean_text('Salt &amp; pepper'), 'Salt & pepper')
+        self.assertEqual(clean_text('<p>Mix well.</p><p>Bake.</p>'), 'Mix well. Bake.')
+        self.assertEqual(clean_text('heat to &lt; 100 degrees'), 'heat to < 100 degrees')
+        self.assertEqual(clean_text('soft\u00adened\u200b butter\x00'), 'softened butter')
+        self.assertEqual(clean_text('Cafe\u0301'), 'Caf\u00e9')  # composed
+        self.assertEqual(clean_text('1½ cups'), '1½ cups')  # no compatibility folding
+        self.assertIsNone(clean_text(None))
+        self.assertEqual(clean_text(4), 4)
+
+    def test_clean_texts(self):
+        self.assertEqual(clean_texts([' a  b ', '', '  ', None, 'c']), ['a b', 'c'])
+        self.assertEqual(clean_texts(' one '), ['one'])
+        self.assertEqual(clean_texts(None), [])
+        step = {'@type': 'HowToStep', 'text': ' Stir. '}
+        self.assertEqual(clean_texts([step]), [{'@type': 'HowToStep', 'text': 'Stir.'}])
+        self.assertEqual(step['text'], ' Stir. ')
+
+    def test_parsers_clean_the_same_way(self):
+        data = HRecipeParser.get_parser()(BeautifulSoup(HRECIPE_PAGE, 'lxml'))
+        self.assertEqual(data['title'], 'Crème Brûlée')
+        self.assertEqual(data['ingredients'], ['2 cups heavy cream', '1½ tsp vanilla'])
+        self.assertEqual(data['instructions'], ['Heat the cream. Whisk in the yolks.'])
+        self.assertEqual(data['reviews']['text'], ['So good!'])
+        page = '<html><head><script type="application/ld+json">{0}</script></head></html>'.format(
+            json.dumps(JSON_LD_RECIPE))
+        data = JsonLdParser.get_parser()(BeautifulSoup(page, 'lxml'))
+        self.assertEqual(data['title'], 'Café Brownies & More')
+        self.assertEqual(data['ingredients'], ['1 cup sugar', '2 eggs'])
+        self.assertEqual(data['instructions'], [{'@type': 'HowToStep', 'text': 'Bake for 30 minutes.'}])
+        self.assertEqual(data['yield'], '12 brownies')
+
+
+if __name__ == '__main__':
+    run_tests()
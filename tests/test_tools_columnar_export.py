@@ -0,0 +1,61 @@
+import os
+import tempfile
+from unittest import TestCase, skipIf, main as run_tests
+
+from recipe_scraper.tools.columnar_export import ColumnarExporter, parse_iso8601_duration, pyarrow
+
+SAMPLE_RECIPES = [
+    {
+        'url': 'http://www.foodnetwork.com/recipes/crostini',
+        'title': 'Crostini',
+        'ingredients': ['1 baguette', '2 tablespoons olive oil'],
+        'instructions': [{'@type': 'HowToStep', 'text': 'Slice.'}, 'Toast.'],
+        'time': {'prepTime': 'PT15M', 'cookTime': 'PT1H5M'},
+        'yield': ['4 servings'],
+        'reviews': {'text': [], 'ratings': {'average': '4.5 stars', 'count': '1,204', 'best': None, 'worst': None}},
+    },
+    {
+        'url': 'http://allrecipes.com/recipe/6664/cornbread/',
+        'title': 'Cornbread',
+        'ingredients': ['1 cup cornmeal'],
+        'instructions': [],
+        'time': {'prepTime': ['20 mins', 'PT20M'], 'cookTime': []},
+        'yield': None,
+        'reviews': {'text': ['great'], 'ratings': {'ratings': []}},
+    },
+]
+
+
+class TestColumnarExport(TestCase):
+
+    def test_parse_iso8601_duration(self):
+        self.assertEqual(parse_iso8601_duration('PT1H20M'), 4800)
+        self.assertEqual(parse_iso8601_duration('P0DT0H20M'), 1200)
+        self.assertEqual(parse_iso8601_duration(['20 mins', 'PT30S']), 30)
+        self.assertIsNone(parse_iso8601_duration('P'))
+        self.assertIsNone(parse_iso8601_duration('20 mins'))
+        self.assertIsNone(parse_iso8601_duration(None))
+
+    def test_flatten(self):
+        row = ColumnarExporter.flatten(SAMPLE_RECIPES[0])
+        self.assertEqual(row['site'], 'foodnetwork.com')
+        self.assertEqual(row['yield'], '4 servings')
+        self.assertEqual(row['instructions'], ['Slice.', 'Toast.'])
+        self.assertEqual(row['rating_average'], 4.5)
+        self.assertEqual(row['rating_count'], 1204)
+        self.assertEqual(row['cook_time_seconds'], 3900)
+
+    @skipIf(pyarrow is None, "pyarrow not installed")
+    def test_export_in_chunks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, 'corpus.parquet')
+            count = ColumnarExporter(output_file, chunk_size=1, verbose=False).export([SAMPLE_RECIPES, [None]])
+            table = pyarrow.parquet.read_table(output_file)
+            self.assertEqual(count, 2)
+            self.assertEqual(table.num_rows, 2)
+            self.assertEqual(table.column('prep_time_seconds').to_pylist(), [900, 1200])
+            self.assertEqual(table.column('ingredients').to_pylist()[1], ['1 cup cornmeal'])
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,76 @@
+import os
+import json
+import math
+import tempfile
+from unittest import TestCase, skipIf, main as run_tests
+
+from recipe_scraper.tools.cooccurrence import CooccurrenceMatrix, ingredient_name, sparse
+
+
+def _recipe(*ingredients):
+    return {'url': 'http://a.com/' + '-'.join(ingredients), 'ingredients': list(ingredients)}
+
+
+RECIPES = [
+    _recipe('2 tomatoes', '8 oz mozzarella', '1/4 cup basil'),
+    _recipe('3 tomatoes, chopped', '2 tablespoons basil', '2 tablespoons olive oil'),
+    _recipe('1 cup rice', '2 cups chicken stock'),
+    _recipe('1 lb chicken thighs', '1 tomato, diced', '1 tbsp olive oil'),
+]
+
+
+@skipIf(sparse is None, "numpy and scipy not installed")
+class TestCooccurrenceMatrix(TestCase):
+
+    def build(self, chunk_recipes):
+        return CooccurrenceMatrix(chunk_recipes=chunk_recipes, verbose=False).build([RECIPES[:1], None, RECIPES[1:]])
+
+    def count(self, matrix, a, b):
+        return matrix.counts[matrix.vocabulary[a], matrix.vocabulary[b]]
+
+    def test_one_ingredient_per_line(self):
+        self.assertEqual(ingredient_name('2 tablespoons extra-virgin olive oil'), 'extra virgin olive oil')
+        self.assertEqual(ingredient_name('1 lb chicken thighs'), 'chicken thigh')
+        self.assertEqual(ingredient_name('3 tomatoes, chopped'), 'tomato')
+        self.assertIsNone(ingredient_name('2 cups'))
+        matrix = self.build(100)
+        self.assertEqual(sorted(matrix.terms), ['basil', 'chicken stock', 'chicken thigh', 'mozzarella', 'olive oil',
+                                                'rice', 'tomato'])
+        self.assertEqual(self.count(matrix, 'olive oil', 'olive oil'), 2)
+
+    def test_counts_do_not_depend_on_chunking(self):
+        whole, chunked = self.build(100), self.build(1)
+        self.assertEqual(whole.recipe_count, 4)
+        self.assertEqual(whole.terms, chunked.terms)
+        self.assertEqual((whole.counts != chunked.counts).nnz, 0)
+        self.assertEqual(self.count(whole, 'tomato', 'tomato'), 3)
+        self.assertEqual(self.count(whole, 'tomato', 'basil'), 2)
+        self.assertEqual(self.count(whole, 'basil', 'tomato'), 2)
+        self.assertEqual(self.count(whole, 'rice', 'tomato'), 0)
+
+    def test_scores(self):
+        matrix = self.build(2)
+        scores = matrix.scores(min_count=2)
+        pairs = sorted(sorted((matrix.terms[a], matrix.terms[b])) for a, b in zip(scores['a'], scores['b']))
+        self.assertEqual(pairs, [['basil', 'tomato'], ['olive oil', 'tomato']])
+        # 2 of 4 recipes share each pair, tomato is in 3, basil and olive oil in 2
+        self.assertTrue(all(abs(lift - 2 * 4 / (3 * 2)) < 1e-9 for lift in scores['lift']))
+        self.assertTrue(all(abs(pmi - math.log(4 / 3)) < 1e-9 for pmi in scores['pmi']))
+        self.assertTrue(all(abs(npmi - math.log(4 / 3) / math.log(2)) < 1e-9 for npmi in scores['npmi']))
+        self.assertEqual(matrix.pairings('chicken thigh', min_count=1), [('olive oil', 1, 2.0), ('tomato', 1, 1.333)])
+        self.assertEqual(matrix.pairings('chicken stock', min_count=1), [('rice', 1, 4.0)])
+        self.assertEqual(matrix.pairings('chicken thigh', limit=1, min_count=1), [('olive oil', 1, 2.0)])
+        self.assertEqual(matrix.pairings('saffron'), [])
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, 'pairs.jsonl')
+            matrix.write(output_file, min_count=1)
+            with open(output_file) as f:
+                written = [json.loads(line) for line in f]
+        self.assertEqual(len(written), 8)
+        self.assertEqual(written[-1]['count'], 1)
+        self.assertEqual({written[0]['a'], written[0]['b']}, {'rice', 'chicken stock'})
+        self.assertEqual(written[0]['lift'], 4.0)
+
+
+if __name__ == '__main__':
+    run_tests()
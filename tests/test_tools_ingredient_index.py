@@ -0,0 +1,99 @@
+import os
+import json
+import tempfile
+from unittest import TestCase, main as run_tests
+
+from recipe_scraper.tools.ingredient_index import IngredientIndex, ingredient_terms, encode_postings, \
+    decode_postings
+
+
+class _FileLoader:
+    """DataLoader over the data files of a test directory"""
+
+    verbose = False
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @property
+    def files(self):
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory)]
+
+    @staticmethod
+    def load_file(_file):
+        with open(_file, 'r') as f:
+            return json.loads('[' + f.read()[1:] + ']')
+
+
+def _recipe(url, ingredients, ratings=None):
+    return {'url': url, 'title': url.rsplit('/', 1)[-1], 'ingredients': ingredients,
+            'reviews': {'ratings': {'count': ratings}}}
+
+
+class TestIngredientIndex(TestCase):
+
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.data_directory = os.path.join(self.temp.name, 'data')
+        os.makedirs(self.data_directory)
+        self.index = IngredientIndex(os.path.join(self.temp.name, 'index'), verbose=False)
+        self.append('2017_01_01_1.txt', [
+            _recipe('http://a.com/garlic-chicken', ['2 chicken breasts', '4 cloves garlic, minced'], '1,204'),
+            _recipe('http://a.com/creamy-chicken', ['1 lb chicken thighs', '1 cup heavy cream', '1 shallot'], '50'),
+            _recipe('http://a.com/tomato-soup', ['3 tomatoes', '1 clove garlic'], None),
+        ])
+        self.index.update(_FileLoader(self.data_directory))
+
+    def tearDown(self):
+        self.index.close()
+        self.temp.cleanup()
+
+    def append(self, name, recipes):
+        with open(os.path.join(self.data_directory, name), 'a') as f:
+            for recipe in recipes:
+                f.write(',' + json.dumps(recipe))
+
+    def titles(self, results):
+        return [result['title'] for result in results]
+
+    def test_ingredient_terms(self):
+        self.assertEqual(ingredient_terms('2 Tablespoons chopped Tomatoes, 1 cup berries'), ['tomato', 'berry'])
+        self.assertEqual(ingredient_terms('1 lb. Swiss cheese'), ['swiss', 'cheese'])
+
+    def test_postings_round_trip(self):
+        ids = [0, 1, 127, 128, 300, 70000, 2 ** 31]
+        self.assertEqual(decode_postings(encode_postings(ids)), ids)
+        self.assertEqual(len(encode_postings([0, 1, 2])), 3)
+
+    def test_and_or_not_ranked_by_rating_count(self):
+        self.assertEqual(self.titles(self.index.query('chicken')), ['garlic-chicken', 'creamy-chicken'])
+        self.assertEqual(self.titles(self.index.query('chicken, -heavy cream')), ['garlic-chicken'])
+        self.assertEqual(self.titles(self.index.query('garlic|shallot, chicken')), ['garlic-chicken', 'creamy-chicken'])
+        self.assertEqual(self.titles(self.index.search(['garlic'])), ['garlic-chicken', 'tomato-soup'])
+        self.assertEqual(self.index.query('chicken, tomato'), [])
+        self.assertEqual(self.index.query('-garlic'), [])
+
+    def test_incremental_update(self):
+        self.append('2017_01_01_1.txt', [_recipe('http://a.com/chicken-tacos', ['1 lb chicken'], '5000')])
+        self.append('2017_01_02_1.txt', [_recipe('http://b.com/garlic-bread', ['1 head garlic'], '7')])
+        self.assertEqual(self.index.update(_FileLoader(self.data_directory)), 2)
+        self.assertEqual(self.index.update(_FileLoader(self.data_directory)), 0)
+        self.assertEqual(self.titles(self.index.query('chicken', limit=1)), ['chicken-tacos'])
+        self.assertEqual(self.index.postings('garlic'), [0, 2, 4])
+        self.assertEqual(len(self.index.manifest['segments']), 2)
+        self.index.compact()
+        self.assertEqual(len(self.index.manifest['segments']), 1)
+        reopened = IngredientIndex(self.index.directory, verbose=False)
+        self.assertEqual(reopened.postings('garlic'), [0, 2, 4])
+        self.assertEqual(reopened.postings('chicken'), [0, 1, 3])
+        self.assertEqual(reopened.postings('head'), [4])  # only in the second segment
+        self.assertEqual(reopened.frequency('chicken'), 3)
+        segment_files = sorted(name for name in os.listdir(self.index.directory) if name.startswith('segment_'))
+        self.assertEqual(segment_files, [name + extension for name in reopened.manifest['segments']
+                                         for extension in ('.lexicon.json', '.postings')])
+        self.assertEqual(reopened.document(3)['url'], 'http://a.com/chicken-tacos')
+        reopened.close()
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -1,5 +1,7 @@
 from unittest import TestCase, main as run_tests
 
+from recipe_scraper.tools.log_inspector import LogInspector
+
 
 class TestLogInspector(TestCase):
 
@@ -7,7 +9,20 @@ class TestLogInspector(TestCase):
         pass
 
     def test_find_max_ids(self):
-        pass
+        text = '\n'.join([
+            'INFO| recipe_scraper| successful response: id: http://allrecipes.com/recipe/6670, final: http://...',
+            'INFO| recipe_scraper| successful response: id: http://allrecipes.com/recipe/6700, final: http://...',
+        ])
+        self.assertEqual(LogInspector.find_largest_ids(text), {'allrecipes': 6701})
+
+    def test_find_max_ids_from_fetch_log(self):
+        records = [
+            {'site': 'allrecipes', 'url': 'http://allrecipes.com/recipe/6670', 'status': 200},
+            {'site': 'allrecipes', 'url': 'http://allrecipes.com/recipe/6800', 'status': 404},
+            {'site': 'epicurious', 'url': 'http://www.epicurious.com/recipes/food/views/4100/', 'status': 200},
+            {'site': 'food', 'url': 'http://www.food.com/recipe/tea-202502', 'status': 200},
+        ]
+        self.assertEqual(LogInspector.find_largest_ids_from_fetch_log(records), {'allrecipes': 6671, 'epicurious': 4101})
 
     def test_statistics(self):
         pass
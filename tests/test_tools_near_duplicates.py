@@ -0,0 +1,66 @@
+import os
+import json
+import tempfile
+from unittest import TestCase, skipIf, main as run_tests
+
+from recipe_scraper.tools.near_duplicates import NearDuplicateFinder, token_stream, numpy
+
+INGREDIENTS = ['2 cups all-purpose flour', '1 teaspoon baking soda', '1/2 cup white sugar', '2 large eggs',
+               '1 cup buttermilk', '4 tablespoons melted butter']
+INSTRUCTIONS = ['Preheat the oven to 400 degrees F and grease a loaf pan.',
+                'Whisk the flour, baking soda and sugar together in a large bowl.',
+                'Beat in the eggs, buttermilk and butter until just combined, then bake for 25 minutes.']
+
+
+def _recipe(url, ingredients=INGREDIENTS, instructions=INSTRUCTIONS):
+    return {'url': url, 'title': url, 'ingredients': ingredients, 'instructions': instructions}
+
+
+class TestNearDuplicates(TestCase):
+
+    def test_token_stream_pads_lines(self):
+        stream, words = token_stream({'ingredients': ['Salt', '1 cup, water'], 'instructions': []}, shingle_size=3)
+        self.assertEqual(words, 4)
+        self.assertEqual(stream[1:3], [0, 0])
+        self.assertEqual(len(stream), 8)
+        self.assertEqual(token_stream({'ingredients': ['SALT']}, 3)[0][0], stream[0])
+
+    @skipIf(numpy is None, "numpy not installed")
+    def test_clusters_near_duplicates_only(self):
+        recipes = [
+            _recipe('http://a.com/bread'),
+            _recipe('http://b.com/other', ['1 pound ground beef', '1 onion, diced'],
+                    ['Brown the beef with the onion.']),
+            _recipe('http://c.com/bread-copy', INGREDIENTS[:-1] + ['4 tablespoons melted margarine']),
+            _recipe('http://d.com/bread-spaced', [' '.join(line.upper().split()) + ' ' for line in INGREDIENTS]),
+        ]
+        finder = NearDuplicateFinder(threshold=0.7, verbose=False)
+        clusters = finder.find([recipes[:2], None, recipes[2:]])
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual([index for index, _ in clusters[0]], [0, 2, 3])
+        self.assertEqual(clusters[0][0][1], 1.0)
+        self.assertEqual(clusters[0][2][1], 1.0)  # case and whitespace do not matter
+        self.assertGreaterEqual(clusters[0][1][1], 0.7)
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, 'clusters.jsonl')
+            finder.write(output_file, clusters)
+            with open(output_file) as f:
+                written = [json.loads(line) for line in f]
+            self.assertEqual(written[0]['size'], 3)
+            self.assertEqual(written[0]['recipes'][1]['url'], 'http://c.com/bread-copy')
+
+    @skipIf(numpy is None, "numpy not installed")
+    def test_signatures_do_not_depend_on_chunking(self):
+        recipes = [_recipe('http://a.com/{0}'.format(i), INGREDIENTS[i:]) for i in range(5)]
+        whole = NearDuplicateFinder(verbose=False)
+        for recipe in recipes:
+            whole.add(recipe)
+        chunked = NearDuplicateFinder(verbose=False)
+        for recipe in recipes:
+            chunked.add(recipe)
+            chunked._sign_pending()
+        self.assertTrue((whole.signatures == chunked.signatures).all())
+
+
+if __name__ == '__main__':
+    run_tests()
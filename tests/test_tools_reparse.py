@@ -0,0 +1,93 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from recipe_scraper import settings
+from recipe_scraper.async_scraper import DataFileManager
+from recipe_scraper.page_archive import PageArchive
+from recipe_scraper.tools.reparse import BulkReparser
+
+PAGE = ('<html><head><script type="application/ld+json">' + json.dumps({
+    '@type': 'Recipe',
+    'name': 'Iced Tea',
+    'recipeIngredient': ['2 cups water', '1 tea bag'],
+    'recipeInstructions': ['Brew the tea.', 'Chill.'],
+}) + '</script></head><body><h1>Iced Tea</h1></body></html>').encode('utf-8')
+
+
+class TestSiteFor(unittest.TestCase):
+
+    def setUp(self):
+        # the reparser's default data file manager resolves the data directory, keep it out of the environment
+        self.directory = tempfile.mkdtemp(prefix='reparse_test_')
+        self.data_path = mock.patch.object(settings, '_data_path', self.directory)
+        self.data_path.start()
+        self.reparser = BulkReparser({'food': 'jsonld', 'foodnetwork': 'hrecipe', 'bbc.co.uk': 'jsonld',
+                                      'chow': 'hrecipe'}, processes=1, verbose=False)
+
+    def tearDown(self):
+        self.data_path.stop()
+        shutil.rmtree(self.directory)
+
+    def test_whole_host_labels_are_matched(self):
+        self.assertEqual(self.reparser.site_for('http://www.foodnetwork.com/recipes/1'), 'foodnetwork')
+        self.assertEqual(self.reparser.site_for('https://food.com/recipe/1'), 'food')
+        self.assertEqual(self.reparser.site_for('http://www.chowhound.com/recipes/1'), None)
+
+    def test_registered_domain_keys(self):
+        self.assertEqual(self.reparser.site_for('http://www.bbc.co.uk/food/recipes/tea'), 'bbc.co.uk')
+        self.assertEqual(self.reparser.site_for('http://notbbc.co.uk/food/recipes/tea'), None)
+
+    def test_longest_key_wins(self):
+        reparser = BulkReparser({'food': 'jsonld', 'food.com': 'hrecipe'}, processes=1, verbose=False)
+        self.assertEqual(reparser.site_for('http://www.food.com/recipe/1'), 'food.com')
+
+    def test_paths_and_default(self):
+        self.assertEqual(self.reparser.site_for('pages/foodnetwork/1.html'), 'foodnetwork')
+        self.assertEqual(self.reparser.site_for('pages\\chow\\1.html'), 'chow')
+        self.assertEqual(self.reparser.site_for('pages/other/1.html'), None)
+        reparser = BulkReparser({'food': 'jsonld', 'default': 'hrecipe'}, processes=1, verbose=False)
+        self.assertEqual(reparser.site_for('http://www.epicurious.com/recipes/1'), 'default')
+
+
+class TestBulkReparser(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='reparse_test_')
+        self.archive_directory = os.path.join(self.directory, 'archive')
+        self.output_directory = os.path.join(self.directory, 'data')
+        os.makedirs(self.output_directory)
+        self.data_path = mock.patch.object(settings, '_data_path', self.directory)
+        self.data_path.start()
+
+    def tearDown(self):
+        self.data_path.stop()
+        shutil.rmtree(self.directory)
+
+    def test_archived_pages_are_reparsed(self):
+        archive = PageArchive(self.archive_directory)
+        archive.store('http://food.com/recipe/1', 'http://www.food.com/recipe/1', 200, PAGE)
+        archive.store('http://foodnetwork.com/recipes/2', 'http://www.foodnetwork.com/recipes/2', 200,
+                      b'<html><body>no recipe here</body></html>')
+        archive.store('http://other.com/3', 'http://other.com/3', 200, PAGE)
+        archive.close()
+        reparser = BulkReparser({'food': 'jsonld', 'foodnetwork': 'hrecipe'}, processes=1, verbose=False,
+                                data_file_manager=DataFileManager(data_folder=self.output_directory))
+        stats = reparser.run(self.archive_directory)
+        self.assertEqual(stats['jsonld'], dict(stats['jsonld'], pages=1, recipes=1))
+        self.assertEqual(stats['hrecipe'], dict(stats['hrecipe'], pages=1, recipes=0))
+        self.assertEqual(reparser.skipped, 1)
+        data_files = os.listdir(self.output_directory)
+        self.assertEqual(len(data_files), 1)
+        with open(os.path.join(self.output_directory, data_files[0])) as f:
+            recipes = json.loads('[' + f.read()[1:] + ']')
+        self.assertEqual(len(recipes), 1)
+        self.assertEqual(recipes[0]['url'], 'http://www.food.com/recipe/1')
+        self.assertEqual(recipes[0]['title'], 'Iced Tea')
+        self.assertEqual(recipes[0]['ingredients'], ['2 cups water', '1 tea bag'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import pkgutil
+import tempfile
+import unittest
+from recipe_scraper.tools import user_agent
+from recipe_scraper.tools.user_agent import USER_AGENT_FILE, get_agent, load_agents, reset_agent
+
+
+class TestUserAgent(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.agent_file = os.path.join(self.directory.name, 'agents.txt')
+        with open(self.agent_file, 'w') as f:
+            f.write(''.join('agent {0}\n\n'.format(i) for i in range(10)))
+        load_agents(self.agent_file)
+
+    def tearDown(self):
+        reset_agent('food.com')
+        reset_agent('allrecipes.com')
+        load_agents()
+        self.directory.cleanup()
+
+    def test_agent_is_sticky_per_domain(self):
+        agent = get_agent('food.com')
+        self.assertIn(agent, user_agent._agents)
+        self.assertEqual({get_agent('food.com') for _ in range(50)}, {agent})
+        other = get_agent('allrecipes.com')
+        self.assertEqual({get_agent('allrecipes.com') for _ in range(50)}, {other})
+        self.assertEqual(get_agent('food.com'), agent)  # another domain's session does not change it
+
+    def test_random_agent_without_domain(self):
+        self.assertGreater(len({get_agent() for _ in range(200)}), 1)
+
+    def test_reset_starts_a_new_session(self):
+        get_agent('food.com')
+        reset_agent('food.com')
+        self.assertNotIn('food.com', user_agent._session_agents)
+        agent = get_agent('food.com')
+        self.assertEqual(get_agent('food.com'), agent)
+
+    def test_blank_lines_are_skipped(self):
+        self.assertEqual(user_agent._agents, tuple('agent {0}'.format(i) for i in range(10)))
+
+
+class TestPackagedAgents(unittest.TestCase):
+
+    def tearDown(self):
+        load_agents()
+
+    def test_agents_load_from_the_package(self):
+        # the pool ships as package data next to the module, not relative to the working directory
+        self.assertEqual(os.path.dirname(USER_AGENT_FILE), os.path.dirname(os.path.abspath(user_agent.__file__)))
+        packaged = pkgutil.get_data('recipe_scraper.tools', 'user_agents.txt').decode('utf-8')
+        expected = tuple(line.strip() for line in packaged.splitlines() if line.strip())
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                agents = load_agents()
+            finally:
+                os.chdir(cwd)
+        self.assertTrue(agents)
+        self.assertEqual(agents, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict
+from unittest import mock
+from recipe_scraper import async_scraper, settings, urls
+from recipe_scraper.async_scraper import AsyncScraper
+from recipe_scraper.urls import UrlCanonicalizer, RedirectMap, canonical_url, site_from_url
+
+
+class TestCanonicalUrl(unittest.TestCase):
+
+    def test_default_normalization(self):
+        self.assertEqual(canonical_url('HTTP://WWW.Food.com:80/Recipe/Tea-2/#reviews'), 'http://www.food.com/Recipe/Tea-2')
+        self.assertEqual(canonical_url('https://food.com'), 'https://food.com/')
+
+    def test_query_is_sorted_without_tracking_parameters(self):
+        self.assertEqual(canonical_url('http://food.com/r?b=2&utm_source=x&a=1&fbclid=y'), 'http://food.com/r?a=1&b=2')
+
+    def test_site_rules(self):
+        urls.SITE_CANONICALIZERS['example.com'] = UrlCanonicalizer(
+            scheme='https', host='www.example.com', keep_query=('page',), trailing_slash=True)
+        try:
+            self.assertEqual(canonical_url('http://example.com/recipes?page=2&sort=new'),
+                             'https://www.example.com/recipes/?page=2')
+            self.assertEqual(canonical_url('http://food.com/recipes/'), 'http://food.com/recipes')
+        finally:
+            del urls.SITE_CANONICALIZERS['example.com']
+
+    def test_site_from_url(self):
+        self.assertEqual(site_from_url('https://www.Food.com:443/recipe/1'), 'food.com')
+        self.assertEqual(site_from_url('www.food.com/recipe/1'), 'food.com')
+        self.assertIsNone(site_from_url(None))
+
+
+class TestRedirectMap(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.directory, 'redirects.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_resolve_persists_across_instances(self):
+        redirects = RedirectMap(self.file_name)
+        redirects.add('http://allrecipes.com/recipe/6663/', 'http://allrecipes.com/recipe/6663/tea')
+        redirects.add('http://allrecipes.com/recipe/7000', 'http://allrecipes.com/recipe/7000')  # no redirect
+        redirects.close()
+        redirects = RedirectMap(self.file_name)
+        self.assertEqual(redirects.resolve('http://allrecipes.com/recipe/6663'), 'http://allrecipes.com/recipe/6663/tea')
+        self.assertEqual(redirects.resolve('http://allrecipes.com/recipe/7000'), 'http://allrecipes.com/recipe/7000')
+        self.assertNotIn('http://allrecipes.com/recipe/7000', redirects)
+
+    def test_forget(self):
+        redirects = RedirectMap(self.file_name)
+        redirects.add('http://food.com/1', 'http://food.com/1/tea')
+        redirects.forget('http://food.com/1')
+        redirects.close()
+        self.assertNotIn('http://food.com/1', RedirectMap(self.file_name))
+
+
+class TestFetchedUrls(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.patches = [mock.patch.object(settings, '_data_path', self.directory),
+                        mock.patch.object(AsyncScraper, 'fetched_urls', OrderedDict()),
+                        mock.patch.object(async_scraper, 'FETCHED_URLS_MEMORY_SIZE', 3)]
+        for patch in self.patches:
+            patch.start()
+        self.scraper = AsyncScraper(base_path=['food.com/recipe'], start_id=1,
+                                    url_id_format='http://food.com/recipe/{0}', site='food.com')
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.directory)
+
+    def test_requested_and_final_urls_are_remembered(self):
+        self.scraper._remember_fetched('http://food.com/recipe/1', 'http://food.com/recipe/1/tea')
+        self.assertTrue(self.scraper._was_fetched('http://FOOD.com/recipe/1/'))
+        self.assertTrue(self.scraper._was_fetched('http://food.com/recipe/1/tea'))
+        self.assertFalse(self.scraper._was_fetched('http://food.com/recipe/2'))
+
+    def test_least_recently_seen_urls_are_forgotten(self):
+        self.scraper._remember_fetched('http://food.com/recipe/1', 'http://food.com/recipe/2')
+        self.scraper._remember_fetched('http://food.com/recipe/3')
+        self.assertTrue(self.scraper._was_fetched('http://food.com/recipe/1'))
+        self.scraper._remember_fetched('http://food.com/recipe/4')
+        self.assertEqual(len(AsyncScraper.fetched_urls), 3)
+        self.assertFalse(self.scraper._was_fetched('http://food.com/recipe/2'))
+        self.assertTrue(self.scraper._was_fetched('http://food.com/recipe/1'))
+        self.assertTrue(self.scraper._was_fetched('http://food.com/recipe/4'))